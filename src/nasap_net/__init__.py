@@ -11,6 +11,10 @@ Refer to the documentation for full details.
 
 # isort: skip_file
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# The models are light and imported eagerly.
 from nasap_net.exceptions import NasapNetError
 
 from nasap_net.models import BindingSite
@@ -21,25 +25,71 @@ from nasap_net.models import Assembly
 from nasap_net.models import Reaction
 from nasap_net.models import MLEKind
 
-from nasap_net.helpers import assign_composition_formula_ids
+# The other subpackages depend on igraph, pandas, PyYAML, etc., and are
+# imported on first access, so that `import nasap_net` stays fast.
+_LAZY_ATTRS = {
+    'assign_composition_formula_ids': 'nasap_net.helpers',
+
+    'enumerate_assemblies': 'nasap_net.assembly_enumeration',
+    'SymmetryOperations': 'nasap_net.assembly_enumeration',
+    'enumerate_assemblies_capped_with_assembly':
+        'nasap_net.assembly_enumeration',
+
+    'enumerate_reactions': 'nasap_net.reaction_enumeration',
+
+    'extract_unique_assemblies': 'nasap_net.assembly_equivalence',
+    'assemblies_equivalent': 'nasap_net.assembly_equivalence',
+
+    'reactions_equivalent': 'nasap_net.reaction_equivalence',
+    'compute_reaction_list_diff': 'nasap_net.reaction_equivalence',
+
+    'classify_reactions': 'nasap_net.reaction_classification',
+    'IncompleteReactionClassifierError': 'nasap_net.reaction_classification',
+
+    'load_assemblies': 'nasap_net.io',
+    'load_reactions': 'nasap_net.io',
+    'save_assemblies': 'nasap_net.io',
+    'save_reactions': 'nasap_net.io',
+    'save_classification_result': 'nasap_net.io',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+if TYPE_CHECKING:
+    from nasap_net.helpers import assign_composition_formula_ids
 
-from nasap_net.assembly_enumeration import enumerate_assemblies
-from nasap_net.assembly_enumeration import SymmetryOperations
-from nasap_net.assembly_enumeration import enumerate_assemblies_capped_with_assembly
+    from nasap_net.assembly_enumeration import enumerate_assemblies
+    from nasap_net.assembly_enumeration import SymmetryOperations
+    from nasap_net.assembly_enumeration import \
+        enumerate_assemblies_capped_with_assembly
 
-from nasap_net.reaction_enumeration import enumerate_reactions
+    from nasap_net.reaction_enumeration import enumerate_reactions
 
-from nasap_net.assembly_equivalence import extract_unique_assemblies
-from nasap_net.assembly_equivalence import assemblies_equivalent
+    from nasap_net.assembly_equivalence import extract_unique_assemblies
+    from nasap_net.assembly_equivalence import assemblies_equivalent
 
-from nasap_net.reaction_equivalence import reactions_equivalent
-from nasap_net.reaction_equivalence import compute_reaction_list_diff
+    from nasap_net.reaction_equivalence import reactions_equivalent
+    from nasap_net.reaction_equivalence import compute_reaction_list_diff
 
-from nasap_net.reaction_classification import classify_reactions
-from nasap_net.reaction_classification import IncompleteReactionClassifierError
+    from nasap_net.reaction_classification import classify_reactions
+    from nasap_net.reaction_classification import \
+        IncompleteReactionClassifierError
 
-from nasap_net.io import load_assemblies
-from nasap_net.io import load_reactions
-from nasap_net.io import save_assemblies
-from nasap_net.io import save_reactions
-from nasap_net.io import save_classification_result
+    from nasap_net.io import load_assemblies
+    from nasap_net.io import load_reactions
+    from nasap_net.io import save_assemblies
+    from nasap_net.io import save_reactions
+    from nasap_net.io import save_classification_result
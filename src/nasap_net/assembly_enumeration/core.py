@@ -4,10 +4,12 @@ from typing import Any
 
 from nasap_net.assembly_equivalence import \
     extract_unique_assemblies
+from nasap_net.helpers import assign_composition_formula_ids
 from nasap_net.models import Assembly, Component
+from nasap_net.progress import DEFAULT_PROGRESS_INTERVAL, \
+    ProgressCallback
 from nasap_net.types import ID
 from .lib import cap_assemblies_with_ligand, enumerate_fragments
-from .. import assign_composition_formula_ids
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -21,6 +23,8 @@ def enumerate_assemblies(
         metal_kinds: Iterable[str],
         symmetry_operations: Iterable[Mapping[Any, ID]] | None = None,
         comp_kind_order_in_formula: Sequence[str] | None = None,
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
 ) -> list[Assembly]:
     """Enumerate assemblies which can be formed by adding the leaving ligand
     to the fragments of the template assembly.
@@ -60,6 +64,13 @@ def enumerate_assemblies(
         The order of component kinds to use when assigning composition formula
         IDs to the assemblies. If None, the kinds will be sorted alphabetically.
         Default is None.
+    progress_callback : ProgressCallback | None, optional
+        Called with the progress of the fragment enumeration, which is
+        the most time-consuming step (see `enumerate_fragments`).
+        Default is None.
+    progress_interval : float, optional
+        The minimum interval between progress reports in seconds.
+        Default is 1.0.
 
     Returns
     -------
@@ -72,6 +83,8 @@ def enumerate_assemblies(
     fragments = enumerate_fragments(
         template,
         symmetry_operations=symmetry_operations,
+        progress_callback=progress_callback,
+        progress_interval=progress_interval,
     )
     logger.info('Removing symmetry-equivalent and isomorphic duplicates...')
     unique_fragments = extract_unique_assemblies(
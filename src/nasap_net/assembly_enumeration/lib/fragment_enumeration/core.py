@@ -4,6 +4,8 @@ from collections.abc import Hashable, Iterable, Mapping
 from typing import Any
 
 from nasap_net.models import Assembly
+from nasap_net.progress import DEFAULT_PROGRESS_INTERVAL, \
+    ProgressCallback, ProgressReporter
 from nasap_net.types import ID
 from .lib import enumerate_one_step_grown_fragments, get_key, \
     get_unique_starting_fragments, is_new, validate_symmetry_operation
@@ -16,8 +18,19 @@ logger.addHandler(logging.NullHandler())
 
 def enumerate_fragments(
         template: Assembly,
-        symmetry_operations: Iterable[Mapping[Any, ID]] | None = None
+        symmetry_operations: Iterable[Mapping[Any, ID]] | None = None,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
 ) -> set[Assembly]:
+    """Enumerate the fragments of the template assembly.
+
+    `progress_callback` is called with a `Progress` of the task
+    ``'enumerate_fragments'`` at most once per `progress_interval` seconds,
+    and when the enumeration finishes. The units are the grown fragments;
+    the total is unknown in advance. The counts map the number of
+    components to the number of fragments found with that many components.
+    """
     template_fragment = create_complete_fragment(template)
     if symmetry_operations is not None:
         for sym_op in symmetry_operations:
@@ -30,6 +43,15 @@ def enumerate_fragments(
     )
     for frag in starting_fragments:
         found[get_key(frag)].add(frag)
+    num_found = len(starting_fragments)
+
+    reporter = None
+    if progress_callback is not None:
+        reporter = ProgressReporter(
+            progress_callback, 'enumerate_fragments',
+            interval=progress_interval)
+        for frag in starting_fragments:
+            _count_level(reporter, frag)
     queue = deque(sorted(starting_fragments))
     logger.debug(
         'Starting fragment enumeration from %d single-component fragment(s).',
@@ -43,14 +65,25 @@ def enumerate_fragments(
             if is_new(frag, found, symmetry_operations):
                 found[get_key(frag)].add(frag)
                 queue.append(frag)
+                num_found += 1
+                if reporter is not None:
+                    _count_level(reporter, frag)
         logger.debug(
             'Growing %d-component fragment(s). %d fragment(s) found so far.',
-            len(cur_frag.components),
-            sum(len(s) for s in found.values()),
+            len(cur_frag.components), num_found,
         )
+        if reporter is not None:
+            reporter.advance()
+    if reporter is not None:
+        reporter.finish()
 
     result: set[Assembly] = set()
     for frags in found.values():
         result.update(frag.to_assembly() for frag in frags)
     logger.debug('Fragment enumeration complete. %d fragment(s) found.', len(result))
     return result
+
+
+def _count_level(reporter: ProgressReporter, frag: Fragment) -> None:
+    level = len(frag.components)
+    reporter.counts[level] = reporter.counts.get(level, 0) + 1
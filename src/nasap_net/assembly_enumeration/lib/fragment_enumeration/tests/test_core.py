@@ -83,3 +83,16 @@ def test_M9L6(M9L6, M9L6_symmetry_operations):
         list(M9L6_symmetry_operations.values())
     )
     assert len(frags) == 1480
+
+
+def test_progress_callback(MX2):
+    progresses = []
+    frags = enumerate_fragments(
+        MX2, progress_callback=progresses.append, progress_interval=0)
+    last = progresses[-1]
+    assert last.task == 'enumerate_fragments'
+    assert last.finished and last.total is None
+    # Every fragment is grown once.
+    assert last.done == len(frags)
+    assert last.counts == {1: 3, 2: 2, 3: 1}
+    assert [p.done for p in progresses[:-1]] == list(range(1, len(frags) + 1))
@@ -1,3 +1,7 @@
 from .core import assemblies_equivalent
-from .search import AssemblyNotFoundError, EquivalentAssemblyFinder
+from .hash_index import AssemblyHashIndex, IndexedAssemblyFinder, \
+    build_assembly_hash_index, get_assembly_signature_hash
+from .search import AssemblyFinder, AssemblyNotFoundError, \
+    EquivalentAssemblyFinder
 from .unique import extract_unique_assemblies
+from .wl_hash import get_wl_hash
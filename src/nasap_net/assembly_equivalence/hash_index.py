@@ -0,0 +1,231 @@
+"""Persistent index from assembly signature hashes to assemblies.
+
+The index is an SQLite database built once for an assembly space
+(e.g., an assembly file) and opened read-only by any number of resolvers,
+worker processes and later runs, instead of recomputing the signatures
+of the whole space each time an `EquivalentAssemblyFinder` is created.
+"""
+import hashlib
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, Self
+
+from nasap_net.isomorphism import find_isomorphic_among
+from nasap_net.models import Assembly
+from nasap_net.types import ID
+from .search import AssemblyNotFoundError
+from .signature import get_refined_assembly_signature
+
+FORMAT_NAME = 'nasap-net-assembly-hash-index'
+
+# Must be incremented whenever `get_refined_assembly_signature` changes,
+# so that indices built with the old signature are rejected.
+SIGNATURE_VERSION = 3
+
+
+def get_assembly_signature_hash(assembly: Assembly) -> str:
+    """Return a stable hash of the signature of the assembly.
+
+    Unlike the built-in `hash`, the result does not change between
+    processes, so that it can be persisted.
+
+    Assemblies with different hashes are guaranteed to be non-isomorphic.
+    """
+    signature = get_refined_assembly_signature(assembly)
+    return hashlib.blake2b(
+        repr(signature).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def build_assembly_hash_index(
+        assemblies: Iterable[Assembly],
+        db_path: os.PathLike | str,
+        *,
+        overwrite: bool = False,
+) -> None:
+    """Build a signature hash index of an assembly space.
+
+    Parameters
+    ----------
+    assemblies : Iterable[Assembly]
+        The assembly space. The position of each assembly in the iterable
+        is recorded, so that candidates can be fetched from any sequence
+        with the same order, e.g., the list returned by `load_assemblies`
+        or an `AssemblySpaceFile`.
+    db_path : os.PathLike | str
+        Path to the SQLite database to write.
+    overwrite : bool, optional
+        If True, overwrite the database if it already exists.
+        If False, raise an error if the database already exists.
+        Default is False.
+    """
+    db_path = Path(db_path)
+    if db_path.exists():
+        if not overwrite:
+            raise FileExistsError(
+                f'File "{str(db_path)}" already exists. '
+                'Use `overwrite=True` to overwrite it.'
+            )
+        db_path.unlink()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                'CREATE TABLE meta (key TEXT PRIMARY KEY, value NOT NULL)')
+            # No type affinity for assembly_id, so that int and str IDs
+            # are stored as they are.
+            conn.execute(
+                'CREATE TABLE assemblies ('
+                'position INTEGER PRIMARY KEY, '
+                'hash TEXT NOT NULL, '
+                'assembly_id)')
+            conn.executemany(
+                'INSERT INTO assemblies VALUES (?, ?, ?)',
+                (
+                    (i, get_assembly_signature_hash(assembly),
+                     assembly.id_or_none)
+                    for i, assembly in enumerate(assemblies)
+                ))
+            conn.execute(
+                'CREATE INDEX assemblies_hash ON assemblies (hash)')
+            conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+                ('format', FORMAT_NAME),
+                ('signature_version', SIGNATURE_VERSION),
+            ])
+    finally:
+        conn.close()
+
+
+class AssemblyHashIndex:
+    """Read-only view of an index built by `build_assembly_hash_index`.
+
+    Instances can be pickled (e.g., sent to worker processes); the database
+    is reopened on unpickling.
+    """
+    def __init__(self, db_path: os.PathLike | str):
+        """
+        Raises
+        ------
+        FileNotFoundError
+            If the database does not exist.
+        ValueError
+            If the database is not an assembly hash index, or if it was
+            built with a different version of the assembly signature.
+        """
+        self._db_path = Path(db_path)
+        if not self._db_path.exists():
+            raise FileNotFoundError(
+                f'File "{str(self._db_path)}" does not exist.')
+        self._conn = sqlite3.connect(
+            self._db_path.resolve().as_uri() + '?mode=ro', uri=True,
+            check_same_thread=False)
+        self._validate()
+
+    def _validate(self) -> None:
+        try:
+            meta = dict(self._conn.execute('SELECT key, value FROM meta'))
+        except sqlite3.DatabaseError as e:
+            raise ValueError(
+                f'"{str(self._db_path)}" is not an assembly hash index.'
+            ) from e
+        if meta.get('format') != FORMAT_NAME:
+            raise ValueError(
+                f'"{str(self._db_path)}" is not an assembly hash index.')
+        if meta.get('signature_version') != SIGNATURE_VERSION:
+            raise ValueError(
+                f'"{str(self._db_path)}" was built with signature version '
+                f'{meta.get("signature_version")}, but the current version '
+                f'is {SIGNATURE_VERSION}. Rebuild the index.')
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute(
+            'SELECT COUNT(*) FROM assemblies').fetchone()
+        return count
+
+    def lookup(self, signature_hash: str) -> list[tuple[int, ID | None]]:
+        """Return the positions and IDs of the assemblies with the hash."""
+        return self._conn.execute(
+            'SELECT position, assembly_id FROM assemblies '
+            'WHERE hash = ? ORDER BY position',
+            (signature_hash,)).fetchall()
+
+    def lookup_assembly(
+            self, assembly: Assembly) -> list[tuple[int, ID | None]]:
+        """Return the positions and IDs of the assemblies with the same
+        signature hash as the given assembly, i.e., the candidates for
+        isomorphic assemblies.
+        """
+        return self.lookup(get_assembly_signature_hash(assembly))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {'db_path': self._db_path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state['db_path'])  # type: ignore[misc]
+
+
+class IndexedAssemblyFinder:
+    """Find isomorphic assemblies using a persistent hash index.
+
+    Equivalent to `EquivalentAssemblyFinder`, except that the signatures of
+    the search space are read from the index instead of being computed,
+    and only the candidate assemblies are fetched from the search space.
+
+    Parameters
+    ----------
+    index : AssemblyHashIndex
+        The index built from `search_space`.
+    search_space : Sequence[Assembly]
+        The assemblies, in the same order as when the index was built.
+        It may be lazy, e.g., an `AssemblySpaceFile`.
+    """
+    def __init__(
+            self,
+            index: AssemblyHashIndex,
+            search_space: Sequence[Assembly],
+    ):
+        if len(index) != len(search_space):
+            raise ValueError(
+                'The index and the search space have different sizes.')
+        self._index = index
+        self._search_space = search_space
+        self._fetched: dict[int, Assembly] = {}
+
+    def find(self, target: Assembly) -> Assembly:
+        """Find an isomorphic assembly in the search space.
+
+        Raises
+        ------
+        AssemblyNotFoundError
+            If no isomorphic assembly is found in the search space.
+        """
+        match = find_isomorphic_among(target, (
+            self._fetch(position)
+            for position, _ in self._index.lookup_assembly(target)))
+        if match is None:
+            raise AssemblyNotFoundError(
+                f"No isomorphic assembly found for {target}")
+        return match
+
+    def _fetch(self, position: int) -> Assembly:
+        assembly = self._fetched.get(position)
+        if assembly is None:
+            assembly = self._search_space[position]
+            self._fetched[position] = assembly
+        return assembly
@@ -1,13 +1,16 @@
 from collections import defaultdict
-from collections.abc import Hashable, Iterable
+from collections.abc import Collection, Hashable, Iterable
 from dataclasses import dataclass, field
+from typing import Protocol
 
 from frozendict import frozendict
 
 from nasap_net.exceptions import NasapNetError
-from nasap_net.isomorphism import is_isomorphic
+from nasap_net.isomorphism import find_isomorphic_among
 from nasap_net.models import Assembly
+from nasap_net.profiling import profiled, record
 from .signature import get_assembly_signature
+from .wl_hash import get_wl_hash
 
 
 class AssemblyNotFoundError(NasapNetError):
@@ -15,6 +18,14 @@ class AssemblyNotFoundError(NasapNetError):
     pass
 
 
+class AssemblyFinder(Protocol):
+    """Protocol of classes finding isomorphic assemblies in a search space,
+    e.g., `EquivalentAssemblyFinder` and `IndexedAssemblyFinder`.
+    """
+    def find(self, target: Assembly) -> Assembly:
+        ...
+
+
 @dataclass(frozen=True, init=False)
 class EquivalentAssemblyFinder:
     """Class to find isomorphic assemblies in a search space.
@@ -26,6 +37,10 @@ class EquivalentAssemblyFinder:
     """
     search_space: frozenset[Assembly]
     _sig_to_assemblies: frozendict[Hashable, frozenset[Assembly]] = field(init=False)
+    # Buckets split by the WL hash, built on demand for signatures shared
+    # by more than one assembly.
+    _wl_buckets: dict[Hashable, dict[str, list[Assembly]]] = field(
+        init=False, repr=False, compare=False)
 
     def __init__(self, search_space: Iterable[Assembly]) -> None:
         object.__setattr__(self, 'search_space', frozenset(search_space))
@@ -36,7 +51,9 @@ class EquivalentAssemblyFinder:
         object.__setattr__(self, '_sig_to_assemblies', frozendict(
             {k: frozenset(v) for k, v in sig_to_assems.items()}
         ))
+        object.__setattr__(self, '_wl_buckets', {})
 
+    @profiled('EquivalentAssemblyFinder.find')
     def find(self, target: Assembly) -> Assembly:
         """Find an isomorphic assembly in the search space.
 
@@ -56,12 +73,27 @@ class EquivalentAssemblyFinder:
             If no isomorphic assembly is found in the search space.
         """
         sig = get_assembly_signature(target)
-        candidates = self._sig_to_assemblies.get(sig)
+        candidates: Collection[Assembly] | None = \
+            self._sig_to_assemblies.get(sig)
+        record('finder.signature_bucket_size', len(candidates or ()))
         if not candidates:
             raise AssemblyNotFoundError(
                 f"No isomorphic assembly found for {target}")
-        for candidate in candidates:
-            if is_isomorphic(target, candidate):
-                return candidate
-        raise AssemblyNotFoundError(
-            f"No isomorphic assembly found for {target}")
+        if len(candidates) > 1:
+            # Narrow down the candidates by the WL hash before running VF2.
+            candidates = self._get_wl_buckets(sig).get(
+                get_wl_hash(target), [])
+            record('finder.wl_bucket_size', len(candidates))
+        match = find_isomorphic_among(target, candidates)
+        if match is None:
+            raise AssemblyNotFoundError(
+                f"No isomorphic assembly found for {target}")
+        return match
+
+    def _get_wl_buckets(self, sig: Hashable) -> dict[str, list[Assembly]]:
+        if sig not in self._wl_buckets:
+            buckets: defaultdict[str, list[Assembly]] = defaultdict(list)
+            for assembly in self._sig_to_assemblies[sig]:
+                buckets[get_wl_hash(assembly)].append(assembly)
+            self._wl_buckets[sig] = dict(buckets)
+        return self._wl_buckets[sig]
@@ -1,6 +1,7 @@
 from typing import Hashable
 
 from nasap_net.models import Assembly
+from .wl_hash import get_wl_hash
 
 
 def get_assembly_signature(assembly: Assembly) -> Hashable:
@@ -35,3 +36,28 @@ def get_assembly_signature(assembly: Assembly) -> Hashable:
             for site1, site2 in assembly.bonds
         ))
     )
+
+
+def get_refined_assembly_signature(assembly: Assembly) -> Hashable:
+    """Compute a refined signature of the assembly for filtering.
+
+    The refined signature is the light signature (see
+    `get_assembly_signature`) followed by the Weisfeiler-Lehman hash of the
+    assembly (see `get_wl_hash`). It is more expensive to compute, but
+    assemblies of the same composition, which share the light signature,
+    usually have different refined signatures unless they are isomorphic.
+
+    Assemblies with different refined signatures are guaranteed to be
+    non-isomorphic.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        The assembly to compute the signature for.
+
+    Returns
+    -------
+    Hashable
+        The refined signature of the assembly.
+    """
+    return get_assembly_signature(assembly), get_wl_hash(assembly)
@@ -0,0 +1,127 @@
+import pickle
+import sqlite3
+
+import pytest
+
+from nasap_net.assembly_equivalence import AssemblyHashIndex, \
+    AssemblyNotFoundError, IndexedAssemblyFinder, build_assembly_hash_index, \
+    get_assembly_signature_hash
+from nasap_net.io import AssemblySpaceFile, save_assembly_space
+from nasap_net.models import Assembly, Bond, Component
+from nasap_net.reaction_enumeration.reaction_resolver import ReactionResolver
+
+
+@pytest.fixture
+def M():
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L():
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def MLX(M, L, X):
+    # X0(0)-(0)M0(1)-(0)L0(1)
+    return Assembly(
+        id_='MLX',
+        components={'X0': X, 'M0': M, 'L0': L},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'L0', 0)]
+    )
+
+@pytest.fixture
+def MX(M, X):
+    return Assembly(
+        id_=1,
+        components={'X0': X, 'M0': M},
+        bonds=[Bond('X0', 0, 'M0', 0)]
+    )
+
+@pytest.fixture
+def another_MLX(M, L, X):
+    return Assembly(
+        components={'X1': X, 'M1': M, 'L1': L},
+        bonds=[Bond('X1', 0, 'M1', 0), Bond('M1', 1, 'L1', 0)]
+    )
+
+@pytest.fixture
+def index_path(tmp_path, MLX, MX):
+    db_path = tmp_path / 'index.sqlite'
+    build_assembly_hash_index([MLX, MX], db_path)
+    return db_path
+
+
+def test_signature_hash(MLX, MX, another_MLX):
+    assert get_assembly_signature_hash(MLX) \
+        == get_assembly_signature_hash(another_MLX)
+    assert get_assembly_signature_hash(MLX) != get_assembly_signature_hash(MX)
+
+
+def test_lookup(index_path, MLX, MX, another_MLX):
+    with AssemblyHashIndex(index_path) as index:
+        assert len(index) == 2
+        assert index.lookup_assembly(another_MLX) == [(0, 'MLX')]
+        assert index.lookup_assembly(MX) == [(1, 1)]  # int ID preserved
+        assert index.lookup('0' * 32) == []
+
+
+def test_indexed_finder(index_path, MLX, MX, another_MLX, M):
+    index = AssemblyHashIndex(index_path)
+    finder = IndexedAssemblyFinder(index, [MLX, MX])
+    assert finder.find(another_MLX) == MLX
+    with pytest.raises(AssemblyNotFoundError):
+        finder.find(Assembly(components={'M0': M}, bonds=[]))
+
+
+def test_indexed_finder_with_assembly_space_file(
+        tmp_path, index_path, MLX, MX, another_MLX):
+    save_assembly_space([MLX, MX], tmp_path / 'space')
+    finder = IndexedAssemblyFinder(
+        AssemblyHashIndex(index_path), AssemblySpaceFile(tmp_path / 'space'))
+    assert finder.find(another_MLX) == MLX
+
+    resolver = ReactionResolver(finder=finder)
+    assert resolver.finder is finder
+
+
+def test_size_mismatch(index_path, MLX):
+    with pytest.raises(ValueError):
+        IndexedAssemblyFinder(AssemblyHashIndex(index_path), [MLX])
+
+
+def test_pickle(index_path, another_MLX):
+    index = pickle.loads(pickle.dumps(AssemblyHashIndex(index_path)))
+    assert index.lookup_assembly(another_MLX) == [(0, 'MLX')]
+
+
+def test_overwrite(index_path, MLX):
+    with pytest.raises(FileExistsError):
+        build_assembly_hash_index([MLX], index_path)
+    build_assembly_hash_index([MLX], index_path, overwrite=True)
+    assert len(AssemblyHashIndex(index_path)) == 1
+
+
+def test_stale_signature_version(index_path):
+    with sqlite3.connect(index_path) as conn:
+        conn.execute(
+            "UPDATE meta SET value = 0 WHERE key = 'signature_version'")
+    conn.close()
+    with pytest.raises(ValueError):
+        AssemblyHashIndex(index_path)
+
+
+def test_not_an_index(tmp_path):
+    db_path = tmp_path / 'other.sqlite'
+    sqlite3.connect(db_path).close()
+    with pytest.raises(ValueError):
+        AssemblyHashIndex(db_path)
+    with pytest.raises(FileNotFoundError):
+        AssemblyHashIndex(tmp_path / 'missing.sqlite')
+
+
+def test_resolver_arguments(MLX):
+    with pytest.raises(TypeError):
+        ReactionResolver()
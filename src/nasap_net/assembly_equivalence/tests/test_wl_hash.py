@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from nasap_net.assembly_equivalence import get_wl_hash
+from nasap_net.assembly_equivalence.signature import get_assembly_signature, \
+    get_refined_assembly_signature
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
+
+
+@pytest.fixture
+def M_square():
+    return Component(
+        kind='M', sites=[0, 1, 2, 3],
+        aux_edges=[
+            AuxEdge(0, 1, 'cis'), AuxEdge(1, 2, 'cis'),
+            AuxEdge(2, 3, 'cis'), AuxEdge(3, 0, 'cis'),
+        ])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def cis_MX2(M_square, X):
+    return Assembly(
+        components={'M0': M_square, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'X1', 0)])
+
+@pytest.fixture
+def trans_MX2(M_square, X):
+    return Assembly(
+        components={'M0': M_square, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 2, 'X1', 0)])
+
+
+def test_isomorphic_assemblies(M_square, X, cis_MX2):
+    # Relabelled and rotated
+    another_cis_MX2 = Assembly(
+        id_='cis',
+        components={'X2': X, 'M1': M_square, 'X3': X},
+        bonds=[Bond('M1', 3, 'X2', 0), Bond('M1', 2, 'X3', 0)])
+    assert get_wl_hash(cis_MX2) == get_wl_hash(another_cis_MX2)
+
+
+def test_non_isomorphic_isomers(cis_MX2, trans_MX2):
+    assert get_assembly_signature(cis_MX2) \
+        == get_assembly_signature(trans_MX2)
+    assert get_wl_hash(cis_MX2) != get_wl_hash(trans_MX2)
+    assert get_refined_assembly_signature(cis_MX2) \
+        != get_refined_assembly_signature(trans_MX2)
+
+
+def test_aux_edge_kinds(X):
+    M_cis = Component(kind='M', sites=[0, 1], aux_edges=[AuxEdge(0, 1, 'cis')])
+    M_trans = Component(
+        kind='M', sites=[0, 1], aux_edges=[AuxEdge(0, 1, 'trans')])
+    assert get_wl_hash(Assembly(components={'M0': M_cis}, bonds=[])) \
+        != get_wl_hash(Assembly(components={'M0': M_trans}, bonds=[]))
+
+
+def test_stable_across_processes():
+    # Not affected by the hash randomization of Python
+    code = (
+        'from nasap_net.assembly_equivalence import get_wl_hash\n'
+        'from nasap_net.models import Assembly, Bond, Component\n'
+        'M = Component(kind="M", sites=["a", "b"])\n'
+        'X = Component(kind="X", sites=["a"])\n'
+        'print(get_wl_hash(Assembly(\n'
+        '    components={"M0": M, "X0": X},\n'
+        '    bonds=[Bond("M0", "a", "X0", "a")])))\n'
+    )
+    hashes = {
+        subprocess.run(
+            [sys.executable, '-c', code], check=True, capture_output=True,
+            text=True, env=os.environ | {
+                'PYTHONHASHSEED': seed,
+                'PYTHONPATH': os.pathsep.join(sys.path)},
+        ).stdout
+        for seed in ['1', '2']
+    }
+    assert len(hashes) == 1
+
+
+def test_known_value():
+    # Persisted in hash indices; must not depend on the Python version or
+    # platform. Changing it requires incrementing SIGNATURE_VERSION.
+    M = Component(kind='M', sites=['a', 'b'])
+    X = Component(kind='X', sites=['a'])
+    assembly = Assembly(
+        components={'M0': M, 'X0': X}, bonds=[Bond('M0', 'a', 'X0', 'a')])
+    assert get_wl_hash(assembly) == 'aff713dd36a0d2c332688caaffcfc367'
@@ -1,9 +1,10 @@
 from collections import defaultdict
 from collections.abc import Hashable, Iterable
 
-from nasap_net.isomorphism import is_isomorphic
+from nasap_net.isomorphism import find_isomorphic_among
 from nasap_net.models import Assembly
 from .signature import get_assembly_signature
+from .wl_hash import get_wl_hash
 
 
 def extract_unique_assemblies(
@@ -21,17 +22,22 @@ def extract_unique_assemblies(
     set[Assembly]
         A set of unique assemblies by isomorphism.
     """
-    sig_to_unique_assembly: dict[Hashable, set[Assembly]] = defaultdict(set)
+    # The WL hash is computed only for assemblies sharing the signature
+    # with another one, and is used to narrow down the VF2 checks.
+    sig_to_unique_assembly: dict[Hashable, list[Assembly]] = \
+        defaultdict(list)
     for assembly in assemblies:
         sig = get_assembly_signature(assembly)
-        is_unique = True
-        for unique_assembly in sig_to_unique_assembly[sig]:
-            if is_isomorphic(assembly, unique_assembly):
-                is_unique = False
-                break
-        if is_unique:
-            sig_to_unique_assembly[sig].add(assembly)
+        uniques = sig_to_unique_assembly[sig]
+        if uniques:
+            wl_hash = get_wl_hash(assembly)
+            candidates = (
+                unique_assembly for unique_assembly in uniques
+                if get_wl_hash(unique_assembly) == wl_hash)
+            if find_isomorphic_among(assembly, candidates) is not None:
+                continue
+        uniques.append(assembly)
     unique_assemblies = set()
-    for assemblies_set in sig_to_unique_assembly.values():
-        unique_assemblies.update(assemblies_set)
+    for assemblies_list in sig_to_unique_assembly.values():
+        unique_assemblies.update(assemblies_list)
     return unique_assemblies
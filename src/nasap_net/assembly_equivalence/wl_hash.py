@@ -0,0 +1,110 @@
+"""Weisfeiler-Lehman hash of assemblies.
+
+The hash is computed by colour refinement over the same graph as used for
+isomorphism checks: one vertex per component core and per binding site,
+coloured by (core or site, component kind), and edges between each core and
+its sites, along auxiliary edges (coloured by their kinds) and along bonds.
+
+Isomorphic assemblies always have the same hash. Non-isomorphic assemblies
+with the same component kinds and bond kinds (e.g., isomers of the same
+composition) usually have different hashes, so that the hash can be used
+to narrow down the candidates before running VF2.
+"""
+import hashlib
+from functools import lru_cache
+
+from nasap_net.models import Assembly
+
+WL_HASH_CACHE_SIZE = 4096
+
+_CORE = 'core'
+_SITE = 'site'
+
+
+@lru_cache(maxsize=WL_HASH_CACHE_SIZE)
+def get_wl_hash(assembly: Assembly) -> str:
+    """Return the Weisfeiler-Lehman hash of the assembly.
+
+    The hash is stable across processes, so that it can be persisted.
+    The results are cached per assembly.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        The assembly to compute the hash for.
+
+    Returns
+    -------
+    str
+        The hash, as a hexadecimal string.
+    """
+    colors, neighbors = _build_colored_graph(assembly)
+    num_classes = len(set(colors))
+    # The partition is refined at each iteration; it is stable when the
+    # number of classes stops increasing.
+    for _ in range(len(colors)):
+        # Digested rather than combined with the built-in `hash`, which
+        # may differ between Python versions and platforms.
+        signatures = [
+            (color, tuple(sorted(
+                [(edge_color, colors[j]) for edge_color, j in nbrs])))
+            for color, nbrs in zip(colors, neighbors)
+        ]
+        digests = {
+            signature: _digest_bytes(repr(signature).encode('utf-8'))
+            for signature in set(signatures)}
+        colors = [digests[signature] for signature in signatures]
+        new_num_classes = len(set(colors))
+        if new_num_classes == num_classes:
+            break
+        num_classes = new_num_classes
+    return hashlib.blake2b(
+        repr(sorted(colors)).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _build_colored_graph(
+        assembly: Assembly,
+) -> tuple[list[int], list[list[tuple[int, int]]]]:
+    colors: list[int] = []
+    neighbors: list[list[tuple[int, int]]] = []
+    site_index = {}
+
+    def add_vertex(core_or_site: str, kind: str) -> int:
+        colors.append(_digest(core_or_site, kind))
+        neighbors.append([])
+        return len(colors) - 1
+
+    def add_edge(i: int, j: int, edge_color: int) -> None:
+        neighbors[i].append((edge_color, j))
+        neighbors[j].append((edge_color, i))
+
+    no_kind = _digest(None)
+    for comp_id, comp in assembly.components.items():
+        core = add_vertex(_CORE, comp.kind)
+        for site_id in comp.site_ids:
+            site = add_vertex(_SITE, comp.kind)
+            site_index[comp_id, site_id] = site
+            add_edge(core, site, no_kind)
+        for aux_edge in comp.aux_edges:
+            site_id1, site_id2 = aux_edge.site_ids
+            add_edge(
+                site_index[comp_id, site_id1], site_index[comp_id, site_id2],
+                _digest(aux_edge.kind))
+    for bond in assembly.bonds:
+        site1, site2 = bond.sites
+        add_edge(
+            site_index[site1.component_id, site1.site_id],
+            site_index[site2.component_id, site2.site_id],
+            no_kind)
+    return colors, neighbors
+
+
+@lru_cache(maxsize=None)
+def _digest(*values: str | None) -> int:
+    """Map a label to an int independent of the hash randomization."""
+    return _digest_bytes(repr(values).encode('utf-8'))
+
+
+def _digest_bytes(data: bytes) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(data, digest_size=8).digest(), 'big', signed=True)
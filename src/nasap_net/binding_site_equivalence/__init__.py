@@ -1,3 +1,4 @@
 from .core import binding_site_combs_equivalent
-from .grouping import group_equivalent_binding_site_combs
+from .grouping import get_binding_site_automorphisms, \
+    group_equivalent_binding_site_combs
 from .unique import UniqueComb, extract_unique_binding_site_combs
@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from nasap_net.isomorphism import get_all_isomorphisms
 from nasap_net.models import Assembly, BindingSite
@@ -8,14 +8,24 @@ from nasap_net.utils import UnionFind
 def group_equivalent_binding_site_combs(
         node_combs: Iterable[tuple[BindingSite, ...]],
         assembly: Assembly,
+        *,
+        automorphisms: (
+            Iterable[Mapping[BindingSite, BindingSite]] | None) = None,
         ) -> set[frozenset[tuple[BindingSite, ...]]]:
-    """Group equivalent node combinations."""
+    """Group equivalent node combinations.
+
+    `automorphisms` are the binding site mappings of the self-isomorphisms
+    of `assembly` (see `get_binding_site_automorphisms`); if None, they are
+    computed.
+    """
     node_combs = set(node_combs)
     uf = UnionFind(node_combs)
 
-    self_isomorphisms = get_all_isomorphisms(assembly, assembly)
-    binding_site_isoms = [
-        isom.binding_site_mapping for isom in self_isomorphisms]
+    if automorphisms is None:
+        binding_site_isoms: Iterable[Mapping[BindingSite, BindingSite]] = \
+            get_binding_site_automorphisms(assembly)
+    else:
+        binding_site_isoms = automorphisms
 
     for isom in binding_site_isoms:
         for comb in node_combs:
@@ -25,3 +35,13 @@ def group_equivalent_binding_site_combs(
     return {
         frozenset(elements) for elements
         in uf.root_to_elements.values()}
+
+
+def get_binding_site_automorphisms(
+        assembly: Assembly,
+        ) -> tuple[Mapping[BindingSite, BindingSite], ...]:
+    """Return the binding site mappings of the self-isomorphisms of an
+    assembly."""
+    return tuple(
+        isom.binding_site_mapping
+        for isom in get_all_isomorphisms(assembly, assembly))
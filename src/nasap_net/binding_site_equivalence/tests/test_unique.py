@@ -1,7 +1,7 @@
 import pytest
 
 from nasap_net.binding_site_equivalence import UniqueComb, \
-    extract_unique_binding_site_combs
+    extract_unique_binding_site_combs, get_binding_site_automorphisms
 from nasap_net.models import Assembly, AuxEdge, BindingSite, Bond, Component
 
 
@@ -90,3 +90,21 @@ def test_site_triplets():
             (BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L1', 1)),
             duplication=2),
     }
+
+
+def test_given_automorphisms(MX2):
+    binding_site_combs = [
+        (BindingSite('M0', 0),),
+        (BindingSite('M0', 1),),
+    ]
+    identity = {site: site for site in MX2.find_sites()}
+    assert extract_unique_binding_site_combs(
+        binding_site_combs, MX2, automorphisms=[identity]
+    ) == {
+        UniqueComb(site_comb=(BindingSite('M0', 0),), duplication=1),
+        UniqueComb(site_comb=(BindingSite('M0', 1),), duplication=1),
+    }
+    assert extract_unique_binding_site_combs(
+        binding_site_combs, MX2,
+        automorphisms=get_binding_site_automorphisms(MX2)
+    ) == extract_unique_binding_site_combs(binding_site_combs, MX2)
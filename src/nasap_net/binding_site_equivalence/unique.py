@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from nasap_net.models import Assembly, BindingSite
 from .grouping import group_equivalent_binding_site_combs
@@ -15,10 +15,16 @@ class UniqueComb:
 def extract_unique_binding_site_combs(
         binding_site_combs: Iterable[tuple[BindingSite, ...]],
         assembly: Assembly,
+        *,
+        automorphisms: (
+            Iterable[Mapping[BindingSite, BindingSite]] | None) = None,
         ) -> set[UniqueComb]:
-    """Compute unique binding sites or binding site sets."""
+    """Compute unique binding sites or binding site sets.
+
+    `automorphisms` are passed on to `group_equivalent_binding_site_combs`.
+    """
     grouped_node_combs = group_equivalent_binding_site_combs(
-        binding_site_combs, assembly)
+        binding_site_combs, assembly, automorphisms=automorphisms)
 
     return {
         UniqueComb(
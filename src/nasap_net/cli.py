@@ -0,0 +1,54 @@
+"""Command-line interface of nasap-net.
+
+Usage::
+
+    nasap-net run config.yaml [--force] [-v]
+
+See `nasap_net.pipeline.config` for the format of the configuration file.
+"""
+import argparse
+import logging
+import sys
+from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command-line interface and return the exit status."""
+    parser = argparse.ArgumentParser(
+        prog='nasap-net',
+        description='Construct reaction networks for NASAP.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser(
+        'run', help='Run the pipeline defined in a configuration file.')
+    run_parser.add_argument('config', help='Path to the YAML configuration.')
+    run_parser.add_argument(
+        '--force', action='store_true',
+        help='Run all the stages even if their results are up to date.')
+    run_parser.add_argument(
+        '-v', '--verbose', action='count', default=0,
+        help='Show progress messages (-vv for debug messages).')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=[logging.WARNING, logging.INFO, logging.DEBUG][
+            min(args.verbose, 2)],
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    # Imported here so that `nasap-net --help` is fast.
+    from nasap_net.exceptions import NasapNetError
+    from nasap_net.pipeline import load_pipeline_config, run_pipeline
+
+    try:
+        config = load_pipeline_config(args.config)
+        reports = run_pipeline(config, force=args.force)
+    except (OSError, NasapNetError) as e:
+        print(f'nasap-net: error: {e}', file=sys.stderr)
+        return 2
+
+    print(f'{"stage":<16}{"status":<10}{"time [s]":>10}')
+    for report in reports:
+        print(f'{report.name:<16}{report.status:<10}{report.elapsed:>10.2f}')
+    print(f'{"total":<26}{sum(r.elapsed for r in reports):>10.2f}')
+    return 0
@@ -0,0 +1,12 @@
+import pytest
+
+from nasap_net.isomorphism.batch import _prepare
+
+
+@pytest.fixture(autouse=True)
+def isolate_prepared_assembly_cache():
+    # The prepared graphs are cached per process; a test must not see
+    # (or count on) the assemblies prepared by the tests before it.
+    _prepare.cache_clear()
+    yield
+    _prepare.cache_clear()
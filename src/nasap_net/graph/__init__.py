@@ -1,3 +1,3 @@
-from .coloring import Colors, color_vertices_and_edges
+from .coloring import Colors, color_vertices_and_edges, refine_vertex_colors
 from .conversion import convert_assembly_to_graph
 from .decoding import decode_mapping
@@ -1,3 +1,4 @@
+from collections import Counter
 from dataclasses import dataclass
 from typing import Hashable
 
@@ -15,9 +16,36 @@ class Colors:
     e_color2: tuple[int, ...]
 
 
-def color_vertices_and_edges(g1: ig.Graph, g2: ig.Graph) -> Colors:
+def color_vertices_and_edges(
+        g1: ig.Graph, g2: ig.Graph, *, refine: bool = False) -> Colors:
+    """Color the vertices and edges of two graphs for VF2.
+
+    Vertices are colored by (core or site, component kind), and edges by
+    the kind of the auxiliary edge (None for other edges).
+
+    Parameters
+    ----------
+    g1, g2 : ig.Graph
+        The graphs converted from assemblies.
+    refine : bool, optional
+        If True, the vertex colors are refined until the partition is
+        equitable, i.e., until vertices of the same color have the same
+        number of neighbors of each color along edges of each color.
+        The refined colors are preserved by every isomorphism, so that VF2
+        finds the same isomorphisms while pruning its search earlier.
+        Default is False.
+
+    Raises
+    ------
+    IsomorphismNotFoundError
+        If the colors show that the graphs are not isomorphic.
+    """
     try:
-        v_color1, v_color2 = _vertex_color_lists(g1, g2)
+        if refine:
+            v_color1, v_color2 = _to_color_lists(
+                refine_vertex_colors(g1), refine_vertex_colors(g2))
+        else:
+            v_color1, v_color2 = _vertex_color_lists(g1, g2)
     except _NotIsomorphicError:
         raise IsomorphismNotFoundError() from None
 
@@ -38,11 +66,29 @@ class _NotIsomorphicError(NasapNetError):
     pass
 
 
+def _readable_v_color(vertex: ig.Vertex) -> Hashable:
+    return vertex['core_or_site'], vertex['comp_kind']
+
+
+def _readable_edge_color(edge: ig.Edge) -> Hashable | None:
+    return edge['aux_kind'] if 'aux_kind' in edge.attributes() else None
+
+
+def _to_color_lists(
+        colors1: list[int], colors2: list[int],
+) -> tuple[list[int], list[int]]:
+    if Counter(colors1) != Counter(colors2):
+        raise _NotIsomorphicError()
+    color_to_int: dict[int, int] = {
+        c: i for i, c in enumerate(set(colors1))}
+    return (
+        [color_to_int[c] for c in colors1],
+        [color_to_int[c] for c in colors2],
+    )
+
+
 def _vertex_color_lists(
         g1: ig.Graph, g2: ig.Graph) -> tuple[list[int], list[int]]:
-    def _readable_v_color(vertex: ig.Vertex) -> Hashable:
-        return vertex['core_or_site'], vertex['comp_kind']
-
     colors1 = {_readable_v_color(v) for v in g1.vs}
     colors2 = {_readable_v_color(v) for v in g2.vs}
     if colors1 != colors2:
@@ -56,9 +102,6 @@ def _vertex_color_lists(
 
 def _edge_color_lists(
         g1: ig.Graph, g2: ig.Graph) -> tuple[list[int], list[int]]:
-    def _readable_edge_color(edge: ig.Edge) -> Hashable | None:
-        return edge['aux_kind'] if 'aux_kind' in edge.attributes() else None
-
     colors1 = {_readable_edge_color(e) for e in g1.es}
     colors2 = {_readable_edge_color(e) for e in g2.es}
     if colors1 != colors2:
@@ -69,3 +112,36 @@ def _edge_color_lists(
     color_list1 = [color_to_int[_readable_edge_color(e)] for e in g1.es]
     color_list2 = [color_to_int[_readable_edge_color(e)] for e in g2.es]
     return color_list1, color_list2
+
+
+def refine_vertex_colors(g: ig.Graph) -> list[int]:
+    """Return the refined colors of the vertices of a graph.
+
+    Starting from (core or site, component kind), the color of each vertex
+    is repeatedly combined with the multiset of (edge color, neighbor
+    color) until the partition is equitable. The colors only depend on the
+    structure of the graph, so that isomorphic graphs get the same colors
+    for corresponding vertices (within the same process).
+    """
+    colors = [_readable_v_color(v) for v in g.vs]
+    neighbors: list[list[tuple[Hashable, int]]] = [
+        [] for _ in range(g.vcount())]
+    for e in g.es:
+        v1, v2 = e.tuple
+        e_color = _readable_edge_color(e)
+        neighbors[v1].append((e_color, v2))
+        neighbors[v2].append((e_color, v1))
+
+    hashed = [hash(color) for color in colors]
+    num_classes = len(set(hashed))
+    for _ in range(len(hashed)):
+        hashed = [
+            hash((color, tuple(sorted(
+                [(hash(e_color), hashed[j]) for e_color, j in nbrs]))))
+            for color, nbrs in zip(hashed, neighbors)
+        ]
+        new_num_classes = len(set(hashed))
+        if new_num_classes == num_classes:
+            break
+        num_classes = new_num_classes
+    return hashed
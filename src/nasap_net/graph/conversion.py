@@ -5,6 +5,7 @@ import igraph as ig
 from bidict import frozenbidict
 
 from nasap_net.models import Assembly, BindingSite
+from nasap_net.profiling import profiled
 from nasap_net.types import ID
 
 
@@ -28,6 +29,7 @@ class GraphConversionResult:
             frozenbidict(binding_site_mapping))
 
 
+@profiled('convert_assembly_to_graph')
 def convert_assembly_to_graph(assembly: Assembly) -> GraphConversionResult:
     g = ig.Graph()
     core_mapping = {}
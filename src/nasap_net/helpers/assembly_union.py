@@ -1,4 +1,5 @@
-from nasap_net import Assembly, NasapNetError
+from nasap_net.exceptions import NasapNetError
+from nasap_net.models import Assembly
 
 
 class ComponentIDCollisionError(NasapNetError):
@@ -1,3 +1,47 @@
-from .assemblies import load_assemblies, save_assemblies
-from .classification_result import save_classification_result
-from .reactions import load_reactions, save_reactions
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# The submodules depend on pandas, PyYAML, etc.; each one is imported on
+# first access to one of its attributes.
+_LAZY_ATTRS = {
+    'AssemblySpaceFile': 'nasap_net.io.assemblies',
+    'AssemblyWriter': 'nasap_net.io.assemblies',
+    'build_assembly': 'nasap_net.io.assemblies',
+    'build_component': 'nasap_net.io.assemblies',
+    'iter_assemblies': 'nasap_net.io.assemblies',
+    'load_assemblies': 'nasap_net.io.assemblies',
+    'load_assembly_space': 'nasap_net.io.assemblies',
+    'save_assemblies': 'nasap_net.io.assemblies',
+    'save_assembly_space': 'nasap_net.io.assemblies',
+    'save_classification_result': 'nasap_net.io.classification_result',
+    'ReactionNetworkStore': 'nasap_net.io.network_store',
+    'iter_reaction_batches': 'nasap_net.io.reactions',
+    'load_reactions': 'nasap_net.io.reactions',
+    'load_reactions_columnar': 'nasap_net.io.reactions',
+    'save_reactions': 'nasap_net.io.reactions',
+    'save_reactions_columnar': 'nasap_net.io.reactions',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+if TYPE_CHECKING:
+    from .assemblies import AssemblySpaceFile, AssemblyWriter, \
+        build_assembly, build_component, iter_assemblies, load_assemblies, \
+        load_assembly_space, save_assemblies, save_assembly_space
+    from .classification_result import save_classification_result
+    from .network_store import ReactionNetworkStore
+    from .reactions import iter_reaction_batches, load_reactions, \
+        load_reactions_columnar, save_reactions, save_reactions_columnar
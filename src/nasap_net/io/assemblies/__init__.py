@@ -1,4 +1,8 @@
+from .binary import AssemblySpaceFile, load_assembly_space, \
+    save_assembly_space
 from .loading import load_assemblies
 from .saving import save_assemblies
+from .streaming import AssemblyWriter, iter_assemblies
 from .yaml_dumping import dump_assemblies_to_str
+from .yaml_event_loading import build_assembly, build_component
 from .yaml_loading import load_assemblies_from_str
@@ -0,0 +1,301 @@
+"""Binary container for assembly spaces with random access.
+
+An assembly space is saved into a directory in the columnar format (see
+`nasap_net.io.columnar`):
+
+- ``meta.json``: the component table (one entry per component kind) and
+  the ID tables of assemblies, components and sites.
+- ``assembly_id.npy``: the code of the ID of each assembly (-1 for None).
+- ``component_offsets.npy``, ``bond_offsets.npy``: offsets of the
+  components and bonds of each assembly into the arrays below.
+- ``component_ids.npy``, ``component_kinds.npy``: the ID code and the index
+  into the component table of each component.
+- ``bonds.npy``: the codes (component, site, component, site) of each bond.
+
+An assembly is decoded from the slices of the arrays given by the offsets,
+so that a single assembly or a subset can be loaded without reading the
+whole file; with memory mapping, only the pages touched are read.
+"""
+import logging
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+
+from nasap_net.io.columnar import CODE_DTYPE, IDTableBuilder, \
+    prepare_directory, read_column, read_meta, write_column, write_meta
+from nasap_net.io.component_codec import component_from_dict, \
+    component_to_dict
+from nasap_net.models import Assembly, Bond
+from nasap_net.models.component_consistency_check import \
+    check_component_consistency
+from nasap_net.types import ID
+from .semi_light_assembly.rich_to_semi_light import _extract_components
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+FORMAT_NAME = 'nasap-net-assembly-space'
+FORMAT_VERSION = 1
+
+
+def save_assembly_space(
+        assemblies: Iterable[Assembly],
+        dir_path: os.PathLike | str,
+        *,
+        overwrite: bool = False,
+) -> None:
+    """Save assemblies into the binary assembly-space format.
+
+    Parameters
+    ----------
+    assemblies : Iterable[Assembly]
+        Assemblies to save. Assembly IDs are optional but must be unique
+        if set, so that assemblies can be looked up by ID.
+    dir_path : os.PathLike | str
+        Path to the directory to write.
+    overwrite : bool, optional
+        If True, overwrite the directory if it already exists.
+        If False, raise an error if the directory already exists.
+        Default is False.
+
+    Raises
+    ------
+    InconsistentComponentBetweenAssembliesError
+        If the same component kind has different definitions.
+    ValueError
+        If assembly IDs are duplicated.
+    """
+    assemblies = list(assemblies)
+    check_component_consistency(assemblies)
+    components = _extract_components(assemblies)
+    kinds = sorted(components)
+    kind_index = {kind: i for i, kind in enumerate(kinds)}
+
+    assembly_ids = IDTableBuilder()
+    comp_ids = IDTableBuilder()
+    site_ids = IDTableBuilder()
+
+    assembly_id_codes = assembly_ids.encode_all(
+        assembly.id_or_none for assembly in assemblies)
+    if len(assembly_ids.table) != np.count_nonzero(assembly_id_codes >= 0):
+        raise ValueError('Assembly IDs must be unique.')
+
+    num_comps = np.fromiter(
+        (len(assembly.components) for assembly in assemblies),
+        dtype=np.int64, count=len(assemblies))
+    num_bonds = np.fromiter(
+        (len(assembly.bonds) for assembly in assemblies),
+        dtype=np.int64, count=len(assemblies))
+
+    comp_id_codes = comp_ids.encode_all(
+        comp_id for assembly in assemblies for comp_id in assembly.components)
+    comp_kind_codes = np.fromiter(
+        (kind_index[comp.kind] for assembly in assemblies
+         for comp in assembly.components.values()),
+        dtype=CODE_DTYPE, count=int(num_comps.sum()))
+    bond_codes = np.empty((int(num_bonds.sum()), 4), dtype=CODE_DTYPE)
+    i = 0
+    for assembly in assemblies:
+        for bond in sorted(assembly.bonds):
+            site1, site2 = bond
+            bond_codes[i] = (
+                comp_ids.encode(site1.component_id),
+                site_ids.encode(site1.site_id),
+                comp_ids.encode(site2.component_id),
+                site_ids.encode(site2.site_id),
+            )
+            i += 1
+
+    dir_path = prepare_directory(dir_path, overwrite=overwrite)
+    write_column(dir_path, 'assembly_id', assembly_id_codes)
+    write_column(dir_path, 'component_offsets', _to_offsets(num_comps))
+    write_column(dir_path, 'bond_offsets', _to_offsets(num_bonds))
+    write_column(dir_path, 'component_ids', comp_id_codes)
+    write_column(dir_path, 'component_kinds', comp_kind_codes)
+    write_column(dir_path, 'bonds', bond_codes)
+    write_meta(dir_path, {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'num_assemblies': len(assemblies),
+        'components': [component_to_dict(components[k]) for k in kinds],
+        'id_tables': {
+            'assembly': assembly_ids.table,
+            'component': comp_ids.table,
+            'site': site_ids.table,
+        },
+    })
+    logger.info(
+        'Saved %d assemblies to "%s"', len(assemblies), str(dir_path))
+
+
+def load_assembly_space(
+        dir_path: os.PathLike | str,
+) -> list[Assembly]:
+    """Load all assemblies saved in the binary assembly-space format.
+
+    Use `AssemblySpaceFile` to load only some of the assemblies.
+    """
+    with AssemblySpaceFile(dir_path, mmap=False) as space:
+        return space[:]
+
+
+class AssemblySpaceFile(Sequence[Assembly]):
+    """Random-access reader of the binary assembly-space format.
+
+    Assemblies are decoded on access, by position (including slices)
+    or by ID.
+
+    Examples
+    --------
+    >>> space = AssemblySpaceFile('assembly_space')  # doctest: +SKIP
+    >>> space.get('M2L2')  # doctest: +SKIP
+    >>> space[100:200]  # doctest: +SKIP
+    """
+    def __init__(self, dir_path: os.PathLike | str, *, mmap: bool = True):
+        """
+        Parameters
+        ----------
+        dir_path : os.PathLike | str
+            Path to the directory written by `save_assembly_space`.
+        mmap : bool, optional
+            If True, the arrays are memory-mapped instead of being read
+            into memory. Default is True.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the directory or its meta file does not exist.
+        ValueError
+            If the directory is not in the assembly-space format.
+        """
+        dir_path, meta = read_meta(
+            dir_path, format_name=FORMAT_NAME,
+            supported_versions=[FORMAT_VERSION])
+        self._dir_path = dir_path
+        self._num_assemblies: int = meta['num_assemblies']
+        self._components = [
+            component_from_dict(d) for d in meta['components']]
+        tables = meta['id_tables']
+        self._assembly_id_table: list[ID | None] = \
+            tables['assembly'] + [None]  # code -1 refers to the last item
+        self._comp_id_table: list[ID] = tables['component']
+        self._site_id_table: list[ID] = tables['site']
+
+        def read(name: str) -> np.ndarray:
+            return read_column(dir_path, name, mmap=mmap)
+
+        self._assembly_id_codes = read('assembly_id')
+        self._component_offsets = read('component_offsets')
+        self._bond_offsets = read('bond_offsets')
+        self._component_ids = read('component_ids')
+        self._component_kinds = read('component_kinds')
+        self._bonds = read('bonds')
+        self._position_of_id: dict[ID, int] | None = None
+
+    def __len__(self) -> int:
+        return self._num_assemblies
+
+    @overload
+    def __getitem__(self, index: int) -> Assembly: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Assembly]: ...
+
+    def __getitem__(self, index: int | slice) -> Assembly | list[Assembly]:
+        if isinstance(index, slice):
+            return [
+                self._decode(i)
+                for i in range(*index.indices(self._num_assemblies))]
+        if index < 0:
+            index += self._num_assemblies
+        if not 0 <= index < self._num_assemblies:
+            raise IndexError('Assembly index out of range.')
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[Assembly]:
+        for i in range(self._num_assemblies):
+            yield self._decode(i)
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, Assembly) and value.id_or_none is not None:
+            position = self._get_position_of_id().get(value.id_or_none)
+            return position is not None and self._decode(position) == value
+        return super().__contains__(value)
+
+    def __enter__(self) -> 'AssemblySpaceFile':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory-mapped arrays."""
+        for name in (
+                '_assembly_id_codes', '_component_offsets', '_bond_offsets',
+                '_component_ids', '_component_kinds', '_bonds'):
+            setattr(self, name, None)
+
+    @property
+    def ids(self) -> list[ID | None]:
+        """The IDs of the assemblies, in the order of the file."""
+        return [
+            self._assembly_id_table[code]
+            for code in self._assembly_id_codes.tolist()]
+
+    def get(self, id_: ID) -> Assembly:
+        """Return the assembly with the ID.
+
+        Raises
+        ------
+        KeyError
+            If no assembly has the ID.
+        """
+        return self._decode(self._get_position_of_id()[id_])
+
+    def get_many(self, ids: Iterable[ID]) -> list[Assembly]:
+        """Return the assemblies with the IDs, in the given order.
+
+        Raises
+        ------
+        KeyError
+            If no assembly has one of the IDs.
+        """
+        position_of_id = self._get_position_of_id()
+        return [self._decode(position_of_id[id_]) for id_ in ids]
+
+    def _get_position_of_id(self) -> dict[ID, int]:
+        if self._position_of_id is None:
+            self._position_of_id = {
+                id_: i for i, id_ in enumerate(self.ids) if id_ is not None}
+        return self._position_of_id
+
+    def _decode(self, i: int) -> Assembly:
+        comp_start, comp_stop = self._component_offsets[i:i + 2].tolist()
+        bond_start, bond_stop = self._bond_offsets[i:i + 2].tolist()
+        comp_ids = self._comp_id_table
+        site_ids = self._site_id_table
+        components = {
+            comp_ids[id_code]: self._components[kind_code]
+            for id_code, kind_code in zip(
+                self._component_ids[comp_start:comp_stop].tolist(),
+                self._component_kinds[comp_start:comp_stop].tolist())
+        }
+        bonds = [
+            Bond(comp_ids[c1], site_ids[s1], comp_ids[c2], site_ids[s2])
+            for c1, s1, c2, s2
+            in self._bonds[bond_start:bond_stop].tolist()
+        ]
+        return Assembly(
+            components=components,
+            bonds=bonds,
+            id_=self._assembly_id_table[int(self._assembly_id_codes[i])],
+        )
+
+
+def _to_offsets(counts: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
@@ -1,4 +1,2 @@
 from .component_dump import dump_components
-from .component_load import load_components
 from .semi_light_assembly_dump import dump_semi_light_assemblies
-from .semi_light_assembly_load import load_semi_light_assemblies
@@ -1,6 +1,6 @@
 import pytest
 
-from nasap_net.io.assemblies.lib import dump_components, load_components
+from nasap_net.io.assemblies.lib import dump_components
 from nasap_net.models import AuxEdge, Component
 
 
@@ -33,13 +33,3 @@ def test_dump_components(components, dumped_components):
     dumped = dump_components(components)
     assert dumped == dumped_components
 
-
-def test_load_components(components, dumped_components):
-    loaded = load_components(dumped_components)
-    assert loaded == components
-
-
-def test_round_trip(components, dumped_components):
-    dumped = dump_components(components)
-    loaded = load_components(dumped)
-    assert loaded == components
@@ -2,7 +2,7 @@ import logging
 import os
 from pathlib import Path
 
-from nasap_net.io.assemblies.yaml_loading import load_assemblies_from_str
+from nasap_net.io.assemblies.streaming import iter_assemblies
 from nasap_net.models import Assembly
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,6 @@ def load_assemblies(
     """
     file_path = Path(file_path)
 
-    yaml_str = file_path.read_text(encoding="utf-8")
-    assemblies = load_assemblies_from_str(yaml_str)
+    assemblies = list(iter_assemblies(file_path))
     logger.info('Loaded %d assemblies from "%s"', len(assemblies), str(file_path))
     return assemblies
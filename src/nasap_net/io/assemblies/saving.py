@@ -1,14 +1,9 @@
-import logging
 import os
 from collections.abc import Iterable
-from pathlib import Path
 
-from nasap_net.io.assemblies.yaml_dumping import dump_assemblies_to_str
+from nasap_net.io.assemblies.streaming import AssemblyWriter
 from nasap_net.models import Assembly
 
-logger = logging.getLogger(__name__)
-logger.addHandler(logging.NullHandler())
-
 
 def save_assemblies(
         assemblies: Iterable[Assembly],
@@ -29,16 +24,5 @@ def save_assemblies(
         If False, raise an error if the file already exists.
         Default is False.
     """
-    file_path = Path(file_path)
-    if file_path.exists() and not overwrite:
-        raise FileExistsError(
-            f'File "{str(file_path)}" already exists. '
-            'Use `overwrite=True` to overwrite it.'
-        )
-
-    assemblies = list(assemblies)
-
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    yaml_str = dump_assemblies_to_str(assemblies)
-    file_path.write_text(yaml_str, encoding="utf-8")
-    logger.info('Saved %d assemblies to "%s"', len(assemblies), str(file_path))
+    with AssemblyWriter(file_path, overwrite=overwrite) as writer:
+        writer.write_all(assemblies)
@@ -0,0 +1,182 @@
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from nasap_net.io.assemblies.lib import dump_components, \
+    dump_semi_light_assemblies
+from nasap_net.io.assemblies.semi_light_assembly import SemiLightAssembly
+from nasap_net.models import Assembly, Component
+from nasap_net.models.component_consistency_check import \
+    InconsistentComponentBetweenAssembliesError
+from .yaml_event_loading import iter_assemblies_from_stream
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def iter_assemblies(file_path: os.PathLike | str) -> Iterator[Assembly]:
+    """Iterate over the assemblies in a YAML file.
+
+    Unlike `load_assemblies`, the file is read incrementally and the
+    assemblies are yielded one at a time, so that the memory usage does not
+    depend on the number of assemblies in the file.
+
+    Parameters
+    ----------
+    file_path : os.PathLike | str
+        Path to the YAML file to load.
+
+    Yields
+    ------
+    Assembly
+        The assemblies, in the order of the file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file is not in the assembly YAML format.
+    """
+    file_path = Path(file_path)
+    with file_path.open(encoding='utf-8') as f:
+        yield from iter_assemblies_from_stream(f)
+
+
+class AssemblyWriter:
+    """Incrementally write assemblies into a YAML file.
+
+    The output is identical to that of `save_assemblies` for the same
+    assemblies. Since the components document precedes the assemblies in
+    the file, the assemblies are first written to a temporary file next to
+    the destination, and the destination is written when the writer is
+    closed. Only the components are kept in memory.
+
+    Use as a context manager; if an exception is raised inside the block,
+    the destination is not written.
+
+    Examples
+    --------
+    >>> with AssemblyWriter('assemblies.yaml') as writer:  # doctest: +SKIP
+    ...     for assembly in enumerate_assemblies(...):
+    ...         writer.write(assembly)
+    """
+    def __init__(
+            self,
+            file_path: os.PathLike | str,
+            *,
+            overwrite: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        file_path : os.PathLike | str
+            Path to the YAML file to write.
+        overwrite : bool, optional
+            If True, overwrite the file if it already exists.
+            If False, raise an error if the file already exists.
+            Default is False.
+        """
+        file_path = Path(file_path)
+        if file_path.exists() and not overwrite:
+            raise FileExistsError(
+                f'File "{str(file_path)}" already exists. '
+                'Use `overwrite=True` to overwrite it.'
+            )
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file_path = file_path
+        self._tmp_file = tempfile.NamedTemporaryFile(
+            'w+', encoding='utf-8', dir=file_path.parent,
+            prefix=f'.{file_path.name}.', suffix='.tmp', delete=False)
+        self._components: dict[str, Component] = {}
+        self._source_assemblies: dict[str, Assembly] = {}
+        self._count = 0
+        self._closed = False
+
+    @property
+    def count(self) -> int:
+        """The number of assemblies written so far."""
+        return self._count
+
+    def write(self, assembly: Assembly) -> None:
+        """Append an assembly.
+
+        Raises
+        ------
+        InconsistentComponentBetweenAssembliesError
+            If a component kind of the assembly has a different definition
+            from that of an assembly written before.
+        ValueError
+            If the writer is already closed.
+        """
+        if self._closed:
+            raise ValueError('The writer is already closed.')
+        for comp in assembly.components.values():
+            found = self._components.get(comp.kind)
+            if found is None:
+                self._components[comp.kind] = comp
+                self._source_assemblies[comp.kind] = assembly
+            elif found != comp:
+                raise InconsistentComponentBetweenAssembliesError(
+                    component_kind=comp.kind,
+                    assembly1=self._source_assemblies[comp.kind],
+                    assembly2=assembly,
+                )
+        self._tmp_file.write(dump_semi_light_assemblies(
+            [SemiLightAssembly.from_assembly(assembly)]))
+        self._count += 1
+
+    def write_all(self, assemblies: Iterable[Assembly]) -> None:
+        """Append assemblies."""
+        for assembly in assemblies:
+            self.write(assembly)
+
+    def close(self) -> None:
+        """Write the destination file and remove the temporary file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._tmp_file.seek(0)
+            with self._file_path.open('w', encoding='utf-8') as f:
+                f.write(dump_components(dict(sorted(self._components.items()))))
+                f.write('---\n')
+                if self._count == 0:
+                    f.write(dump_semi_light_assemblies([]))
+                else:
+                    shutil.copyfileobj(self._tmp_file, f)
+        finally:
+            self._remove_tmp_file()
+        logger.info(
+            'Saved %d assemblies to "%s"', self._count, str(self._file_path))
+
+    def abort(self) -> None:
+        """Discard the written assemblies without writing the destination."""
+        if self._closed:
+            return
+        self._closed = True
+        self._remove_tmp_file()
+
+    def _remove_tmp_file(self) -> None:
+        self._tmp_file.close()
+        Path(self._tmp_file.name).unlink(missing_ok=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
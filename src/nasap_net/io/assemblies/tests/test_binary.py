@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from nasap_net.io.assemblies import AssemblySpaceFile, load_assembly_space, \
+    save_assembly_space
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
+from nasap_net.models.component_consistency_check import \
+    InconsistentComponentBetweenAssembliesError
+
+
+@pytest.fixture
+def sample_assemblies():
+    M = Component(kind='M', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    M_aux = Component(
+        kind='M(aux)', sites=[0, 1, 2],
+        aux_edges=[AuxEdge(0, 1), AuxEdge(0, 2, kind='cis')]
+    )
+    L_int = Component(kind='L', sites=['a', 'b'])
+    return [
+        Assembly(id_='X', components={'X0': X}, bonds=[]),
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]
+        ),
+        Assembly(
+            components={'M0': M_aux, 'X0': X, 'X1': X, 'X2': X},
+            bonds=[
+                Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'X1', 0),
+                Bond('M0', 2, 'X2', 0)
+            ]
+        ),
+        Assembly(
+            id_=3,
+            components={0: M, 1: L_int},
+            bonds=[Bond(0, 0, 1, 'a')]
+        ),
+    ]
+
+
+def test_round_trip(tmp_path, sample_assemblies):
+    dir_path = tmp_path / 'space'
+    save_assembly_space(sample_assemblies, dir_path)
+    loaded = load_assembly_space(dir_path)
+    assert loaded == sample_assemblies
+    assert [a.id_or_none for a in loaded] == ['X', 'MX2', None, 3]
+
+
+def test_random_access(tmp_path, sample_assemblies):
+    dir_path = tmp_path / 'space'
+    save_assembly_space(sample_assemblies, dir_path)
+    with AssemblySpaceFile(dir_path) as space:
+        assert len(space) == 4
+        assert isinstance(space._bonds, np.memmap)
+        assert space[1] == sample_assemblies[1]
+        assert space[-1] == sample_assemblies[-1]
+        assert space[1:3] == sample_assemblies[1:3]
+        assert space[::2] == sample_assemblies[::2]
+        assert list(space) == sample_assemblies
+        with pytest.raises(IndexError):
+            space[4]
+
+
+def test_get_by_id(tmp_path, sample_assemblies):
+    dir_path = tmp_path / 'space'
+    save_assembly_space(sample_assemblies, dir_path)
+    space = AssemblySpaceFile(dir_path, mmap=False)
+    assert space.ids == ['X', 'MX2', None, 3]
+    assert space.get('MX2') == sample_assemblies[1]
+    assert space.get(3) == sample_assemblies[3]
+    assert space.get_many([3, 'X']) == [
+        sample_assemblies[3], sample_assemblies[0]]
+    with pytest.raises(KeyError):
+        space.get('3')  # int and str IDs are distinguished
+    assert sample_assemblies[1] in space
+
+
+def test_shared_components(tmp_path, sample_assemblies):
+    dir_path = tmp_path / 'space'
+    save_assembly_space(sample_assemblies, dir_path)
+    loaded = load_assembly_space(dir_path)
+    assert loaded[0].components['X0'] is loaded[1].components['X0']
+
+
+def test_empty(tmp_path):
+    dir_path = tmp_path / 'space'
+    save_assembly_space([], dir_path)
+    assert load_assembly_space(dir_path) == []
+
+
+def test_duplicate_ids(tmp_path, sample_assemblies):
+    with pytest.raises(ValueError):
+        save_assembly_space(
+            [sample_assemblies[0], sample_assemblies[0]], tmp_path / 'space')
+
+
+def test_inconsistent_components(tmp_path):
+    X = Component(kind='X', sites=[0])
+    another_X = Component(kind='X', sites=[0, 1])
+    with pytest.raises(InconsistentComponentBetweenAssembliesError):
+        save_assembly_space([
+            Assembly(components={'X0': X}, bonds=[]),
+            Assembly(components={'X0': another_X}, bonds=[]),
+        ], tmp_path / 'space')
+
+
+def test_overwrite(tmp_path, sample_assemblies):
+    dir_path = tmp_path / 'space'
+    save_assembly_space(sample_assemblies, dir_path)
+    with pytest.raises(FileExistsError):
+        save_assembly_space(sample_assemblies, dir_path)
+    save_assembly_space(sample_assemblies[:1], dir_path, overwrite=True)
+    assert load_assembly_space(dir_path) == sample_assemblies[:1]
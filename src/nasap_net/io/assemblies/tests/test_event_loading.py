@@ -0,0 +1,129 @@
+import pytest
+import yaml
+
+from nasap_net.io.assemblies import build_assembly, build_component, \
+    dump_assemblies_to_str, load_assemblies_from_str
+from nasap_net.io.assemblies.yaml_event_loading import \
+    iter_assemblies_from_stream
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
+
+COMPONENTS_DOC = """M: !Component
+  kind: M
+  sites: [0, 1]
+X: !Component
+  kind: X
+  sites: [0]
+"""
+
+
+@pytest.fixture
+def M() -> Component:
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def X() -> Component:
+    return Component(kind='X', sites=[0])
+
+
+def test_round_trip(M, X):
+    M_aux = Component(
+        kind='M(aux)', sites=[0, 1, 2],
+        aux_edges=[AuxEdge(0, 1), AuxEdge(0, 2, kind='cis')])
+    assemblies = [
+        Assembly(components={'X0': X}, bonds=[]),
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(
+            id_=3,
+            components={'M0': M_aux, 'X0': X},
+            bonds=[Bond('M0', 0, 'X0', 0)]),
+    ]
+    loaded = load_assemblies_from_str(dump_assemblies_to_str(assemblies))
+    assert loaded == assemblies
+    assert [a.id_or_none for a in loaded] == [None, 'MX2', 3]
+
+
+def test_build(M, X):
+    M_aux = build_component({
+        'kind': 'M(aux)', 'sites': [0, 1, 2],
+        'aux_edges': [{'sites': [0, 1]}, {'sites': [0, 2], 'kind': 'cis'}]})
+    assert M_aux == Component(
+        kind='M(aux)', sites=[0, 1, 2],
+        aux_edges=[AuxEdge(0, 1), AuxEdge(0, 2, kind='cis')])
+    assert build_component({'kind': 'M', 'sites': [0, 1]}) == M
+
+    assembly = build_assembly(
+        {
+            'id_': 'MX2',
+            'components': {'X0': 'X', 'M0': 'M', 'X1': 'X'},
+            'bonds': [['X0', 0, 'M0', 0], ['M0', 1, 'X1', 0]],
+        },
+        {'M': M, 'X': X})
+    assert assembly == Assembly(
+        id_='MX2',
+        components={'X0': X, 'M0': M, 'X1': X},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)])
+    with pytest.raises(KeyError):
+        build_assembly(
+            {'components': {'L0': 'L'}, 'bonds': []}, {'M': M, 'X': X})
+
+
+def test_scalar_types(M):
+    yaml_str = COMPONENTS_DOC + """---
+- !Assembly
+  components: {'0': M, 1: M}
+  bonds:
+  - ['0', 0, 1, 1]
+  id_: '10'
+"""
+    (assembly,) = load_assemblies_from_str(yaml_str)
+    assert assembly == Assembly(
+        id_='10', components={'0': M, 1: M}, bonds=[Bond('0', 0, 1, 1)])
+    assert assembly.id_ == '10'
+    assert set(assembly.components) == {'0', 1}
+
+
+def test_empty_assembly_list(M, X):
+    assert load_assemblies_from_str(COMPONENTS_DOC + '--- []\n') == []
+    assert load_assemblies_from_str(COMPONENTS_DOC + '---\n') == []
+
+
+def test_iter_is_lazy(M, X):
+    yaml_str = COMPONENTS_DOC + """---
+- !Assembly
+  components: {X0: X}
+  bonds: []
+- this is not an assembly
+"""
+    it = iter_assemblies_from_stream(yaml_str)
+    assert next(it) == Assembly(components={'X0': X}, bonds=[])
+    with pytest.raises(ValueError):
+        next(it)
+
+
+@pytest.mark.parametrize('yaml_str', [
+    '',
+    COMPONENTS_DOC,
+    COMPONENTS_DOC + '--- []\n--- []\n',
+])
+def test_wrong_number_of_documents(yaml_str):
+    with pytest.raises(ValueError, match='Expected exactly 2 YAML documents'):
+        load_assemblies_from_str(yaml_str)
+
+
+def test_unknown_tag():
+    yaml_str = """M: !Unknown
+  kind: M
+---
+[]
+"""
+    with pytest.raises(yaml.YAMLError):
+        load_assemblies_from_str(yaml_str)
+
+
+def test_invalid_syntax():
+    with pytest.raises(yaml.YAMLError):
+        load_assemblies_from_str(
+            COMPONENTS_DOC + '---\n- !Assembly\n  components: {X0: X\n')
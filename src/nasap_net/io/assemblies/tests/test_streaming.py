@@ -0,0 +1,92 @@
+import pytest
+
+from nasap_net.io.assemblies import AssemblyWriter, dump_assemblies_to_str, \
+    iter_assemblies, load_assemblies
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
+from nasap_net.models.component_consistency_check import \
+    InconsistentComponentBetweenAssembliesError
+
+
+@pytest.fixture
+def sample_assemblies():
+    M = Component(kind='M', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    M_aux = Component(
+        kind='M(aux)', sites=[0, 1, 2],
+        aux_edges=[AuxEdge(0, 1), AuxEdge(0, 2, kind='cis')]
+    )
+    return [
+        Assembly(components={'X0': X}, bonds=[]),
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]
+        ),
+        Assembly(
+            components={'M0': M_aux, 'X0': X, 'X1': X, 'X2': X},
+            bonds=[
+                Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'X1', 0),
+                Bond('M0', 2, 'X2', 0)
+            ]
+        ),
+    ]
+
+
+@pytest.mark.parametrize('n', [0, 1, 3])
+def test_writer_output_matches_dump(tmp_path, sample_assemblies, n):
+    file_path = tmp_path / 'assemblies.yaml'
+    with AssemblyWriter(file_path) as writer:
+        for assembly in sample_assemblies[:n]:
+            writer.write(assembly)
+        assert writer.count == n
+    assert file_path.read_text(encoding='utf-8') \
+        == dump_assemblies_to_str(sample_assemblies[:n])
+    assert list(tmp_path.iterdir()) == [file_path]  # no temporary file
+
+
+def test_iter_assemblies(tmp_path, sample_assemblies):
+    file_path = tmp_path / 'assemblies.yaml'
+    with AssemblyWriter(file_path) as writer:
+        writer.write_all(sample_assemblies)
+
+    it = iter_assemblies(file_path)
+    assert next(it) == sample_assemblies[0]
+    assert list(it) == sample_assemblies[1:]
+    assert load_assemblies(file_path) == sample_assemblies
+
+
+def test_writer_aborts_on_exception(tmp_path, sample_assemblies):
+    file_path = tmp_path / 'assemblies.yaml'
+    with pytest.raises(RuntimeError):
+        with AssemblyWriter(file_path) as writer:
+            writer.write(sample_assemblies[0])
+            raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_writer_inconsistent_components(tmp_path):
+    X = Component(kind='X', sites=[0])
+    another_X = Component(kind='X', sites=[0, 1])
+    file_path = tmp_path / 'assemblies.yaml'
+    with pytest.raises(InconsistentComponentBetweenAssembliesError):
+        with AssemblyWriter(file_path) as writer:
+            writer.write(Assembly(components={'X0': X}, bonds=[]))
+            writer.write(Assembly(components={'X0': another_X}, bonds=[]))
+    assert not file_path.exists()
+
+
+def test_writer_overwrite(tmp_path, sample_assemblies):
+    file_path = tmp_path / 'assemblies.yaml'
+    file_path.write_text('existing', encoding='utf-8')
+    with pytest.raises(FileExistsError):
+        AssemblyWriter(file_path)
+    with AssemblyWriter(file_path, overwrite=True) as writer:
+        writer.write_all(sample_assemblies)
+    assert load_assemblies(file_path) == sample_assemblies
+
+
+def test_write_after_close(tmp_path, sample_assemblies):
+    writer = AssemblyWriter(tmp_path / 'assemblies.yaml')
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(sample_assemblies[0])
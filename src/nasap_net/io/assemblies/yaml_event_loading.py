@@ -0,0 +1,265 @@
+"""Single-pass loading of assemblies from the YAML event stream.
+
+The assembly YAML format consists of two documents: a mapping of component
+kinds to ``!Component`` mappings, and a sequence of ``!Assembly`` mappings.
+Instead of composing the whole node tree and constructing Python objects
+from it, `Component`, `Bond` and `Assembly` objects are built directly
+from the parser events, using the libyaml-based ``CSafeLoader``
+when it is available.
+"""
+from collections.abc import Iterator, Mapping
+from typing import IO, Any
+
+import yaml
+from yaml.events import AliasEvent, DocumentEndEvent, DocumentStartEvent, \
+    MappingEndEvent, MappingStartEvent, ScalarEvent, SequenceEndEvent, \
+    SequenceStartEvent, StreamEndEvent, StreamStartEvent
+
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
+
+try:
+    _Loader: type = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    _Loader = yaml.SafeLoader
+
+_COMPONENT_TAG = '!Component'
+_ASSEMBLY_TAG = '!Assembly'
+_STR_TAG = 'tag:yaml.org,2002:str'
+_MAP_TAG = 'tag:yaml.org,2002:map'
+
+
+def iter_assemblies_from_stream(
+        stream: str | bytes | IO,
+) -> Iterator[Assembly]:
+    """Iterate over the assemblies in the YAML assembly format.
+
+    The components document is loaded first; then the assemblies are
+    built and yielded one by one while the second document is parsed,
+    so that the whole document is never held in memory.
+
+    Parameters
+    ----------
+    stream : str | bytes | IO
+        The YAML string, or a file object to read it from.
+
+    Yields
+    ------
+    Assembly
+        The assemblies, in the order of the document.
+
+    Raises
+    ------
+    ValueError
+        If the stream does not consist of exactly 2 YAML documents,
+        or if the documents do not have the expected structure.
+    yaml.YAMLError
+        If the YAML syntax is invalid.
+    """
+    reader = _EventReader(_Loader(stream))
+    try:
+        reader.expect(StreamStartEvent)
+
+        if not reader.check(DocumentStartEvent):
+            raise _document_count_error(0)
+        reader.next()
+        components = reader.read_components()
+        reader.expect(DocumentEndEvent)
+
+        if not reader.check(DocumentStartEvent):
+            raise _document_count_error(1)
+        reader.next()
+        yield from reader.iter_assemblies(components)
+        reader.expect(DocumentEndEvent)
+
+        num_docs = 2
+        while reader.check(DocumentStartEvent):
+            reader.skip_document()
+            num_docs += 1
+        if num_docs != 2:
+            raise _document_count_error(num_docs)
+        reader.expect(StreamEndEvent)
+    finally:
+        reader.dispose()
+
+
+def _document_count_error(num_docs: int) -> ValueError:
+    return ValueError(
+        f"Expected exactly 2 YAML documents, found {num_docs}.")
+
+
+class _EventReader:
+    """Builds Python objects from the events of a YAML loader."""
+    def __init__(self, loader: Any):
+        self._loader = loader
+        # Non-string scalars (e.g., site IDs) repeat a lot.
+        self._scalar_cache: dict[tuple[str, str], Any] = {}
+
+    def dispose(self) -> None:
+        self._loader.dispose()
+
+    def check(self, event_type: type) -> bool:
+        return self._loader.check_event(event_type)
+
+    def next(self) -> yaml.Event:
+        return self._loader.get_event()
+
+    def expect(self, event_type: type) -> yaml.Event:
+        event = self.next()
+        if not isinstance(event, event_type):
+            raise ValueError(
+                f'Expected {event_type.__name__}, found {event}.')
+        return event
+
+    def skip_document(self) -> None:
+        self.expect(DocumentStartEvent)
+        while not self.check(DocumentEndEvent):
+            self.next()
+        self.next()
+
+    def read_components(self) -> dict[str, Component]:
+        """Read the first document: a mapping from kinds to components."""
+        components = self.read_value()
+        if components is None:
+            return {}
+        if not isinstance(components, dict) or not all(
+                isinstance(comp, Component) for comp in components.values()):
+            raise ValueError(
+                'The first document must be a mapping of components.')
+        return components
+
+    def iter_assemblies(
+            self, components: Mapping[str, Component],
+    ) -> Iterator[Assembly]:
+        """Read the second document: a sequence of assemblies."""
+        if self.check(ScalarEvent):  # empty document
+            if self.read_value() is not None:
+                raise ValueError(
+                    'The second document must be a sequence of assemblies.')
+            return
+        self.expect(SequenceStartEvent)
+        while not self.check(SequenceEndEvent):
+            event = self.expect(MappingStartEvent)
+            if event.tag != _ASSEMBLY_TAG:
+                raise ValueError(
+                    f'Expected an {_ASSEMBLY_TAG} mapping, found {event}.')
+            yield build_assembly(self._read_mapping_items(), components)
+        self.next()
+
+    def read_value(self) -> Any:
+        event = self.next()
+        if isinstance(event, ScalarEvent):
+            return self._construct_scalar(event)
+        if isinstance(event, SequenceStartEvent):
+            items = []
+            while not self.check(SequenceEndEvent):
+                items.append(self.read_value())
+            self.next()
+            return items
+        if isinstance(event, MappingStartEvent):
+            mapping = self._read_mapping_items()
+            if event.tag == _COMPONENT_TAG:
+                return build_component(mapping)
+            if event.tag not in (None, '!', _MAP_TAG):
+                raise yaml.constructor.ConstructorError(
+                    None, None,
+                    f'could not determine a constructor for the tag '
+                    f'{event.tag!r}', event.start_mark)
+            return mapping
+        if isinstance(event, AliasEvent):
+            raise ValueError(f'Aliases are not supported: {event}.')
+        raise ValueError(f'Unexpected event: {event}.')
+
+    def _read_mapping_items(self) -> dict:
+        mapping = {}
+        while not self.check(MappingEndEvent):
+            key = self.read_value()
+            mapping[key] = self.read_value()
+        self.next()
+        return mapping
+
+    def _construct_scalar(self, event: ScalarEvent) -> Any:
+        loader = self._loader
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag == _STR_TAG:
+            return event.value
+        key = (tag, event.value)
+        try:
+            return self._scalar_cache[key]
+        except KeyError:
+            pass
+        node = yaml.ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark,
+            style=event.style)
+        value = loader.construct_object(node)
+        if isinstance(value, (int, float, bool)) or value is None:
+            self._scalar_cache[key] = value
+        return value
+
+
+def build_component(mapping: Mapping[str, Any]) -> Component:
+    """Build a component from its mapping in the YAML assembly format.
+
+    Parameters
+    ----------
+    mapping : Mapping[str, Any]
+        The mapping with the keys ``'kind'``, ``'sites'`` and optionally
+        ``'aux_edges'``, a list of mappings with the keys ``'sites'`` (a
+        pair of site IDs) and optionally ``'kind'``.
+
+    Returns
+    -------
+    Component
+        The component.
+
+    Raises
+    ------
+    KeyError
+        If a required key is missing.
+    """
+    aux_edges = []
+    for m in mapping.get('aux_edges', []):
+        site1, site2 = m['sites']
+        aux_edges.append(AuxEdge(site1, site2, kind=m.get('kind')))
+    return Component(
+        kind=mapping['kind'], sites=mapping['sites'], aux_edges=aux_edges)
+
+
+def build_assembly(
+        mapping: Mapping[str, Any], components: Mapping[str, Component],
+) -> Assembly:
+    """Build an assembly from its mapping in the YAML assembly format.
+
+    Parameters
+    ----------
+    mapping : Mapping[str, Any]
+        The mapping with the keys ``'components'`` (component IDs to
+        component kinds), ``'bonds'`` (a list of
+        ``[comp_id1, site_id1, comp_id2, site_id2]``) and optionally
+        ``'id_'``.
+    components : Mapping[str, Component]
+        The components by kind.
+
+    Returns
+    -------
+    Assembly
+        The assembly.
+
+    Raises
+    ------
+    KeyError
+        If a required key is missing, or a component kind is not in
+        `components`.
+    """
+    bonds = []
+    for comp_id1, site_id1, comp_id2, site_id2 in mapping['bonds']:
+        bonds.append(Bond(comp_id1, site_id1, comp_id2, site_id2))
+    return Assembly(
+        components={
+            comp_id: components[comp_kind]
+            for comp_id, comp_kind in mapping['components'].items()
+        },
+        bonds=bonds,
+        id_=mapping.get('id_'),
+    )
@@ -0,0 +1,136 @@
+"""Helpers for the columnar binary formats.
+
+A columnar file is a directory containing one NumPy ``.npy`` file per
+column and a ``meta.json`` file. IDs (which may be int or str) are
+dictionary-encoded: each ID column stores integer codes into an ID table
+kept in ``meta.json``, with -1 standing for None.
+
+``meta.json`` is written last, so that a directory whose writing was
+interrupted is not mistaken for a valid file.
+"""
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from nasap_net.types import ID
+
+META_FILE_NAME = 'meta.json'
+MISSING_CODE = -1
+CODE_DTYPE = np.int32
+
+
+class IDTableBuilder:
+    """Incrementally builds an ID table and encodes IDs into codes."""
+    def __init__(self):
+        self._code_of: dict[tuple[type, ID], int] = {}
+
+    def encode(self, id_: ID | None) -> int:
+        """Return the code of the ID, adding it to the table if new."""
+        if id_ is None:
+            return MISSING_CODE
+        # int and str IDs must not be merged, e.g., 1 and '1'.
+        key = (type(id_), id_)
+        code = self._code_of.get(key)
+        if code is None:
+            code = len(self._code_of)
+            self._code_of[key] = code
+        return code
+
+    def encode_all(self, ids: Iterable[ID | None]) -> npt.NDArray[np.int32]:
+        """Return the codes of the IDs as an array."""
+        return np.fromiter(map(self.encode, ids), dtype=CODE_DTYPE)
+
+    @property
+    def table(self) -> list[ID]:
+        """The IDs in the order of their codes."""
+        return [id_ for (_, id_) in self._code_of]
+
+
+def decode_ids(
+        codes: npt.NDArray[np.integer], table: Sequence[ID],
+) -> list[ID | None]:
+    """Decode codes into IDs; -1 is decoded into None."""
+    lookup = list(table) + [None]  # code -1 refers to the last item
+    return [lookup[code] for code in codes.tolist()]
+
+
+def prepare_directory(
+        dir_path: os.PathLike | str, *, overwrite: bool) -> Path:
+    """Create the directory of a columnar file.
+
+    Raises
+    ------
+    FileExistsError
+        If the path already exists and `overwrite` is False,
+        or if the path exists and is not a directory.
+    """
+    dir_path = Path(dir_path)
+    if dir_path.exists():
+        if not overwrite:
+            raise FileExistsError(
+                f'"{str(dir_path)}" already exists. '
+                'Use `overwrite=True` to overwrite it.'
+            )
+        if not dir_path.is_dir():
+            raise FileExistsError(
+                f'"{str(dir_path)}" exists and is not a directory.')
+        # Invalidate the directory until the new meta file is written.
+        (dir_path / META_FILE_NAME).unlink(missing_ok=True)
+    dir_path.mkdir(parents=True, exist_ok=True)
+    return dir_path
+
+
+def write_column(
+        dir_path: Path, name: str, values: npt.ArrayLike) -> None:
+    """Write a column as a ``.npy`` file."""
+    np.save(dir_path / f'{name}.npy', np.asarray(values), allow_pickle=False)
+
+
+def read_column(
+        dir_path: Path, name: str, *, mmap: bool = True,
+) -> np.ndarray:
+    """Read a column, memory-mapped (read-only) if `mmap` is True."""
+    mmap_mode: Literal['r'] | None = 'r' if mmap else None
+    return np.load(
+        dir_path / f'{name}.npy', mmap_mode=mmap_mode, allow_pickle=False)
+
+
+def write_meta(dir_path: Path, meta: Mapping[str, Any]) -> None:
+    """Write the meta file. Must be called after all columns are written."""
+    (dir_path / META_FILE_NAME).write_text(
+        json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+
+
+def read_meta(
+        dir_path: os.PathLike | str, *, format_name: str,
+        supported_versions: Iterable[int],
+) -> tuple[Path, dict[str, Any]]:
+    """Read and validate the meta file of a columnar file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the directory or its meta file does not exist.
+    ValueError
+        If the format or version of the file is not supported.
+    """
+    dir_path = Path(dir_path)
+    meta_path = dir_path / META_FILE_NAME
+    if not meta_path.exists():
+        raise FileNotFoundError(
+            f'"{str(meta_path)}" does not exist. '
+            'The file may be incomplete or not in the columnar format.'
+        )
+    meta = json.loads(meta_path.read_text(encoding='utf-8'))
+    if meta.get('format') != format_name:
+        raise ValueError(
+            f'"{str(dir_path)}" is not in the "{format_name}" format.')
+    if meta.get('version') not in set(supported_versions):
+        raise ValueError(
+            f'Unsupported version of "{format_name}": {meta.get("version")}')
+    return dir_path, meta
@@ -0,0 +1,71 @@
+"""JSON-compatible encoding of components.
+
+The binary formats store each component kind once, as a mapping::
+
+    {'kind': 'M', 'sites': [0, 1], 'aux_edges': [
+        {'sites': [0, 1], 'kind': 'cis'}]}
+
+The sites and auxiliary edges are sorted, so that equal components are
+always encoded identically.
+"""
+from typing import Any
+
+from nasap_net.models import AuxEdge, Component
+from nasap_net.types import ID
+
+
+def component_to_dict(component: Component) -> dict[str, Any]:
+    """Encode a component as a JSON-compatible mapping.
+
+    Parameters
+    ----------
+    component : Component
+        The component to encode.
+
+    Returns
+    -------
+    dict[str, Any]
+        The mapping with the keys ``'kind'``, ``'sites'`` and
+        ``'aux_edges'``; see `component_from_dict`.
+    """
+    return {
+        'kind': component.kind,
+        'sites': sorted(component.site_ids, key=_id_sort_key),
+        'aux_edges': [
+            {
+                'sites': sorted(aux_edge.site_ids, key=_id_sort_key),
+                'kind': aux_edge.kind,
+            }
+            for aux_edge in sorted(component.aux_edges)
+        ],
+    }
+
+
+def component_from_dict(d: dict[str, Any]) -> Component:
+    """Decode a component encoded by `component_to_dict`.
+
+    Parameters
+    ----------
+    d : dict[str, Any]
+        The mapping with the keys ``'kind'``, ``'sites'`` and
+        ``'aux_edges'``, a list of mappings with the keys ``'sites'``
+        (a pair of site IDs) and ``'kind'``.
+
+    Returns
+    -------
+    Component
+        The component.
+    """
+    return Component(
+        kind=d['kind'],
+        sites=d['sites'],
+        aux_edges=[
+            AuxEdge(*aux_edge['sites'], kind=aux_edge['kind'])
+            for aux_edge in d['aux_edges']
+        ],
+    )
+
+
+def _id_sort_key(id_: ID) -> tuple[str, ID]:
+    # IDs of different types are not comparable with each other.
+    return type(id_).__name__, id_
@@ -0,0 +1,506 @@
+"""SQLite store of a reaction network.
+
+A reaction network (assemblies, reactions, pairs of forward and reverse
+reactions, and reaction classes) is kept in a single SQLite database with
+the following tables:
+
+- ``components``: the definition of each component kind.
+- ``assemblies``: the components and bonds of each assembly, by ID.
+- ``reactions``: the columns of `save_reactions`, indexed by reaction ID
+  and by each of the four assembly IDs.
+- ``reverse_pairs``: the result of `pair_reverse_reactions`.
+- ``reaction_classes``: the class label of each reaction, indexed by class.
+
+Reactions can be queried (e.g., all reactions consuming an assembly)
+without loading the whole network; the matching rows are converted to
+`Reaction` objects one at a time.
+"""
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Self
+
+from nasap_net.io.component_codec import component_from_dict, \
+    component_to_dict
+from nasap_net.models import Assembly, BindingSite, Bond, Component, \
+    Reaction
+from nasap_net.models.component_consistency_check import \
+    check_component_consistency
+from nasap_net.types import ID
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+FORMAT_NAME = 'nasap-net-reaction-network'
+FORMAT_VERSION = 1
+
+_REACTION_COLUMNS = (
+    'id',
+    'init_assem_id',
+    'entering_assem_id',
+    'product_assem_id',
+    'leaving_assem_id',
+    'metal_bs_component',
+    'metal_bs_site',
+    'leaving_bs_component',
+    'leaving_bs_site',
+    'entering_bs_component',
+    'entering_bs_site',
+    'duplicate_count',
+)
+
+# Columns holding IDs have no type affinity, so that int and str IDs
+# are stored as they are.
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value NOT NULL);
+CREATE TABLE components (kind TEXT PRIMARY KEY, definition TEXT NOT NULL);
+CREATE TABLE assemblies (id PRIMARY KEY NOT NULL, structure TEXT NOT NULL);
+CREATE TABLE reactions (
+    key INTEGER PRIMARY KEY,
+    id UNIQUE,
+    init_assem_id NOT NULL REFERENCES assemblies (id),
+    entering_assem_id REFERENCES assemblies (id),
+    product_assem_id NOT NULL REFERENCES assemblies (id),
+    leaving_assem_id REFERENCES assemblies (id),
+    metal_bs_component NOT NULL,
+    metal_bs_site NOT NULL,
+    leaving_bs_component NOT NULL,
+    leaving_bs_site NOT NULL,
+    entering_bs_component NOT NULL,
+    entering_bs_site NOT NULL,
+    duplicate_count INTEGER
+);
+CREATE INDEX reactions_init ON reactions (init_assem_id);
+CREATE INDEX reactions_entering ON reactions (entering_assem_id);
+CREATE INDEX reactions_product ON reactions (product_assem_id);
+CREATE INDEX reactions_leaving ON reactions (leaving_assem_id);
+CREATE TABLE reverse_pairs (
+    reaction_id PRIMARY KEY NOT NULL REFERENCES reactions (id),
+    reverse_id REFERENCES reactions (id)
+);
+CREATE TABLE reaction_classes (
+    reaction_id PRIMARY KEY NOT NULL REFERENCES reactions (id),
+    reaction_class TEXT NOT NULL
+);
+CREATE INDEX reaction_classes_class ON reaction_classes (reaction_class);
+"""
+
+_SELECT_REACTIONS = f'SELECT {", ".join(_REACTION_COLUMNS)} FROM reactions'
+
+
+class ReactionNetworkStore:
+    """SQLite-backed store of assemblies, reactions, pairs and classes.
+
+    Examples
+    --------
+    >>> with ReactionNetworkStore('network.sqlite') as store:  # doctest: +SKIP
+    ...     store.add_assemblies(assemblies)
+    ...     store.add_reactions(enumerate_reactions(assemblies, mle_kinds))
+    ...     for reaction in store.iter_reactions_consuming('M2L2'):
+    ...         print(reaction)
+    """
+    def __init__(
+            self,
+            db_path: os.PathLike | str,
+            *,
+            read_only: bool = False,
+            assembly_cache_size: int | None = 4096,
+    ):
+        """
+        Parameters
+        ----------
+        db_path : os.PathLike | str
+            Path to the SQLite database. If it does not exist, an empty
+            store is created (unless `read_only` is True).
+        read_only : bool, optional
+            If True, open the database in read-only mode. Default is False.
+        assembly_cache_size : int | None, optional
+            Maximum number of assemblies kept decoded in memory while
+            converting rows to `Reaction` objects. If None, the cache is
+            unbounded. Default is 4096.
+
+        Raises
+        ------
+        FileNotFoundError
+            If `read_only` is True and the database does not exist.
+        ValueError
+            If the database is not a reaction network store.
+        """
+        self._db_path = Path(db_path)
+        exists = self._db_path.exists()
+        if read_only:
+            if not exists:
+                raise FileNotFoundError(
+                    f'File "{str(self._db_path)}" does not exist.')
+            self._conn = sqlite3.connect(
+                self._db_path.resolve().as_uri() + '?mode=ro', uri=True)
+        else:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute('PRAGMA foreign_keys = ON')
+
+        if exists:
+            self._validate()
+        else:
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+                self._conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+                    ('format', FORMAT_NAME),
+                    ('version', FORMAT_VERSION),
+                ])
+
+        self._components = {
+            kind: component_from_dict(json.loads(definition))
+            for kind, definition
+            in self._conn.execute('SELECT kind, definition FROM components')
+        }
+        self._get_assembly = lru_cache(maxsize=assembly_cache_size)(
+            self._load_assembly)
+
+    def _validate(self) -> None:
+        try:
+            meta = dict(self._conn.execute('SELECT key, value FROM meta'))
+        except sqlite3.DatabaseError as e:
+            raise ValueError(
+                f'"{str(self._db_path)}" is not a reaction network store.'
+            ) from e
+        if meta.get('format') != FORMAT_NAME:
+            raise ValueError(
+                f'"{str(self._db_path)}" is not a reaction network store.')
+        if meta.get('version') != FORMAT_VERSION:
+            raise ValueError(
+                f'Unsupported version of reaction network store: '
+                f'{meta.get("version")}')
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # ============================================================
+    # Insertion
+    # ============================================================
+
+    def add_assemblies(self, assemblies: Iterable[Assembly]) -> int:
+        """Add assemblies to the store.
+
+        Returns
+        -------
+        int
+            The number of assemblies added.
+
+        Raises
+        ------
+        IDNotSetError
+            If any assembly ID is not set.
+        InconsistentComponentBetweenAssembliesError
+            If the same component kind has different definitions among
+            the given assemblies.
+        ValueError
+            If a component kind has a different definition from the one
+            already stored.
+        sqlite3.IntegrityError
+            If an assembly with the same ID is already stored.
+        """
+        assemblies = list(assemblies)
+        check_component_consistency(assemblies)
+        new_components: dict[str, Component] = {}
+        for assembly in assemblies:
+            for comp in assembly.components.values():
+                stored = self._components.get(comp.kind)
+                if stored is None:
+                    new_components[comp.kind] = comp
+                elif stored != comp:
+                    raise ValueError(
+                        f'Component kind "{comp.kind}" has a different '
+                        f'definition from the one in the store.')
+
+        with self._conn:
+            self._conn.executemany(
+                'INSERT INTO components VALUES (?, ?)',
+                (
+                    (kind, json.dumps(component_to_dict(comp)))
+                    for kind, comp in new_components.items()
+                ))
+            self._conn.executemany(
+                'INSERT INTO assemblies VALUES (?, ?)',
+                (
+                    (assembly.id_, _encode_assembly(assembly))
+                    for assembly in assemblies
+                ))
+        self._components.update(new_components)
+        logger.info('Added %d assemblies to the store', len(assemblies))
+        return len(assemblies)
+
+    def add_reactions(
+            self,
+            reactions: Iterable[Reaction],
+            *,
+            batch_size: int = 10_000,
+    ) -> int:
+        """Add reactions to the store.
+
+        The reactions are consumed and inserted in batches of `batch_size`,
+        so that a stream of reactions (e.g., the iterator returned by
+        `enumerate_reactions`) can be stored without holding it in memory.
+        All the reactions are inserted in a single transaction.
+
+        The assemblies of the reactions must have been added beforehand.
+
+        Returns
+        -------
+        int
+            The number of reactions added.
+
+        Raises
+        ------
+        sqlite3.IntegrityError
+            If an assembly of a reaction is not stored, or if a reaction
+            with the same ID is already stored.
+        """
+        if batch_size <= 0:
+            raise ValueError('batch_size must be a positive integer.')
+        insert = (
+            f'INSERT INTO reactions ({", ".join(_REACTION_COLUMNS)}) '
+            f'VALUES ({", ".join("?" * len(_REACTION_COLUMNS))})')
+        rows = map(_reaction_to_row, reactions)
+        count = 0
+        with self._conn:
+            while batch := list(islice(rows, batch_size)):
+                self._conn.executemany(insert, batch)
+                count += len(batch)
+                logger.debug('Added %d reactions to the store', count)
+        logger.info('Added %d reactions to the store', count)
+        return count
+
+    def add_reverse_pairs(
+            self, reaction_to_reverse: Mapping[ID, ID | None]) -> None:
+        """Add the pairs of forward and reverse reactions.
+
+        Parameters
+        ----------
+        reaction_to_reverse : Mapping[ID, ID | None]
+            A mapping from each reaction ID to its reverse reaction ID,
+            or None, as returned by `pair_reverse_reactions`.
+        """
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO reverse_pairs VALUES (?, ?)',
+                reaction_to_reverse.items())
+
+    def add_reaction_classes(
+            self, reaction_to_class: Mapping[Reaction, str]) -> None:
+        """Add the class labels of reactions.
+
+        Parameters
+        ----------
+        reaction_to_class : Mapping[Reaction, str]
+            Mapping from Reaction objects to their class labels, as passed
+            to `save_classification_result`. The reactions must have IDs.
+        """
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO reaction_classes VALUES (?, ?)',
+                (
+                    (reaction.id_, reaction_class)
+                    for reaction, reaction_class in reaction_to_class.items()
+                ))
+
+    # ============================================================
+    # Queries
+    # ============================================================
+
+    @property
+    def num_assemblies(self) -> int:
+        return self._count('assemblies')
+
+    @property
+    def num_reactions(self) -> int:
+        return self._count('reactions')
+
+    def _count(self, table: str) -> int:
+        (count,) = self._conn.execute(
+            f'SELECT COUNT(*) FROM {table}').fetchone()
+        return count
+
+    def get_assembly(self, assembly_id: ID) -> Assembly:
+        """Return the assembly with the ID.
+
+        Raises
+        ------
+        KeyError
+            If no assembly has the ID.
+        """
+        return self._get_assembly(assembly_id)
+
+    def iter_assemblies(self) -> Iterator[Assembly]:
+        """Iterate over all the assemblies, in insertion order."""
+        for (assembly_id,) in self._conn.execute(
+                'SELECT id FROM assemblies ORDER BY rowid'):
+            yield self._get_assembly(assembly_id)
+
+    def get_reaction(self, reaction_id: ID) -> Reaction:
+        """Return the reaction with the ID.
+
+        Raises
+        ------
+        KeyError
+            If no reaction has the ID.
+        """
+        for reaction in self._iter_reactions('WHERE id = ?', (reaction_id,)):
+            return reaction
+        raise KeyError(reaction_id)
+
+    def iter_reactions(
+            self, *, reaction_class: str | None = None,
+    ) -> Iterator[Reaction]:
+        """Iterate over the reactions, in insertion order.
+
+        Parameters
+        ----------
+        reaction_class : str | None, optional
+            If given, only the reactions of the class are yielded.
+        """
+        if reaction_class is None:
+            return self._iter_reactions('ORDER BY key')
+        return self._iter_reactions(
+            'WHERE id IN (SELECT reaction_id FROM reaction_classes '
+            'WHERE reaction_class = ?) ORDER BY key',
+            (reaction_class,))
+
+    def iter_reactions_consuming(
+            self, assembly_id: ID) -> Iterator[Reaction]:
+        """Iterate over the reactions whose initial or entering assembly
+        is the assembly with the ID.
+        """
+        return self._iter_reactions(
+            'WHERE init_assem_id = ? OR entering_assem_id = ? ORDER BY key',
+            (assembly_id, assembly_id))
+
+    def iter_reactions_producing(
+            self, assembly_id: ID) -> Iterator[Reaction]:
+        """Iterate over the reactions whose product or leaving assembly
+        is the assembly with the ID.
+        """
+        return self._iter_reactions(
+            'WHERE product_assem_id = ? OR leaving_assem_id = ? ORDER BY key',
+            (assembly_id, assembly_id))
+
+    def get_reverse_reaction_id(self, reaction_id: ID) -> ID | None:
+        """Return the ID of the reverse reaction, or None if the reaction
+        has no reverse reaction.
+
+        Raises
+        ------
+        KeyError
+            If no pair is stored for the reaction.
+        """
+        row = self._conn.execute(
+            'SELECT reverse_id FROM reverse_pairs WHERE reaction_id = ?',
+            (reaction_id,)).fetchone()
+        if row is None:
+            raise KeyError(reaction_id)
+        return row[0]
+
+    def get_reaction_class(self, reaction_id: ID) -> str:
+        """Return the class label of the reaction.
+
+        Raises
+        ------
+        KeyError
+            If no class is stored for the reaction.
+        """
+        row = self._conn.execute(
+            'SELECT reaction_class FROM reaction_classes '
+            'WHERE reaction_id = ?',
+            (reaction_id,)).fetchone()
+        if row is None:
+            raise KeyError(reaction_id)
+        return row[0]
+
+    def _iter_reactions(
+            self, clause: str, params: tuple = (),
+    ) -> Iterator[Reaction]:
+        cursor = self._conn.execute(f'{_SELECT_REACTIONS} {clause}', params)
+        for row in cursor:
+            yield self._row_to_reaction(row)
+
+    def _row_to_reaction(self, row: tuple) -> Reaction:
+        (id_, init_id, entering_id, product_id, leaving_id,
+         metal_comp, metal_site, leaving_comp, leaving_site,
+         entering_comp, entering_site, duplicate_count) = row
+        return Reaction(
+            init_assem=self._get_assembly(init_id),
+            entering_assem=(
+                None if entering_id is None
+                else self._get_assembly(entering_id)),
+            product_assem=self._get_assembly(product_id),
+            leaving_assem=(
+                None if leaving_id is None
+                else self._get_assembly(leaving_id)),
+            metal_bs=BindingSite(metal_comp, metal_site),
+            leaving_bs=BindingSite(leaving_comp, leaving_site),
+            entering_bs=BindingSite(entering_comp, entering_site),
+            duplicate_count=duplicate_count,
+            id_=id_,
+        )
+
+    def _load_assembly(self, assembly_id: ID) -> Assembly:
+        row = self._conn.execute(
+            'SELECT structure FROM assemblies WHERE id = ?',
+            (assembly_id,)).fetchone()
+        if row is None:
+            raise KeyError(assembly_id)
+        structure = json.loads(row[0])
+        return Assembly(
+            id_=assembly_id,
+            components={
+                comp_id: self._components[kind]
+                for comp_id, kind in structure['components']
+            },
+            bonds=[Bond(*bond) for bond in structure['bonds']],
+        )
+
+
+def _encode_assembly(assembly: Assembly) -> str:
+    return json.dumps({
+        'components': [
+            [comp_id, comp.kind]
+            for comp_id, comp in assembly.components.items()
+        ],
+        'bonds': [
+            [site1.component_id, site1.site_id,
+             site2.component_id, site2.site_id]
+            for site1, site2 in sorted(assembly.bonds)
+        ],
+    })
+
+
+def _reaction_to_row(reaction: Reaction) -> tuple:
+    return (
+        reaction.id_or_none,
+        reaction.init_assem_id,
+        reaction.entering_assem_id,
+        reaction.product_assem_id,
+        reaction.leaving_assem_id,
+        reaction.metal_bs.component_id,
+        reaction.metal_bs.site_id,
+        reaction.leaving_bs.component_id,
+        reaction.leaving_bs.site_id,
+        reaction.entering_bs.component_id,
+        reaction.entering_bs.site_id,
+        reaction.duplicate_count_or_none,
+    )
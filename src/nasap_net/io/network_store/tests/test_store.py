@@ -0,0 +1,135 @@
+import sqlite3
+
+import pytest
+
+from nasap_net.io import ReactionNetworkStore
+from nasap_net.models import Assembly, BindingSite, Bond, Component, \
+    Reaction
+
+
+@pytest.fixture
+def M():
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L():
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def assemblies(M, L, X):
+    return {
+        # X0(0)-(0)M0(1)-(0)X1
+        'MX2': Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        'L': Assembly(id_='L', components={'L0': L}, bonds=[]),
+        'X': Assembly(id_='X', components={'X0': X}, bonds=[]),
+        # (0)L0(1)-(0)M0(1)-(0)X0
+        1: Assembly(
+            id_=1,
+            components={'L0': L, 'M0': M, 'X0': X},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'X0', 0)]),
+    }
+
+@pytest.fixture
+def reactions(assemblies):
+    forward = Reaction(
+        init_assem=assemblies['MX2'],
+        entering_assem=assemblies['L'],
+        product_assem=assemblies[1],
+        leaving_assem=assemblies['X'],
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('X0', 0),
+        entering_bs=BindingSite('L0', 0),
+        duplicate_count=4,
+        id_='R1',
+    )
+    backward = Reaction(
+        init_assem=assemblies[1],
+        entering_assem=assemblies['X'],
+        product_assem=assemblies['MX2'],
+        leaving_assem=assemblies['L'],
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('L0', 1),
+        entering_bs=BindingSite('X0', 0),
+        duplicate_count=1,
+        id_=2,
+    )
+    return [forward, backward]
+
+@pytest.fixture
+def store_path(tmp_path, assemblies, reactions):
+    db_path = tmp_path / 'network.sqlite'
+    with ReactionNetworkStore(db_path) as store:
+        store.add_assemblies(assemblies.values())
+        assert store.add_reactions(iter(reactions), batch_size=1) == 2
+        store.add_reverse_pairs({'R1': 2, 2: 'R1'})
+        store.add_reaction_classes(
+            {reactions[0]: 'MX->ML', reactions[1]: 'ML->MX'})
+    return db_path
+
+
+def test_round_trip(store_path, assemblies, reactions):
+    with ReactionNetworkStore(store_path, read_only=True) as store:
+        assert store.num_assemblies == 4
+        assert store.num_reactions == 2
+        assert list(store.iter_assemblies()) == list(assemblies.values())
+        assert list(store.iter_reactions()) == reactions
+        assert store.get_assembly(1) == assemblies[1]
+        assert store.get_reaction('R1') == reactions[0]
+        assert store.get_reaction(2).duplicate_count == 1
+        with pytest.raises(KeyError):
+            store.get_reaction('2')  # int and str IDs are distinguished
+
+
+def test_lookups(store_path, reactions):
+    with ReactionNetworkStore(store_path, read_only=True) as store:
+        assert list(store.iter_reactions_consuming('L')) == [reactions[0]]
+        assert list(store.iter_reactions_consuming('X')) == [reactions[1]]
+        assert list(store.iter_reactions_producing('MX2')) == [reactions[1]]
+        assert list(store.iter_reactions_consuming('unknown')) == []
+        assert list(store.iter_reactions(reaction_class='ML->MX')) \
+            == [reactions[1]]
+        assert store.get_reverse_reaction_id('R1') == 2
+        assert store.get_reaction_class(2) == 'ML->MX'
+        with pytest.raises(KeyError):
+            store.get_reaction_class('R3')
+
+
+def test_reactions_without_id(tmp_path, assemblies, reactions):
+    reaction = reactions[0].copy_with(id_=None)
+    with ReactionNetworkStore(tmp_path / 'network.sqlite') as store:
+        store.add_assemblies(assemblies.values())
+        store.add_reactions([reaction, reaction])
+        assert list(store.iter_reactions()) == [reaction, reaction]
+
+
+def test_unknown_assembly(tmp_path, assemblies, reactions):
+    with ReactionNetworkStore(tmp_path / 'network.sqlite') as store:
+        store.add_assemblies([assemblies['MX2'], assemblies['L']])
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_reactions(reactions)
+        assert store.num_reactions == 0  # rolled back
+
+
+def test_inconsistent_component(tmp_path, assemblies):
+    another_X = Component(kind='X', sites=[0, 1])
+    with ReactionNetworkStore(tmp_path / 'network.sqlite') as store:
+        store.add_assemblies(assemblies.values())
+        with pytest.raises(ValueError):
+            store.add_assemblies([
+                Assembly(id_='X*', components={'X0': another_X}, bonds=[])])
+
+
+def test_not_a_store(tmp_path):
+    db_path = tmp_path / 'other.sqlite'
+    sqlite3.connect(db_path).close()
+    with pytest.raises(ValueError):
+        ReactionNetworkStore(db_path)
+    with pytest.raises(FileNotFoundError):
+        ReactionNetworkStore(tmp_path / 'missing.sqlite', read_only=True)
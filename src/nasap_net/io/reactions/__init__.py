@@ -1,2 +1,4 @@
-from .loading import load_reactions
+from .columnar import ReactionColumns, load_reaction_columns, \
+    load_reactions_columnar, save_reactions_columnar
+from .loading import iter_reaction_batches, load_reactions
 from .saving import save_reactions
@@ -0,0 +1,291 @@
+import logging
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+
+from nasap_net.helpers import validate_unique_ids
+from nasap_net.io.columnar import IDTableBuilder, decode_ids, \
+    prepare_directory, read_column, read_meta, write_column, write_meta
+from nasap_net.models import Assembly, BindingSite, Reaction
+from nasap_net.types import ID
+from .const import Column
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+FORMAT_NAME = 'nasap-net-reactions'
+FORMAT_VERSION = 1
+
+# Column -> name of the ID table its codes refer to.
+# Columns mapped to None store plain integers.
+_ID_TABLE_OF_COLUMN: Mapping[Column, str | None] = MappingProxyType({
+    Column.INIT_ASSEM_ID: 'assembly',
+    Column.ENTERING_ASSEM_ID: 'assembly',
+    Column.PRODUCT_ASSEM_ID: 'assembly',
+    Column.LEAVING_ASSEM_ID: 'assembly',
+    Column.METAL_BS_COMPONENT: 'component',
+    Column.METAL_BS_SITE: 'site',
+    Column.LEAVING_BS_COMPONENT: 'component',
+    Column.LEAVING_BS_SITE: 'site',
+    Column.ENTERING_BS_COMPONENT: 'component',
+    Column.ENTERING_BS_SITE: 'site',
+    Column.DUPLICATE_COUNT: None,
+    Column.ID_: 'reaction',
+})
+
+
+@dataclass(frozen=True)
+class ReactionColumns:
+    """Columns of reactions loaded from the columnar format.
+
+    Attributes
+    ----------
+    num_reactions : int
+        The number of reactions.
+    codes : Mapping[str, np.ndarray]
+        Mapping from column names (see `Column`) to integer arrays.
+        ID columns hold codes into the corresponding ID table
+        (-1 for None); the duplicate_count column holds the counts.
+        Arrays are read-only and may be memory-mapped.
+    id_tables : Mapping[str, tuple[ID, ...]]
+        Mapping from the names of the ID tables
+        ('assembly', 'component', 'site', 'reaction') to the IDs.
+    """
+    num_reactions: int
+    codes: Mapping[str, np.ndarray]
+    id_tables: Mapping[str, tuple[ID, ...]]
+
+    def decode(self, column: Column | str) -> list[ID | None] | list[int]:
+        """Return the values of a column as a list of Python objects."""
+        column = Column(column)
+        values = self.codes[column.value]
+        table_name = _ID_TABLE_OF_COLUMN[column]
+        if table_name is None:
+            return values.tolist()
+        return decode_ids(values, self.id_tables[table_name])
+
+
+def save_reactions_columnar(
+        reactions: Iterable[Reaction],
+        dir_path: os.PathLike | str,
+        *,
+        overwrite: bool = False,
+) -> None:
+    """Save reactions in the columnar binary format.
+
+    The reactions are saved into a directory, with one NumPy ``.npy`` file
+    per column (the same columns as `save_reactions`) and a ``meta.json``
+    file. Assembly, component, site and reaction IDs are dictionary-encoded
+    into int32 codes, the tables of which are stored in ``meta.json``.
+
+    Parameters
+    ----------
+    reactions : Iterable[Reaction]
+        Reactions to save.
+    dir_path : os.PathLike | str
+        Path to the directory to write.
+    overwrite : bool, optional
+        If True, overwrite the directory if it already exists.
+        If False, raise an error if the directory already exists.
+        Default is False.
+
+    Raises
+    ------
+    IDNotSetError
+        If any assembly ID in the reactions is not set.
+    DuplicateCountNotSetError
+        If the duplicate count of any reaction is not set.
+    """
+    reactions = list(reactions)
+    dir_path = prepare_directory(dir_path, overwrite=overwrite)
+
+    tables = {
+        name: IDTableBuilder()
+        for name in set(_ID_TABLE_OF_COLUMN.values()) if name is not None}
+    values_of_column = {
+        Column.INIT_ASSEM_ID: [r.init_assem_id for r in reactions],
+        Column.ENTERING_ASSEM_ID: [r.entering_assem_id for r in reactions],
+        Column.PRODUCT_ASSEM_ID: [r.product_assem_id for r in reactions],
+        Column.LEAVING_ASSEM_ID: [r.leaving_assem_id for r in reactions],
+        Column.METAL_BS_COMPONENT: [
+            r.metal_bs.component_id for r in reactions],
+        Column.METAL_BS_SITE: [r.metal_bs.site_id for r in reactions],
+        Column.LEAVING_BS_COMPONENT: [
+            r.leaving_bs.component_id for r in reactions],
+        Column.LEAVING_BS_SITE: [r.leaving_bs.site_id for r in reactions],
+        Column.ENTERING_BS_COMPONENT: [
+            r.entering_bs.component_id for r in reactions],
+        Column.ENTERING_BS_SITE: [r.entering_bs.site_id for r in reactions],
+        Column.DUPLICATE_COUNT: [r.duplicate_count for r in reactions],
+        Column.ID_: [r.id_or_none for r in reactions],
+    }
+
+    for column, values in values_of_column.items():
+        table_name = _ID_TABLE_OF_COLUMN[column]
+        if table_name is None:
+            array = np.asarray(values, dtype=np.int64)
+        else:
+            array = tables[table_name].encode_all(values)
+        write_column(dir_path, column.value, array)
+
+    write_meta(dir_path, {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'num_reactions': len(reactions),
+        'columns': [column.value for column in _ID_TABLE_OF_COLUMN],
+        'id_tables': {
+            name: builder.table for name, builder in sorted(tables.items())},
+    })
+    logger.info(
+        'Saved %d reactions to "%s"', len(reactions), str(dir_path))
+
+
+def load_reaction_columns(
+        dir_path: os.PathLike | str,
+        columns: Iterable[Column | str] | None = None,
+        *,
+        mmap: bool = True,
+) -> ReactionColumns:
+    """Load columns of reactions saved in the columnar binary format,
+    without building Reaction objects.
+
+    Parameters
+    ----------
+    dir_path : os.PathLike | str
+        Path to the directory written by `save_reactions_columnar`.
+    columns : Iterable[Column | str] | None, optional
+        The columns to load. If None, all columns are loaded.
+        Default is None.
+    mmap : bool, optional
+        If True, the columns are memory-mapped instead of being read
+        into memory. Default is True.
+
+    Returns
+    -------
+    ReactionColumns
+        The loaded columns and the ID tables.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the directory or its meta file does not exist.
+    ValueError
+        If the directory is not in the columnar format,
+        or if an unknown column is requested.
+    """
+    dir_path, meta = read_meta(
+        dir_path, format_name=FORMAT_NAME,
+        supported_versions=[FORMAT_VERSION])
+
+    if columns is None:
+        columns = meta['columns']
+    column_names = [Column(column).value for column in columns]
+
+    return ReactionColumns(
+        num_reactions=meta['num_reactions'],
+        codes=MappingProxyType({
+            name: read_column(dir_path, name, mmap=mmap)
+            for name in column_names}),
+        id_tables=MappingProxyType({
+            name: tuple(ids) for name, ids in meta['id_tables'].items()}),
+    )
+
+
+def load_reactions_columnar(
+        dir_path: os.PathLike | str,
+        assemblies: Iterable[Assembly],
+        *,
+        mmap: bool = True,
+) -> list[Reaction]:
+    """Load reactions saved in the columnar binary format.
+
+    Unlike `load_reactions`, no type conversion is needed since the types
+    of the IDs are preserved in the file.
+
+    Parameters
+    ----------
+    dir_path : os.PathLike | str
+        Path to the directory written by `save_reactions_columnar`.
+    assemblies : Iterable[Assembly]
+        Assemblies referred to by the reactions.
+    mmap : bool, optional
+        If True, the columns are memory-mapped instead of being read
+        into memory. Default is True.
+
+    Returns
+    -------
+    list[Reaction]
+        The loaded reactions.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the directory or its meta file does not exist.
+    KeyError
+        If an assembly referred to by the reactions is not found.
+    """
+    assemblies = list(assemblies)
+    validate_unique_ids(assemblies)
+    id_to_assembly = {assembly.id_: assembly for assembly in assemblies}
+
+    cols = load_reaction_columns(dir_path, mmap=mmap)
+
+    # Lookup lists indexed by codes; code -1 refers to the trailing None.
+    assembly_lookup: list[Assembly | None] = [
+        id_to_assembly[id_] for id_ in cols.id_tables['assembly']] + [None]
+    component_lookup = cols.id_tables['component']
+    site_lookup = cols.id_tables['site']
+    reaction_lookup: list[ID | None] = \
+        list(cols.id_tables['reaction']) + [None]
+
+    def codes(column: Column) -> list[int]:
+        return cols.codes[column.value].tolist()
+
+    # Binding sites are shared between reactions.
+    site_cache: dict[tuple[int, int], BindingSite] = {}
+
+    def binding_sites(comp_column: Column, site_column: Column) -> list:
+        result = []
+        for comp_code, site_code in zip(codes(comp_column), codes(site_column)):
+            site = site_cache.get((comp_code, site_code))
+            if site is None:
+                site = BindingSite(
+                    component_lookup[comp_code], site_lookup[site_code])
+                site_cache[(comp_code, site_code)] = site
+            result.append(site)
+        return result
+
+    reactions = [
+        Reaction(
+            init_assem=assembly_lookup[init],  # type: ignore[arg-type]
+            entering_assem=assembly_lookup[entering],
+            product_assem=assembly_lookup[product],  # type: ignore[arg-type]
+            leaving_assem=assembly_lookup[leaving],
+            metal_bs=metal_bs,
+            leaving_bs=leaving_bs,
+            entering_bs=entering_bs,
+            duplicate_count=dup,
+            id_=reaction_lookup[id_code],
+        )
+        for (init, entering, product, leaving,
+             metal_bs, leaving_bs, entering_bs, dup, id_code)
+        in zip(
+            codes(Column.INIT_ASSEM_ID),
+            codes(Column.ENTERING_ASSEM_ID),
+            codes(Column.PRODUCT_ASSEM_ID),
+            codes(Column.LEAVING_ASSEM_ID),
+            binding_sites(Column.METAL_BS_COMPONENT, Column.METAL_BS_SITE),
+            binding_sites(Column.LEAVING_BS_COMPONENT, Column.LEAVING_BS_SITE),
+            binding_sites(
+                Column.ENTERING_BS_COMPONENT, Column.ENTERING_BS_SITE),
+            codes(Column.DUPLICATE_COUNT),
+            codes(Column.ID_),
+        )
+    ]
+
+    logger.info(
+        'Loaded %d reactions from "%s"', len(reactions), str(dir_path))
+    return reactions
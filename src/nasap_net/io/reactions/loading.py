@@ -1,6 +1,6 @@
 import logging
 import os
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Literal
 
@@ -14,6 +14,8 @@ from .models import ReactionRow
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+_REACTION_CLASS_COLUMN = 'reaction_class'
+
 
 def load_reactions(
         file_path: os.PathLike | str,
@@ -37,11 +39,158 @@ def load_reactions(
         file_path,
         index_col=0 if has_index_column else None,
     )
+    reaction_rows = _df_to_reaction_rows(
+        df,
+        assembly_id_type=assembly_id_type,
+        component_id_type=component_id_type,
+        site_id_type=site_id_type,
+        reaction_id_type=reaction_id_type,
+    )
+
+    reactions = [
+        reaction_row_to_reaction(reaction_row, id_to_assembly)
+        for reaction_row in reaction_rows
+    ]
+
+    logger.info('Loaded %d reactions from "%s"', len(reactions), str(file_path))
+
+    return reactions
+
+
+def iter_reaction_batches(
+        file_path: os.PathLike | str,
+        assemblies: Iterable[Assembly],
+        *,
+        batch_size: int = 10_000,
+        assembly_id_type: Literal['str', 'int'] = 'str',
+        component_id_type: Literal['str', 'int'] = 'str',
+        site_id_type: Literal['str', 'int'] = 'str',
+        reaction_id_type: Literal['str', 'int'] = 'str',
+        has_index_column: bool = False,
+        assembly_ids: Iterable[ID] | None = None,
+        reaction_classes: Iterable[str] | None = None,
+        row_filter: Callable[[pd.DataFrame], pd.Series] | None = None,
+) -> Iterator[list[Reaction]]:
+    """Load reactions from a CSV file in batches.
+
+    The CSV file is read in chunks of `batch_size` rows, so that the memory
+    usage is bounded regardless of the size of the file. Each chunk is
+    filtered and converted to Reaction objects before the next chunk is read.
+
+    Parameters
+    ----------
+    file_path : os.PathLike | str
+        Path to the CSV file, written by `save_reactions` or
+        `save_classification_result`.
+    assemblies : Iterable[Assembly]
+        Assemblies referred to by the reactions. Assemblies referred to only
+        by filtered-out reactions may be omitted.
+    batch_size : int, optional
+        The number of rows read at once. Each yielded batch contains at most
+        this number of reactions. Default is 10,000.
+    assembly_id_type, component_id_type, site_id_type, reaction_id_type
+        The types of the IDs; see `load_reactions`.
+    has_index_column : bool, optional
+        Whether the first column of the file is an index column.
+        Default is False.
+    assembly_ids : Iterable[ID] | None, optional
+        If given, only the reactions involving any of these assemblies
+        (as the initial, entering, product or leaving assembly) are loaded.
+        The IDs are compared after conversion to `assembly_id_type`.
+        Default is None.
+    reaction_classes : Iterable[str] | None, optional
+        If given, only the reactions of these classes are loaded.
+        Requires the "reaction_class" column, as in the files written by
+        `save_classification_result`. Default is None.
+    row_filter : Callable[[pd.DataFrame], pd.Series] | None, optional
+        If given, called with each chunk as read by `pandas.read_csv`
+        (before ID type conversion) and must return a boolean mask of the
+        rows to load. Default is None.
+
+    Yields
+    ------
+    list[Reaction]
+        Non-empty batches of reactions, in the order of the file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If `batch_size` is less than 1, or if `reaction_classes` is given
+        but the file has no "reaction_class" column.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+
+    assemblies = list(assemblies)
+    validate_unique_ids(assemblies)
+    id_to_assembly = {assembly.id_: assembly for assembly in assemblies}
+
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f'File "{str(file_path)}" does not exist.')
+
+    assembly_id_set = None if assembly_ids is None else set(assembly_ids)
+    class_set = (
+        None if reaction_classes is None
+        else {str(cls) for cls in reaction_classes})
+
+    total = 0
+    with pd.read_csv(
+            file_path,
+            index_col=0 if has_index_column else None,
+            chunksize=batch_size,
+    ) as reader:
+        for chunk in reader:
+            if class_set is not None:
+                if _REACTION_CLASS_COLUMN not in chunk.columns:
+                    raise ValueError(
+                        f'File "{str(file_path)}" has no '
+                        f'"{_REACTION_CLASS_COLUMN}" column.')
+                chunk = chunk[
+                    chunk[_REACTION_CLASS_COLUMN].astype(str).isin(class_set)]
+            if row_filter is not None:
+                chunk = chunk[row_filter(chunk).to_numpy(dtype=bool)]
+
+            reaction_rows = _df_to_reaction_rows(
+                chunk,
+                assembly_id_type=assembly_id_type,
+                component_id_type=component_id_type,
+                site_id_type=site_id_type,
+                reaction_id_type=reaction_id_type,
+            )
+            if assembly_id_set is not None:
+                reaction_rows = [
+                    row for row in reaction_rows
+                    if _involves_any(row, assembly_id_set)]
+            if not reaction_rows:
+                continue
+
+            batch = [
+                reaction_row_to_reaction(row, id_to_assembly)
+                for row in reaction_rows
+            ]
+            total += len(batch)
+            yield batch
+
+    logger.info('Loaded %d reactions from "%s"', total, str(file_path))
+
+
+def _df_to_reaction_rows(
+        df: pd.DataFrame,
+        *,
+        assembly_id_type: Literal['str', 'int'],
+        component_id_type: Literal['str', 'int'],
+        site_id_type: Literal['str', 'int'],
+        reaction_id_type: Literal['str', 'int'],
+) -> list[ReactionRow]:
+    """Convert rows of a DataFrame read from a reaction CSV file."""
     df = df.astype(object).where(pd.notnull(df), None)  # type: ignore[call-overload]
 
     types = {'int': int, 'str': str}
 
-    reaction_rows = [
+    return [
         ReactionRow.from_dict(
             row,
             assembly_id_type=types[assembly_id_type],
@@ -52,14 +201,17 @@ def load_reactions(
         for row in df.to_dict(orient="records")
     ]
 
-    reactions = [
-        reaction_row_to_reaction(reaction_row, id_to_assembly)
-        for reaction_row in reaction_rows
-    ]
-
-    logger.info('Loaded %d reactions from "%s"', len(reactions), str(file_path))
 
-    return reactions
+def _involves_any(reaction_row: ReactionRow, assembly_ids: set[ID]) -> bool:
+    return any(
+        id_ is not None and id_ in assembly_ids
+        for id_ in (
+            reaction_row.init_assem_id,
+            reaction_row.entering_assem_id,
+            reaction_row.product_assem_id,
+            reaction_row.leaving_assem_id,
+        )
+    )
 
 
 def reaction_row_to_reaction(
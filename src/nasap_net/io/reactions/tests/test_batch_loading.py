@@ -0,0 +1,129 @@
+import pandas as pd
+import pytest
+
+from nasap_net.io import iter_reaction_batches, load_reactions, \
+    save_classification_result, save_reactions
+from nasap_net.models import Assembly, BindingSite, Component, Reaction
+
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def assemblies(X):
+    return [
+        Assembly(id_=f'A{i}', components={'X0': X}, bonds=[])
+        for i in range(5)
+    ]
+
+@pytest.fixture
+def reactions(assemblies):
+    # A0 -> A1, A1 -> A2, ..., A3 -> A4, plus A0 + A4 -> A2 + A3
+    reactions = [
+        Reaction(
+            init_assem=init,
+            entering_assem=None,
+            product_assem=product,
+            leaving_assem=None,
+            metal_bs=BindingSite('X0', 0),
+            leaving_bs=BindingSite('X0', 0),
+            entering_bs=BindingSite('X0', 0),
+            duplicate_count=1,
+            id_=f'R{i}',
+        )
+        for i, (init, product)
+        in enumerate(zip(assemblies[:-1], assemblies[1:]))
+    ]
+    reactions.append(Reaction(
+        init_assem=assemblies[0],
+        entering_assem=assemblies[4],
+        product_assem=assemblies[2],
+        leaving_assem=assemblies[3],
+        metal_bs=BindingSite('X0', 0),
+        leaving_bs=BindingSite('X0', 0),
+        entering_bs=BindingSite('X0', 0),
+        duplicate_count=2,
+        id_='R4',
+    ))
+    return reactions
+
+
+@pytest.fixture
+def reaction_file(tmp_path, reactions):
+    file_path = tmp_path / 'reactions.csv'
+    save_reactions(reactions, file_path)
+    return file_path
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 5, 100])
+def test_batches(reaction_file, assemblies, batch_size):
+    batches = list(iter_reaction_batches(
+        reaction_file, assemblies, batch_size=batch_size, site_id_type='int'))
+    assert all(0 < len(batch) <= batch_size for batch in batches)
+    assert [r for batch in batches for r in batch] == load_reactions(
+        reaction_file, assemblies, site_id_type='int')
+
+
+def test_filter_by_assembly_ids(reaction_file, assemblies, reactions):
+    batches = iter_reaction_batches(
+        reaction_file, assemblies, batch_size=2, site_id_type='int',
+        assembly_ids=['A4'])
+    loaded = [r for batch in batches for r in batch]
+    assert loaded == [reactions[3], reactions[4]]
+
+
+def test_filtered_out_assemblies_can_be_omitted(
+        reaction_file, assemblies, reactions):
+    batches = iter_reaction_batches(
+        reaction_file, assemblies[:2], site_id_type='int',
+        assembly_ids=['A1'], row_filter=lambda df: df['id'] != 'R1')
+    loaded = [r for batch in batches for r in batch]
+    assert loaded == [reactions[0]]
+
+
+def test_filter_by_reaction_class(tmp_path, assemblies, reactions):
+    file_path = tmp_path / 'classification_result.csv'
+    save_classification_result(
+        {r: 'odd' if i % 2 else 'even' for i, r in enumerate(reactions)},
+        file_path)
+    batches = iter_reaction_batches(
+        file_path, assemblies, site_id_type='int',
+        reaction_classes=['odd'])
+    loaded = [r for batch in batches for r in batch]
+    assert loaded == [reactions[1], reactions[3]]
+
+
+def test_reaction_class_column_missing(reaction_file, assemblies):
+    with pytest.raises(ValueError):
+        list(iter_reaction_batches(
+            reaction_file, assemblies, reaction_classes=['odd']))
+
+
+def test_row_filter(reaction_file, assemblies, reactions):
+    batches = iter_reaction_batches(
+        reaction_file, assemblies, site_id_type='int',
+        row_filter=lambda df: df['duplicate_count'] > 1)
+    loaded = [r for batch in batches for r in batch]
+    assert loaded == [reactions[4]]
+
+
+def test_invalid_batch_size(reaction_file, assemblies):
+    with pytest.raises(ValueError):
+        list(iter_reaction_batches(reaction_file, assemblies, batch_size=0))
+
+
+def test_file_not_found(tmp_path, assemblies):
+    with pytest.raises(FileNotFoundError):
+        list(iter_reaction_batches(tmp_path / 'missing.csv', assemblies))
+
+
+def test_empty_file(tmp_path, assemblies):
+    file_path = tmp_path / 'reactions.csv'
+    pd.DataFrame(columns=[
+        'init_assem_id', 'entering_assem_id', 'product_assem_id',
+        'leaving_assem_id', 'metal_bs_component', 'metal_bs_site',
+        'leaving_bs_component', 'leaving_bs_site', 'entering_bs_component',
+        'entering_bs_site', 'duplicate_count', 'id',
+    ]).to_csv(file_path, index=False)
+    assert list(iter_reaction_batches(file_path, assemblies)) == []
@@ -0,0 +1,163 @@
+import numpy as np
+import pytest
+
+from nasap_net.io import load_reactions_columnar, save_reactions_columnar
+from nasap_net.io.reactions import load_reaction_columns
+from nasap_net.io.reactions.const import Column
+from nasap_net.models import Assembly, BindingSite, Bond, Component, Reaction
+
+
+@pytest.fixture
+def M():
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L():
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def MX2(M, X):
+    return Assembly(
+        id_='MX2',
+        components={'X0': X, 'M0': M, 'X1': X},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]
+    )
+
+@pytest.fixture
+def free_L(L):
+    return Assembly(id_='free_L', components={'L0': L}, bonds=[])
+
+@pytest.fixture
+def MLX(M, L, X):
+    return Assembly(
+        id_='MLX',
+        components={'X0': X, 'M0': M, 'L0': L},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'L0', 0)],
+    )
+
+@pytest.fixture
+def free_X(X):
+    return Assembly(id_='free_X', components={'X0': X}, bonds=[])
+
+@pytest.fixture
+def assemblies(MX2, free_L, MLX, free_X):
+    return [MX2, free_L, MLX, free_X]
+
+@pytest.fixture
+def reactions(MX2, free_L, MLX, free_X):
+    return [
+        Reaction(
+            init_assem=MX2,
+            entering_assem=free_L,
+            product_assem=MLX,
+            leaving_assem=free_X,
+            metal_bs=BindingSite('M0', 0),
+            leaving_bs=BindingSite('X0', 0),
+            entering_bs=BindingSite('L0', 0),
+            duplicate_count=4,
+            id_='R1',
+        ),
+        Reaction(
+            init_assem=MLX,
+            entering_assem=free_X,
+            product_assem=MX2,
+            leaving_assem=free_L,
+            metal_bs=BindingSite('M0', 1),
+            leaving_bs=BindingSite('L0', 0),
+            entering_bs=BindingSite('X0', 0),
+            duplicate_count=1,
+            id_=None,
+        ),
+    ]
+
+
+def test_round_trip(tmp_path, reactions, assemblies):
+    dir_path = tmp_path / 'reactions'
+    save_reactions_columnar(reactions, dir_path)
+    loaded = load_reactions_columnar(dir_path, assemblies)
+    assert loaded == reactions
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_round_trip_mmap(tmp_path, reactions, assemblies, mmap):
+    dir_path = tmp_path / 'reactions'
+    save_reactions_columnar(reactions, dir_path)
+    assert load_reactions_columnar(dir_path, assemblies, mmap=mmap) \
+        == reactions
+
+
+def test_types_preserved(tmp_path):
+    comp = Component(kind='kind', sites=[100, '100'])
+    int_assem = Assembly(id_=300, components={200: comp}, bonds=[])
+    str_assem = Assembly(id_='300', components={'200': comp}, bonds=[])
+    reactions = [
+        Reaction(
+            init_assem=int_assem,
+            entering_assem=None,
+            product_assem=int_assem,
+            leaving_assem=None,
+            metal_bs=BindingSite(200, 100),
+            leaving_bs=BindingSite(200, 100),
+            entering_bs=BindingSite(200, 100),
+            duplicate_count=1,
+            id_=400,
+        ),
+        Reaction(
+            init_assem=str_assem,
+            entering_assem=None,
+            product_assem=str_assem,
+            leaving_assem=None,
+            metal_bs=BindingSite('200', '100'),
+            leaving_bs=BindingSite('200', '100'),
+            entering_bs=BindingSite('200', '100'),
+            duplicate_count=1,
+            id_='400',
+        ),
+    ]
+    dir_path = tmp_path / 'reactions'
+    save_reactions_columnar(reactions, dir_path)
+    loaded = load_reactions_columnar(dir_path, [int_assem, str_assem])
+    assert loaded == reactions
+    assert loaded[0].id_ == 400
+    assert loaded[1].id_ == '400'
+
+
+def test_selective_columns(tmp_path, reactions):
+    dir_path = tmp_path / 'reactions'
+    save_reactions_columnar(reactions, dir_path)
+
+    cols = load_reaction_columns(
+        dir_path, [Column.INIT_ASSEM_ID, 'duplicate_count'])
+    assert cols.num_reactions == 2
+    assert set(cols.codes) == {'init_assem_id', 'duplicate_count'}
+    assert isinstance(cols.codes['init_assem_id'], np.memmap)
+    assert cols.decode('init_assem_id') == ['MX2', 'MLX']
+    assert cols.decode(Column.DUPLICATE_COUNT) == [4, 1]
+    assert set(cols.id_tables['assembly']) \
+        == {'MX2', 'free_L', 'MLX', 'free_X'}
+
+
+def test_missing_values_decoded_to_none(tmp_path, reactions):
+    dir_path = tmp_path / 'reactions'
+    save_reactions_columnar(reactions, dir_path)
+    cols = load_reaction_columns(dir_path, [Column.ID_])
+    assert cols.codes['id'].tolist() == [0, -1]
+    assert cols.decode(Column.ID_) == ['R1', None]
+
+
+def test_overwrite(tmp_path, reactions, assemblies):
+    dir_path = tmp_path / 'reactions'
+    save_reactions_columnar(reactions, dir_path)
+    with pytest.raises(FileExistsError):
+        save_reactions_columnar(reactions[:1], dir_path)
+    save_reactions_columnar(reactions[:1], dir_path, overwrite=True)
+    assert load_reactions_columnar(dir_path, assemblies) == reactions[:1]
+
+
+def test_not_found(tmp_path, assemblies):
+    with pytest.raises(FileNotFoundError):
+        load_reactions_columnar(tmp_path / 'missing', assemblies)
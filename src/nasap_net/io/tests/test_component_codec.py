@@ -0,0 +1,32 @@
+import json
+
+from nasap_net.io.component_codec import component_from_dict, \
+    component_to_dict
+from nasap_net.models import AuxEdge, Component
+
+
+def test_round_trip():
+    components = [
+        Component(kind='X', sites=[0]),
+        Component(
+            kind='M', sites=[3, 1, 2, 0],
+            aux_edges=[AuxEdge(1, 0), AuxEdge(2, 3, kind='cis')]),
+        Component(kind='L', sites=['b', 'a', 0]),
+    ]
+    for component in components:
+        encoded = json.loads(json.dumps(component_to_dict(component)))
+        assert component_from_dict(encoded) == component
+
+
+def test_to_dict_is_sorted():
+    component = Component(
+        kind='M', sites=[2, 'a', 1, 0],
+        aux_edges=[AuxEdge(2, 1, kind='cis'), AuxEdge(1, 0)])
+    assert component_to_dict(component) == {
+        'kind': 'M',
+        'sites': [0, 1, 2, 'a'],
+        'aux_edges': [
+            {'sites': [0, 1], 'kind': None},
+            {'sites': [1, 2], 'kind': 'cis'},
+        ],
+    }
@@ -1,3 +1,4 @@
+from .batch import find_all_isomorphic_among, find_isomorphic_among
 from .exceptions import IsomorphismNotFoundError
 from .get_isomorphism import get_all_isomorphisms, get_isomorphism
 from .is_isomorphic import is_isomorphic
@@ -0,0 +1,182 @@
+"""Isomorphism checks of one assembly against many candidates.
+
+`is_isomorphic` converts both assemblies to graphs and colors them on
+every call. When a target is compared with many candidates (e.g., the
+assemblies sharing its signature), the target is instead prepared once,
+and the prepared graphs of the candidates are cached, so that each
+comparison reduces to a comparison of color multisets followed by VF2.
+"""
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+
+import igraph as ig
+
+from nasap_net.graph import convert_assembly_to_graph, refine_vertex_colors
+from nasap_net.models import Assembly
+from nasap_net.profiling import count
+
+PREPARED_ASSEMBLY_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True, eq=False)
+class _PreparedAssembly:
+    graph: ig.Graph
+    v_colors: list[int]
+    e_colors: list[int]
+    # Sorted colors; different multisets mean non-isomorphic graphs.
+    color_key: tuple[tuple[int, ...], tuple[int, ...]]
+
+
+@lru_cache(maxsize=PREPARED_ASSEMBLY_CACHE_SIZE)
+def _prepare(assembly: Assembly, refine: bool) -> _PreparedAssembly:
+    g = convert_assembly_to_graph(assembly).graph
+    # Colors are hashes, comparable between graphs within a process.
+    if refine:
+        v_colors = refine_vertex_colors(g)
+    else:
+        v_colors = [
+            hash(color) for color
+            in zip(g.vs['core_or_site'], g.vs['comp_kind'])]
+    if 'aux_kind' in g.es.attributes():
+        e_colors = [hash(kind) for kind in g.es['aux_kind']]
+    else:
+        e_colors = [hash(None)] * g.ecount()
+    return _PreparedAssembly(
+        graph=g,
+        v_colors=v_colors,
+        e_colors=e_colors,
+        color_key=(tuple(sorted(v_colors)), tuple(sorted(e_colors))),
+    )
+
+
+def _prepared_isomorphic(
+        p1: _PreparedAssembly, p2: _PreparedAssembly) -> bool:
+    if p1.color_key != p2.color_key:
+        count('vf2.rejected_by_colors')
+        return False
+    result = p1.graph.isomorphic_vf2(
+        p2.graph,
+        color1=p1.v_colors,
+        color2=p2.v_colors,
+        edge_color1=p1.e_colors,
+        edge_color2=p2.e_colors,
+    )
+    count('vf2.isomorphic' if result else 'vf2.not_isomorphic')
+    return result
+
+
+def find_isomorphic_among(
+        target: Assembly,
+        candidates: Iterable[Assembly],
+        *,
+        refine: bool = False,
+        num_workers: int | None = None,
+        chunksize: int = 64,
+) -> Assembly | None:
+    """Return the first candidate isomorphic to the target.
+
+    Parameters
+    ----------
+    target : Assembly
+        The assembly to find isomorphic candidates for.
+    candidates : Iterable[Assembly]
+        The candidates, checked in order.
+    refine : bool, optional
+        If True, the refined vertex colors are used
+        (see `color_vertices_and_edges`). Default is False.
+    num_workers : int | None, optional
+        The number of worker processes. If None or 1, the candidates are
+        checked in the current process. Otherwise, they are dispatched to
+        a process pool in chunks of `chunksize` candidates; this only pays
+        off for large numbers of large candidates. Default is None.
+    chunksize : int, optional
+        The number of candidates sent to a worker at once in parallel mode.
+        Default is 64.
+
+    Returns
+    -------
+    Assembly | None
+        The first isomorphic candidate, or None if there is none.
+    """
+    for match in _iter_matches(
+            target, candidates, refine=refine, num_workers=num_workers,
+            chunksize=chunksize, first_only=True):
+        return match
+    return None
+
+
+def find_all_isomorphic_among(
+        target: Assembly,
+        candidates: Iterable[Assembly],
+        *,
+        refine: bool = False,
+        num_workers: int | None = None,
+        chunksize: int = 64,
+) -> list[Assembly]:
+    """Return all the candidates isomorphic to the target, in order.
+
+    See `find_isomorphic_among` for the parameters.
+    """
+    return list(_iter_matches(
+        target, candidates, refine=refine, num_workers=num_workers,
+        chunksize=chunksize, first_only=False))
+
+
+def _iter_matches(
+        target: Assembly,
+        candidates: Iterable[Assembly],
+        *,
+        refine: bool,
+        num_workers: int | None,
+        chunksize: int,
+        first_only: bool,
+) -> Iterator[Assembly]:
+    if num_workers is not None and num_workers < 1:
+        raise ValueError("num_workers must be a positive integer")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
+    if num_workers is None or num_workers == 1:
+        prepared_target = _prepare(target, refine)
+        for candidate in candidates:
+            if _prepared_isomorphic(
+                    prepared_target, _prepare(candidate, refine)):
+                yield candidate
+        return
+
+    chunks = _chunked(candidates, chunksize)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        results = executor.map(
+            _match_chunk,
+            ((target, chunk, refine, first_only) for chunk in chunks))
+        try:
+            for matches in results:
+                yield from matches
+                if first_only and matches:
+                    return
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def _match_chunk(
+        args: tuple[Assembly, list[Assembly], bool, bool],
+) -> list[Assembly]:
+    target, chunk, refine, first_only = args
+    prepared_target = _prepare(target, refine)
+    matches = []
+    for candidate in chunk:
+        if _prepared_isomorphic(prepared_target, _prepare(candidate, refine)):
+            matches.append(candidate)
+            if first_only:
+                break
+    return matches
+
+
+def _chunked(
+        items: Iterable[Assembly], size: int) -> Iterator[list[Assembly]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
@@ -1,13 +1,26 @@
 from nasap_net.graph import color_vertices_and_edges, \
     convert_assembly_to_graph, decode_mapping
 from nasap_net.models import Assembly
+from nasap_net.profiling import profiled
 from .exceptions import IsomorphismNotFoundError
 from .models import Isomorphism
 from .utils import reverse_mapping_seq
 
 
-def get_isomorphism(assem1: Assembly, assem2: Assembly) -> Isomorphism:
-    """Get an isomorphism between two assemblies."""
+@profiled('get_isomorphism')
+def get_isomorphism(
+        assem1: Assembly, assem2: Assembly, *, refine: bool = False,
+) -> Isomorphism:
+    """Get an isomorphism between two assemblies.
+
+    If `refine` is True, the vertex colors are refined before running VF2
+    (see `color_vertices_and_edges`). Default is False.
+
+    Raises
+    ------
+    IsomorphismNotFoundError
+        If the assemblies are not isomorphic.
+    """
     conv_res1 = convert_assembly_to_graph(assem1)
     conv_res2 = convert_assembly_to_graph(assem2)
 
@@ -15,12 +28,12 @@ def get_isomorphism(assem1: Assembly, assem2: Assembly) -> Isomorphism:
     g2 = conv_res2.graph
 
     try:
-        colors = color_vertices_and_edges(g1, g2)
+        colors = color_vertices_and_edges(g1, g2, refine=refine)
     except IsomorphismNotFoundError:
         raise IsomorphismNotFoundError() from None
 
     mapping: list[int]
-    _, mapping, _ = g1.isomorphic_vf2(
+    found, mapping, _ = g1.isomorphic_vf2(
         g2,
         color1=colors.v_color1,
         color2=colors.v_color2,
@@ -28,19 +41,28 @@ def get_isomorphism(assem1: Assembly, assem2: Assembly) -> Isomorphism:
         edge_color2=colors.e_color2,
         return_mapping_12=True,
     )
+    if not found:
+        raise IsomorphismNotFoundError()
 
     return decode_mapping(mapping, conv_res1, conv_res2)
 
 
+@profiled('get_all_isomorphisms')
 def get_all_isomorphisms(
-        assem1: Assembly, assem2: Assembly
+        assem1: Assembly, assem2: Assembly, *, refine: bool = False,
 ) -> set[Isomorphism]:
-    """Get all isomorphisms between two assemblies."""
+    """Get all isomorphisms between two assemblies.
+
+    If `refine` is True, the vertex colors are refined before running VF2
+    (see `color_vertices_and_edges`); the result is the same.
+    Default is False.
+    """
     conv_res1 = convert_assembly_to_graph(assem1)
     conv_res2 = convert_assembly_to_graph(assem2)
 
     try:
-        colors = color_vertices_and_edges(conv_res1.graph, conv_res2.graph)
+        colors = color_vertices_and_edges(
+            conv_res1.graph, conv_res2.graph, refine=refine)
     except IsomorphismNotFoundError:
         raise IsomorphismNotFoundError() from None
 
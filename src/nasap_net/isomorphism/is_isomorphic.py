@@ -1,22 +1,37 @@
 from nasap_net.graph import color_vertices_and_edges, \
     convert_assembly_to_graph
 from nasap_net.models import Assembly
+from nasap_net.profiling import count, profiled
 from .exceptions import IsomorphismNotFoundError
 
 
-def is_isomorphic(assem1: Assembly, assem2: Assembly) -> bool:
+@profiled('is_isomorphic')
+def is_isomorphic(
+        assem1: Assembly, assem2: Assembly, *, refine: bool = False,
+) -> bool:
+    """Check if two assemblies are isomorphic.
+
+    If `refine` is True, the vertex colors are refined before running VF2
+    (see `color_vertices_and_edges`), which prunes the search and rejects
+    most non-isomorphic pairs without running VF2. This pays off for large
+    or highly symmetric assemblies; for small ones, the refinement costs
+    more than it saves. Default is False.
+    """
     g1 = convert_assembly_to_graph(assem1).graph
     g2 = convert_assembly_to_graph(assem2).graph
 
     try:
-        colors = color_vertices_and_edges(g1, g2)
+        colors = color_vertices_and_edges(g1, g2, refine=refine)
     except IsomorphismNotFoundError:
+        count('vf2.rejected_by_colors')
         return False
 
-    return g1.isomorphic_vf2(
+    result = g1.isomorphic_vf2(
         g2,
         color1=colors.v_color1,
         color2=colors.v_color2,
         edge_color1=colors.e_color1,
         edge_color2=colors.e_color2,
     )
+    count('vf2.isomorphic' if result else 'vf2.not_isomorphic')
+    return result
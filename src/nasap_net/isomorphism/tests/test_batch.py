@@ -0,0 +1,73 @@
+import pytest
+
+from nasap_net.isomorphism import find_all_isomorphic_among, \
+    find_isomorphic_among
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
+
+
+@pytest.fixture
+def M():
+    return Component(
+        kind='M', sites=[0, 1, 2, 3],
+        aux_edges=[
+            AuxEdge(0, 1, 'cis'), AuxEdge(1, 2, 'cis'),
+            AuxEdge(2, 3, 'cis'), AuxEdge(3, 0, 'cis'),
+        ])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def candidates(M, X):
+    def MX2(id_, site1, site2):
+        return Assembly(
+            id_=id_,
+            components={'M0': M, 'X0': X, 'X1': X},
+            bonds=[Bond('M0', site1, 'X0', 0), Bond('M0', site2, 'X1', 0)])
+    return [
+        MX2('trans1', 0, 2),
+        MX2('cis1', 0, 1),
+        MX2('trans2', 1, 3),
+        MX2('cis2', 2, 3),
+        Assembly(id_='MX', components={'M0': M, 'X0': X},
+                 bonds=[Bond('M0', 0, 'X0', 0)]),
+    ]
+
+@pytest.fixture
+def target(M, X):
+    # cis
+    return Assembly(
+        components={'M9': M, 'X8': X, 'X9': X},
+        bonds=[Bond('M9', 3, 'X8', 0), Bond('M9', 0, 'X9', 0)])
+
+
+@pytest.mark.parametrize('refine', [False, True])
+def test_find_isomorphic_among(target, candidates, refine):
+    match = find_isomorphic_among(target, candidates, refine=refine)
+    assert match is not None and match.id_ == 'cis1'
+    assert find_isomorphic_among(target, candidates[2:]).id_ == 'cis2'
+    assert find_isomorphic_among(target, candidates[4:]) is None
+    assert find_isomorphic_among(target, []) is None
+
+
+@pytest.mark.parametrize('refine', [False, True])
+def test_find_all_isomorphic_among(target, candidates, refine):
+    matches = find_all_isomorphic_among(target, candidates, refine=refine)
+    assert [m.id_ for m in matches] == ['cis1', 'cis2']
+
+
+def test_parallel(target, candidates):
+    matches = find_all_isomorphic_among(
+        target, candidates, num_workers=2, chunksize=1)
+    assert [m.id_ for m in matches] == ['cis1', 'cis2']
+    match = find_isomorphic_among(
+        target, iter(candidates), num_workers=2, chunksize=2)
+    assert match.id_ == 'cis1'
+
+
+def test_invalid_arguments(target, candidates):
+    with pytest.raises(ValueError):
+        find_isomorphic_among(target, candidates, num_workers=0)
+    with pytest.raises(ValueError):
+        find_isomorphic_among(target, candidates, chunksize=0)
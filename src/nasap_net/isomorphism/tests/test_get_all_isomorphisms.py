@@ -72,3 +72,15 @@ def test_mlx():
             })
         ),
     }
+
+
+def test_refine_gives_same_isomorphisms():
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    # M2L2 ring: //-(0)M0(1)-(0)L0(1)-(0)M1(1)-(0)L1(1)-//
+    ring = Assembly(
+        components={'M0': M, 'L0': L, 'M1': M, 'L1': L},
+        bonds=[Bond('M0', 1, 'L0', 0), Bond('L0', 1, 'M1', 0),
+               Bond('M1', 1, 'L1', 0), Bond('L1', 1, 'M0', 0)])
+    assert get_all_isomorphisms(ring, ring, refine=True) \
+        == get_all_isomorphisms(ring, ring)
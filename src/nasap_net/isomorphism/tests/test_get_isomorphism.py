@@ -1,4 +1,6 @@
-from nasap_net.isomorphism import get_isomorphism
+import pytest
+
+from nasap_net.isomorphism import IsomorphismNotFoundError, get_isomorphism
 from nasap_net.models import Assembly, BindingSite, Bond, Component
 
 
@@ -23,3 +25,20 @@ def test_get_isomorphism():
         BindingSite('L1', 1): BindingSite('L2', 1),
         BindingSite('X1', 0): BindingSite('X2', 0),
     }
+
+
+@pytest.mark.parametrize('refine', [False, True])
+def test_not_isomorphic(refine):
+    M = Component(kind='M', sites=[0, 1, 2])
+    X = Component(kind='X', sites=[0])
+    L = Component(kind='L', sites=[0, 1])
+    # X0(0)-(0)M0(1)-(0)L0(1)
+    MLX = Assembly(
+        components={'M0': M, 'L0': L, 'X0': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'L0', 0)])
+    # (1)M0(0)-(0)L0(1)-(0)X0
+    another = Assembly(
+        components={'M0': M, 'L0': L, 'X0': X},
+        bonds=[Bond('M0', 0, 'L0', 0), Bond('L0', 1, 'X0', 0)])
+    with pytest.raises(IsomorphismNotFoundError):
+        get_isomorphism(MLX, another, refine=refine)
@@ -1,5 +1,9 @@
-from nasap_net.isomorphism import is_isomorphic
-from nasap_net.models import Assembly, Bond, Component
+import pytest
+
+from nasap_net.graph import color_vertices_and_edges, \
+    convert_assembly_to_graph
+from nasap_net.isomorphism import IsomorphismNotFoundError, is_isomorphic
+from nasap_net.models import Assembly, AuxEdge, Bond, Component
 
 
 def test():
@@ -46,3 +50,45 @@ def test_different_component_kinds():
         components={'M1': FAKE_M, 'X1': X}, bonds=[Bond('M1', 0, 'X1', 0)])
 
     assert not is_isomorphic(MX, FAKE_MX)
+
+
+def test_refine():
+    M = Component(
+        kind='M', sites=[0, 1, 2, 3],
+        aux_edges=[
+            AuxEdge(0, 1, 'cis'), AuxEdge(1, 2, 'cis'),
+            AuxEdge(2, 3, 'cis'), AuxEdge(3, 0, 'cis'),
+        ])
+    X = Component(kind='X', sites=[0])
+    cis_MX2 = Assembly(
+        components={'M0': M, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'X1', 0)])
+    another_cis_MX2 = Assembly(
+        components={'M0': M, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 2, 'X0', 0), Bond('M0', 3, 'X1', 0)])
+    trans_MX2 = Assembly(
+        components={'M0': M, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 2, 'X1', 0)])
+
+    assert is_isomorphic(cis_MX2, another_cis_MX2, refine=True)
+    assert not is_isomorphic(cis_MX2, trans_MX2, refine=True)
+
+
+def test_refined_colors_reject_before_vf2():
+    M = Component(
+        kind='M', sites=[0, 1, 2, 3],
+        aux_edges=[
+            AuxEdge(0, 1, 'cis'), AuxEdge(1, 2, 'cis'),
+            AuxEdge(2, 3, 'cis'), AuxEdge(3, 0, 'cis'),
+        ])
+    X = Component(kind='X', sites=[0])
+    g_cis = convert_assembly_to_graph(Assembly(
+        components={'M0': M, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'X1', 0)])).graph
+    g_trans = convert_assembly_to_graph(Assembly(
+        components={'M0': M, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 2, 'X1', 0)])).graph
+
+    color_vertices_and_edges(g_cis, g_trans)  # not rejected by kinds only
+    with pytest.raises(IsomorphismNotFoundError):
+        color_vertices_and_edges(g_cis, g_trans, refine=True)
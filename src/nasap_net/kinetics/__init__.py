@@ -0,0 +1,3 @@
+from .rate_equation import MassActionRateEquation, build_rate_equation
+from .stoichiometry import NO_INDEX, StoichiometryMatrix, \
+    build_stoichiometry_matrix
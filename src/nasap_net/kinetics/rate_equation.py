@@ -0,0 +1,229 @@
+"""Vectorised mass-action rate equations of a reaction network.
+
+The rate of reaction ``j`` is ``k_j * c[a] * c[b]`` for its initial
+assembly ``a`` and entering assembly ``b`` (``k_j * c[a]`` for
+intramolecular reactions), where ``k_j`` is the rate constant of the class
+of the reaction multiplied by its duplicate count (the statistical factor).
+"""
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+from nasap_net.models import Assembly, Reaction
+from .stoichiometry import NO_INDEX, StoichiometryMatrix, \
+    build_stoichiometry_matrix
+
+
+class MassActionRateEquation:
+    """Right-hand side and Jacobian of the mass-action rate equations.
+
+    All evaluations are vectorised over the reactions, so that the
+    equations of large networks can be integrated with any ODE integrator
+    taking ``fun(t, y)`` and ``jac(t, y)``, e.g.,
+    ``scipy.integrate.solve_ivp(eq.rhs, t_span, c0, jac=eq.jacobian)``.
+
+    Use `build_rate_equation` to build it from classified reactions.
+    """
+    def __init__(
+            self,
+            matrix: StoichiometryMatrix,
+            reaction_classes: Sequence[str],
+            rate_constants: Mapping[str, float],
+    ):
+        """
+        Parameters
+        ----------
+        matrix : StoichiometryMatrix
+            The stoichiometry matrix of the network.
+        reaction_classes : Sequence[str]
+            The class of each reaction (column) of `matrix`.
+        rate_constants : Mapping[str, float]
+            The rate constant of each reaction class.
+
+        Raises
+        ------
+        ValueError
+            If the number of reaction classes differs from the number of
+            reactions.
+        KeyError
+            If no rate constant is given for a reaction class.
+        """
+        num_assemblies, num_reactions = matrix.shape
+        if len(reaction_classes) != num_reactions:
+            raise ValueError(
+                'The number of reaction classes does not match '
+                'the number of reactions.')
+        self._matrix = matrix
+        self._classes, self._class_codes = np.unique(
+            np.array(reaction_classes, dtype=object), return_inverse=True)
+        self._rate_constants = self._to_rate_constants(rate_constants)
+
+        # Nonzero entries of the stoichiometry matrix (row, column, value)
+        self._entry_rows = np.repeat(
+            np.arange(num_assemblies), np.diff(matrix.indptr))
+        self._entry_cols = matrix.indices
+        self._entry_data = matrix.data.astype(np.float64)
+
+        # Index num_assemblies refers to the padded concentration 1.0,
+        # standing for the missing entering assembly.
+        self._reactants = np.where(
+            matrix.reactant_indices == NO_INDEX,
+            num_assemblies, matrix.reactant_indices)
+
+        # Jacobian entries: for each stoichiometry entry (i, j) and each
+        # reactant slot s of reaction j, d(dc_i/dt)/dc_m with m the
+        # assembly in slot s. Entries with the same (i, m) are merged
+        # into a fixed sparsity pattern.
+        has_slot = self._reactants[self._entry_cols] != num_assemblies
+        self._jac_entry = np.repeat(
+            np.arange(len(self._entry_cols)), 2)[has_slot.ravel()]
+        self._jac_slot = np.tile([0, 1], len(self._entry_cols))[
+            has_slot.ravel()]
+        jac_rows = self._entry_rows[self._jac_entry]
+        jac_cols = self._reactants[
+            self._entry_cols[self._jac_entry], self._jac_slot]
+        keys, self._jac_inverse = np.unique(
+            jac_rows * num_assemblies + jac_cols, return_inverse=True)
+        self._jac_indices = keys % max(num_assemblies, 1)
+        self._jac_indptr = np.zeros(num_assemblies + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(
+                keys // max(num_assemblies, 1), minlength=num_assemblies),
+            out=self._jac_indptr[1:])
+
+    def _to_rate_constants(
+            self, rate_constants: Mapping[str, float],
+    ) -> npt.NDArray[np.float64]:
+        missing = [c for c in self._classes if c not in rate_constants]
+        if missing:
+            raise KeyError(
+                f'No rate constants given for the reaction classes: '
+                f'{missing}')
+        class_constants = np.array(
+            [rate_constants[c] for c in self._classes], dtype=np.float64)
+        return (
+            class_constants[self._class_codes]
+            * self._matrix.duplicate_counts)
+
+    @property
+    def matrix(self) -> StoichiometryMatrix:
+        return self._matrix
+
+    @property
+    def num_assemblies(self) -> int:
+        return self._matrix.shape[0]
+
+    @property
+    def rate_constants(self) -> npt.NDArray[np.float64]:
+        """The rate constant of each reaction, including the duplicate
+        count."""
+        return self._rate_constants
+
+    def with_rate_constants(self, rate_constants: Mapping[str, float]) -> Self:
+        """Return a copy with different rate constants of the classes.
+
+        The precomputed index arrays are shared, so this is cheap enough
+        to be called repeatedly, e.g., when fitting rate constants.
+        """
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new._rate_constants = self._to_rate_constants(rate_constants)
+        return new
+
+    def rates(self, concentrations: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Return the rate of each reaction."""
+        padded = self._pad(concentrations)
+        return (
+            self._rate_constants
+            * padded[self._reactants[:, 0]] * padded[self._reactants[:, 1]])
+
+    def rhs(
+            self, t: float, concentrations: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Return the time derivative of the concentrations.
+
+        `t` is ignored; it is accepted for compatibility with ODE
+        integrators.
+        """
+        rates = self.rates(concentrations)
+        return np.bincount(
+            self._entry_rows,
+            weights=self._entry_data * rates[self._entry_cols],
+            minlength=self.num_assemblies)
+
+    def jacobian_csr(
+            self, t: float, concentrations: npt.ArrayLike,
+    ) -> tuple[
+            npt.NDArray[np.float64], npt.NDArray[np.int64],
+            npt.NDArray[np.int64]]:
+        """Return the Jacobian of `rhs` as CSR arrays
+        ``(data, indices, indptr)``.
+
+        The sparsity pattern (``indices`` and ``indptr``) is the same for
+        all concentrations, so that it can be passed to a solver once.
+        """
+        padded = self._pad(concentrations)
+        # d(rate_j)/dc of the assembly in slot s is k_j times the
+        # concentration of the assembly in the other slot.
+        entry_cols = self._entry_cols[self._jac_entry]
+        other = self._reactants[entry_cols, 1 - self._jac_slot]
+        values = (
+            self._entry_data[self._jac_entry]
+            * self._rate_constants[entry_cols] * padded[other])
+        data = np.bincount(
+            self._jac_inverse, weights=values,
+            minlength=len(self._jac_indices))
+        return data, self._jac_indices, self._jac_indptr
+
+    def jacobian(
+            self, t: float, concentrations: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Return the Jacobian of `rhs` as a dense array.
+
+        Use `jacobian_csr` for large networks.
+        """
+        data, indices, indptr = self.jacobian_csr(t, concentrations)
+        jac = np.zeros(
+            (self.num_assemblies, self.num_assemblies), dtype=np.float64)
+        rows = np.repeat(np.arange(self.num_assemblies), np.diff(indptr))
+        jac[rows, indices] = data
+        return jac
+
+    def _pad(self, concentrations: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        concentrations = np.asarray(concentrations, dtype=np.float64)
+        if concentrations.shape != (self.num_assemblies,):
+            raise ValueError(
+                f'Shape of concentrations {concentrations.shape} does not '
+                f'match ({self.num_assemblies},).')
+        return np.append(concentrations, 1.0)
+
+
+def build_rate_equation(
+        reaction_to_class: Mapping[Reaction, str],
+        assemblies: Iterable[Assembly],
+        rate_constants: Mapping[str, float],
+) -> MassActionRateEquation:
+    """Build the mass-action rate equations of classified reactions.
+
+    Parameters
+    ----------
+    reaction_to_class : Mapping[Reaction, str]
+        Mapping from reactions to their classes, as returned by
+        `classify_reactions`. Duplicate counts must be set.
+    assemblies : Iterable[Assembly]
+        The assemblies of the network, in the order of the concentration
+        vector. IDs must be set and unique.
+    rate_constants : Mapping[str, float]
+        The rate constant of each reaction class.
+
+    Returns
+    -------
+    MassActionRateEquation
+        The rate equations.
+    """
+    reactions = list(reaction_to_class)
+    matrix = build_stoichiometry_matrix(reactions, assemblies)
+    return MassActionRateEquation(
+        matrix, list(reaction_to_class.values()), rate_constants)
@@ -0,0 +1,259 @@
+"""Sparse stoichiometry matrix of a reaction network.
+
+The matrix is exported in the compressed sparse row (CSR) format used by
+SciPy, i.e., as the three arrays ``indptr``, ``indices`` and ``data``,
+with one row per assembly and one column per reaction, so that the rate
+of change of the concentrations is ``S @ v`` for the vector ``v`` of
+reaction rates.
+"""
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from nasap_net.helpers import validate_unique_ids
+from nasap_net.models import Assembly, Reaction
+from nasap_net.types import ID
+
+NO_INDEX = -1
+
+
+@dataclass(frozen=True, init=False, eq=False)
+class StoichiometryMatrix:
+    """Assembly × reaction stoichiometry matrix in the CSR format.
+
+    Attributes
+    ----------
+    assembly_ids : tuple[ID, ...]
+        The IDs of the assemblies, i.e., the rows.
+    reaction_ids : tuple[ID | None, ...]
+        The IDs of the reactions, i.e., the columns.
+    indptr, indices, data : npt.NDArray[np.int64]
+        The CSR arrays. The entries of row ``i`` are
+        ``data[indptr[i]:indptr[i + 1]]``, in the columns
+        ``indices[indptr[i]:indptr[i + 1]]`` (sorted).
+    duplicate_counts : npt.NDArray[np.int64]
+        The duplicate count of each reaction.
+    reverse_indices : npt.NDArray[np.int64]
+        The column of the reverse reaction of each reaction,
+        or `NO_INDEX` (-1) if there is none.
+    reactant_indices, product_indices : npt.NDArray[np.int64]
+        Arrays of shape ``(num_reactions, 2)`` with the rows of the
+        initial and entering assemblies, and of the product and leaving
+        assemblies, of each reaction; `NO_INDEX` where the entering or
+        leaving assembly is None.
+    """
+    assembly_ids: tuple[ID, ...]
+    reaction_ids: tuple[ID | None, ...]
+    indptr: npt.NDArray[np.int64] = field(repr=False)
+    indices: npt.NDArray[np.int64] = field(repr=False)
+    data: npt.NDArray[np.int64] = field(repr=False)
+    duplicate_counts: npt.NDArray[np.int64] = field(repr=False)
+    reverse_indices: npt.NDArray[np.int64] = field(repr=False)
+    reactant_indices: npt.NDArray[np.int64] = field(repr=False)
+    product_indices: npt.NDArray[np.int64] = field(repr=False)
+    _assembly_index: dict[ID, int] = field(repr=False)
+
+    def __init__(
+            self,
+            assembly_ids: Iterable[ID],
+            reaction_ids: Iterable[ID | None],
+            reactant_indices: npt.ArrayLike,
+            product_indices: npt.ArrayLike,
+            duplicate_counts: npt.ArrayLike,
+            reverse_indices: npt.ArrayLike | None = None,
+    ):
+        """Build the matrix from the assembly indices of the reactions.
+
+        Use `build_stoichiometry_matrix` to build it from Reaction objects.
+        """
+        assembly_ids = tuple(assembly_ids)
+        reaction_ids = tuple(reaction_ids)
+        num_reactions = len(reaction_ids)
+        reactants = _as_index_array(reactant_indices, (num_reactions, 2))
+        products = _as_index_array(product_indices, (num_reactions, 2))
+        duplicate_counts = _as_index_array(duplicate_counts, (num_reactions,))
+        if reverse_indices is None:
+            reverse_indices = np.full(num_reactions, NO_INDEX, dtype=np.int64)
+        reverse_indices = _as_index_array(reverse_indices, (num_reactions,))
+        for name, arr, bound in (
+                ('reactant_indices', reactants, len(assembly_ids)),
+                ('product_indices', products, len(assembly_ids)),
+                ('reverse_indices', reverse_indices, num_reactions)):
+            if arr.size and (arr.min() < NO_INDEX or arr.max() >= bound):
+                raise ValueError(f'{name} out of range.')
+        if ((reactants[:, 0] == NO_INDEX).any()
+                or (products[:, 0] == NO_INDEX).any()):
+            raise ValueError(
+                'Initial and product assemblies must not be missing.')
+
+        indptr, indices, data = _to_csr(
+            reactants, products, len(assembly_ids))
+
+        for name, arr in (
+                ('indptr', indptr), ('indices', indices), ('data', data),
+                ('duplicate_counts', duplicate_counts),
+                ('reverse_indices', reverse_indices),
+                ('reactant_indices', reactants),
+                ('product_indices', products)):
+            arr.flags.writeable = False
+            object.__setattr__(self, name, arr)
+        object.__setattr__(self, 'assembly_ids', assembly_ids)
+        object.__setattr__(self, 'reaction_ids', reaction_ids)
+        object.__setattr__(
+            self, '_assembly_index',
+            {id_: i for i, id_ in enumerate(assembly_ids)})
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.assembly_ids), len(self.reaction_ids)
+
+    @property
+    def assembly_index(self) -> Mapping[ID, int]:
+        """Mapping from assembly IDs to row indices."""
+        return self._assembly_index
+
+    def to_dense(self) -> npt.NDArray[np.int64]:
+        """Return the matrix as a dense array."""
+        dense = np.zeros(self.shape, dtype=np.int64)
+        rows = np.repeat(
+            np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+    def to_scipy(self) -> Any:
+        """Return the matrix as a `scipy.sparse.csr_array`.
+
+        SciPy is not a dependency of nasap-net; it must be installed
+        separately to use this method.
+        """
+        try:
+            from scipy.sparse import csr_array
+        except ImportError as e:
+            raise ImportError(
+                'SciPy is required for `to_scipy`. '
+                'Install it with `pip install scipy`.') from e
+        return csr_array(
+            (self.data, self.indices, self.indptr), shape=self.shape)
+
+
+def build_stoichiometry_matrix(
+        reactions: Sequence[Reaction],
+        assemblies: Iterable[Assembly],
+        *,
+        reaction_to_reverse: Mapping[ID, ID | None] | None = None,
+) -> StoichiometryMatrix:
+    """Build the stoichiometry matrix of a reaction network.
+
+    Parameters
+    ----------
+    reactions : Sequence[Reaction]
+        The reactions, i.e., the columns. Duplicate counts must be set.
+    assemblies : Iterable[Assembly]
+        The assemblies, i.e., the rows. IDs must be set and unique, and
+        every assembly of the reactions must be included.
+    reaction_to_reverse : Mapping[ID, ID | None] | None, optional
+        A mapping from each reaction ID to its reverse reaction ID,
+        as returned by `pair_reverse_reactions`. If given, the reactions
+        must have IDs, and `reverse_indices` of the result is filled in.
+
+    Returns
+    -------
+    StoichiometryMatrix
+        The stoichiometry matrix.
+
+    Raises
+    ------
+    KeyError
+        If an assembly of a reaction is not included in `assemblies`.
+    DuplicateCountNotSetError
+        If the duplicate count of a reaction is not set.
+    """
+    assemblies = list(assemblies)
+    validate_unique_ids(assemblies)
+    assembly_index = {
+        assembly.id_: i for i, assembly in enumerate(assemblies)}
+
+    def index(assembly_id: ID | None) -> int:
+        if assembly_id is None:
+            return NO_INDEX
+        return assembly_index[assembly_id]
+
+    num_reactions = len(reactions)
+    reactants = np.empty((num_reactions, 2), dtype=np.int64)
+    products = np.empty((num_reactions, 2), dtype=np.int64)
+    duplicate_counts = np.empty(num_reactions, dtype=np.int64)
+    for j, reaction in enumerate(reactions):
+        reactants[j] = (
+            index(reaction.init_assem_id), index(reaction.entering_assem_id))
+        products[j] = (
+            index(reaction.product_assem_id),
+            index(reaction.leaving_assem_id))
+        duplicate_counts[j] = reaction.duplicate_count
+
+    reverse_indices = None
+    if reaction_to_reverse is not None:
+        reaction_index = {
+            reaction.id_: j for j, reaction in enumerate(reactions)}
+        reverse_indices = np.array([
+            NO_INDEX if (rev_id := reaction_to_reverse.get(reaction.id_))
+            is None else reaction_index[rev_id]
+            for reaction in reactions
+        ], dtype=np.int64)
+
+    return StoichiometryMatrix(
+        assembly_ids=(assembly.id_ for assembly in assemblies),
+        reaction_ids=(reaction.id_or_none for reaction in reactions),
+        reactant_indices=reactants,
+        product_indices=products,
+        duplicate_counts=duplicate_counts,
+        reverse_indices=reverse_indices,
+    )
+
+
+def _as_index_array(
+        values: npt.ArrayLike, shape: tuple[int, ...],
+) -> npt.NDArray[np.int64]:
+    return np.array(values, dtype=np.int64).reshape(shape)
+
+
+def _to_csr(
+        reactants: npt.NDArray[np.int64],
+        products: npt.NDArray[np.int64],
+        num_assemblies: int,
+) -> tuple[
+        npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    num_reactions = len(reactants)
+    columns = np.repeat(np.arange(num_reactions, dtype=np.int64), 2)
+    rows = np.concatenate([reactants.ravel(), products.ravel()])
+    cols = np.concatenate([columns, columns])
+    values = np.concatenate([
+        np.full(reactants.size, -1, dtype=np.int64),
+        np.ones(products.size, dtype=np.int64),
+    ])
+    present = rows != NO_INDEX
+    rows, cols, values = rows[present], cols[present], values[present]
+
+    # Sum up the entries with the same (row, column), e.g., for A + A -> B,
+    # and drop the ones cancelling out.
+    keys = rows * max(num_reactions, 1) + cols
+    order = np.argsort(keys, kind='stable')
+    keys, values = keys[order], values[order]
+    if len(keys):
+        unique_keys, starts = np.unique(keys, return_index=True)
+        sums = np.add.reduceat(values, starts)
+    else:
+        unique_keys = keys
+        sums = values
+    nonzero = sums != 0
+    unique_keys, data = unique_keys[nonzero], sums[nonzero]
+
+    row_of_entry = unique_keys // max(num_reactions, 1)
+    indices = unique_keys % max(num_reactions, 1)
+    indptr = np.zeros(num_assemblies + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(row_of_entry, minlength=num_assemblies),
+        out=indptr[1:])
+    return indptr, indices, data
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from nasap_net.kinetics import NO_INDEX, MassActionRateEquation, \
+    StoichiometryMatrix, build_rate_equation
+from nasap_net.models import Assembly, BindingSite, Bond, Component, \
+    Reaction
+
+
+@pytest.fixture
+def M():
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L():
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def assemblies(M, L, X):
+    return [
+        # X0(0)-(0)M0(1)-(0)X1
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='L', components={'L0': L}, bonds=[]),
+        Assembly(id_='X', components={'X0': X}, bonds=[]),
+        # (0)L0(1)-(0)M0(1)-(0)X0
+        Assembly(
+            id_='MLX',
+            components={'L0': L, 'M0': M, 'X0': X},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'X0', 0)]),
+    ]
+
+@pytest.fixture
+def reaction_to_class(assemblies):
+    MX2, L, X, MLX = assemblies
+    forward = Reaction(
+        init_assem=MX2, entering_assem=L,
+        product_assem=MLX, leaving_assem=X,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('X0', 0),
+        entering_bs=BindingSite('L0', 0),
+        duplicate_count=4)
+    backward = Reaction(
+        init_assem=MLX, entering_assem=X,
+        product_assem=MX2, leaving_assem=L,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('L0', 1),
+        entering_bs=BindingSite('X0', 0),
+        duplicate_count=1)
+    return {forward: 'X->L', backward: 'L->X'}
+
+
+def test_rhs(assemblies, reaction_to_class):
+    eq = build_rate_equation(
+        reaction_to_class, assemblies, {'X->L': 2.0, 'L->X': 0.5})
+    c = np.array([1.0, 2.0, 3.0, 4.0])  # MX2, L, X, MLX
+    v_forward = 2.0 * 4 * 1.0 * 2.0
+    v_backward = 0.5 * 1 * 4.0 * 3.0
+    np.testing.assert_allclose(eq.rates(c), [v_forward, v_backward])
+    net = v_forward - v_backward
+    np.testing.assert_allclose(eq.rhs(0.0, c), [-net, -net, net, net])
+
+
+def test_jacobian_matches_finite_difference(assemblies, reaction_to_class):
+    eq = build_rate_equation(
+        reaction_to_class, assemblies, {'X->L': 2.0, 'L->X': 0.5})
+    c = np.array([1.0, 2.0, 3.0, 4.0])
+    _assert_jacobian(eq, c)
+
+
+def test_jacobian_intra_and_dimerization():
+    # A -> B (intramolecular), A + A -> C
+    matrix = StoichiometryMatrix(
+        assembly_ids=['A', 'B', 'C'],
+        reaction_ids=[None, None],
+        reactant_indices=[[0, NO_INDEX], [0, 0]],
+        product_indices=[[1, NO_INDEX], [2, NO_INDEX]],
+        duplicate_counts=[2, 1],
+    )
+    eq = MassActionRateEquation(matrix, ['intra', 'dimer'], {
+        'intra': 3.0, 'dimer': 5.0})
+    c = np.array([0.7, 0.2, 0.1])
+    np.testing.assert_allclose(eq.rates(c), [6.0 * 0.7, 5.0 * 0.7 * 0.7])
+    np.testing.assert_allclose(
+        eq.rhs(0.0, c)[0], -6.0 * 0.7 - 2 * 5.0 * 0.7 * 0.7)
+    _assert_jacobian(eq, c)
+
+
+def test_with_rate_constants(assemblies, reaction_to_class):
+    eq = build_rate_equation(
+        reaction_to_class, assemblies, {'X->L': 2.0, 'L->X': 0.5})
+    new_eq = eq.with_rate_constants({'X->L': 1.0, 'L->X': 1.0})
+    np.testing.assert_allclose(new_eq.rate_constants, [4.0, 1.0])
+    np.testing.assert_allclose(eq.rate_constants, [8.0, 0.5])
+
+
+def test_missing_rate_constant(assemblies, reaction_to_class):
+    with pytest.raises(KeyError):
+        build_rate_equation(reaction_to_class, assemblies, {'X->L': 2.0})
+
+
+def test_invalid_concentrations(assemblies, reaction_to_class):
+    eq = build_rate_equation(
+        reaction_to_class, assemblies, {'X->L': 2.0, 'L->X': 0.5})
+    with pytest.raises(ValueError):
+        eq.rhs(0.0, [1.0, 2.0])
+
+
+def _assert_jacobian(eq, c, eps=1e-6):
+    expected = np.empty((len(c), len(c)))
+    for m in range(len(c)):
+        dc = np.zeros_like(c)
+        dc[m] = eps
+        expected[:, m] = (eq.rhs(0.0, c + dc) - eq.rhs(0.0, c - dc)) / (2 * eps)
+    np.testing.assert_allclose(eq.jacobian(0.0, c), expected, atol=1e-6)
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from nasap_net.kinetics import NO_INDEX, StoichiometryMatrix, \
+    build_stoichiometry_matrix
+from nasap_net.models import Assembly, BindingSite, Bond, Component, \
+    Reaction
+
+
+@pytest.fixture
+def M():
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L():
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def assemblies(M, L, X):
+    return [
+        # X0(0)-(0)M0(1)-(0)X1
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='L', components={'L0': L}, bonds=[]),
+        Assembly(id_='X', components={'X0': X}, bonds=[]),
+        # (0)L0(1)-(0)M0(1)-(0)X0
+        Assembly(
+            id_='MLX',
+            components={'L0': L, 'M0': M, 'X0': X},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'X0', 0)]),
+    ]
+
+@pytest.fixture
+def reactions(assemblies):
+    MX2, L, X, MLX = assemblies
+    return [
+        # MX2 + L -> MLX + X
+        Reaction(
+            init_assem=MX2, entering_assem=L,
+            product_assem=MLX, leaving_assem=X,
+            metal_bs=BindingSite('M0', 0),
+            leaving_bs=BindingSite('X0', 0),
+            entering_bs=BindingSite('L0', 0),
+            duplicate_count=4, id_='R1'),
+        # MLX + X -> MX2 + L
+        Reaction(
+            init_assem=MLX, entering_assem=X,
+            product_assem=MX2, leaving_assem=L,
+            metal_bs=BindingSite('M0', 0),
+            leaving_bs=BindingSite('L0', 1),
+            entering_bs=BindingSite('X0', 0),
+            duplicate_count=1, id_='R2'),
+    ]
+
+
+def test_build(assemblies, reactions):
+    matrix = build_stoichiometry_matrix(
+        reactions, assemblies, reaction_to_reverse={'R1': 'R2', 'R2': 'R1'})
+    assert matrix.shape == (4, 2)
+    assert matrix.assembly_ids == ('MX2', 'L', 'X', 'MLX')
+    assert matrix.reaction_ids == ('R1', 'R2')
+    assert matrix.assembly_index['MLX'] == 3
+    np.testing.assert_array_equal(matrix.to_dense(), [
+        [-1, 1],
+        [-1, 1],
+        [1, -1],
+        [1, -1],
+    ])
+    np.testing.assert_array_equal(matrix.indptr, [0, 2, 4, 6, 8])
+    np.testing.assert_array_equal(matrix.indices, [0, 1] * 4)
+    np.testing.assert_array_equal(matrix.duplicate_counts, [4, 1])
+    np.testing.assert_array_equal(matrix.reverse_indices, [1, 0])
+    np.testing.assert_array_equal(
+        matrix.reactant_indices, [[0, 1], [3, 2]])
+
+
+def test_without_reverse(assemblies, reactions):
+    matrix = build_stoichiometry_matrix(reactions[:1], assemblies)
+    np.testing.assert_array_equal(matrix.reverse_indices, [NO_INDEX])
+    # Rows without entries
+    np.testing.assert_array_equal(matrix.indptr, [0, 1, 2, 3, 4])
+
+
+def test_merged_and_cancelled_entries():
+    # 0 + 0 -> 1, and 0 -> 0 + 1 (the entry of 0 cancels out)
+    matrix = StoichiometryMatrix(
+        assembly_ids=['A', 'B'],
+        reaction_ids=[None, None],
+        reactant_indices=[[0, 0], [0, NO_INDEX]],
+        product_indices=[[1, NO_INDEX], [0, 1]],
+        duplicate_counts=[1, 1],
+    )
+    np.testing.assert_array_equal(matrix.to_dense(), [[-2, 0], [1, 1]])
+    assert len(matrix.data) == 3
+
+
+def test_empty():
+    matrix = StoichiometryMatrix(
+        assembly_ids=['A'], reaction_ids=[],
+        reactant_indices=np.empty((0, 2)), product_indices=np.empty((0, 2)),
+        duplicate_counts=[])
+    assert matrix.shape == (1, 0)
+    np.testing.assert_array_equal(matrix.indptr, [0, 0])
+
+
+def test_invalid_indices():
+    with pytest.raises(ValueError):
+        StoichiometryMatrix(
+            assembly_ids=['A'], reaction_ids=[None],
+            reactant_indices=[[1, NO_INDEX]], product_indices=[[0, NO_INDEX]],
+            duplicate_counts=[1])
+
+
+def test_unknown_assembly(assemblies, reactions):
+    with pytest.raises(KeyError):
+        build_stoichiometry_matrix(reactions, assemblies[:3])
+
+
+def test_to_scipy(assemblies, reactions):
+    pytest.importorskip('scipy')
+    matrix = build_stoichiometry_matrix(reactions, assemblies)
+    np.testing.assert_array_equal(
+        matrix.to_scipy().toarray(), matrix.to_dense())
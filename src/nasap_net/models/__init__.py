@@ -3,5 +3,8 @@ from .aux_edge import AuxEdge
 from .binding_site import BindingSite
 from .bond import Bond
 from .component import Component
+from .interning import AssemblyInternTable
 from .mle import DuplicationNotSetError, MLE, MLEKind
 from .reaction import Reaction
+from .reaction_record import AssemblyTable, ReactionRecord, \
+    compact_reactions
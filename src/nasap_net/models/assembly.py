@@ -124,6 +124,35 @@ class Assembly:
         object.__setattr__(self, '_id', id_)
         self._validate()
 
+    def __hash__(self) -> int:
+        # Assemblies are used as keys of dicts and caches everywhere;
+        # the hash is computed once and cached per instance.
+        try:
+            return self.__dict__['_hash']
+        except KeyError:
+            hash_ = hash((self._components, self.bonds, self._id))
+            self.__dict__['_hash'] = hash_
+            return hash_
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self._id == other._id
+            and self.bonds == other.bonds
+            and self._components == other._components)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Drop the cached values; hashes of strings differ between
+        # processes, and some cached values cannot be pickled.
+        return {
+            '_components': self._components,
+            'bonds': self.bonds,
+            '_id': self._id,
+        }
+
     def __lt__(self, other):
         if not isinstance(other, Assembly):
             return NotImplemented
@@ -139,16 +168,14 @@ class Assembly:
         other_comp_ids = sorted(other._components.keys())
         if self_comp_ids != other_comp_ids:
             return self_comp_ids < other_comp_ids
-        self_bonds = sorted(self.bonds)
-        other_bonds = sorted(other.bonds)
-        return self_bonds < other_bonds
+        return self._sorted_bonds < other._sorted_bonds
 
     def __repr__(self):
         fields: dict[str, Any] = {}
         if self._id is not None:
             fields['id_'] = self._id
         fields['components'] = dict(sorted(self.component_id_to_kind.items()))
-        fields['bonds'] = [bond.to_tuple() for bond in sorted(self.bonds)]
+        fields['bonds'] = [bond.to_tuple() for bond in self._sorted_bonds]
         return construct_repr(self.__class__, fields)
 
     @property
@@ -281,6 +308,10 @@ class Assembly:
             id_=default_if_missing(id_, None),
         )
 
+    @cached_property
+    def _sorted_bonds(self) -> list[Bond]:
+        return sorted(self.bonds)
+
     @cached_property
     def _all_sites(self) -> frozenset[BindingSite]:
         """Return all binding sites in the assembly."""
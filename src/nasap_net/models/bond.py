@@ -1,6 +1,6 @@
 from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
-from functools import total_ordering
+from dataclasses import dataclass, field
+from functools import cached_property, total_ordering
 from typing import Self
 
 from nasap_net.types import ID, SupportsDunderLt
@@ -12,6 +12,8 @@ from .binding_site import BindingSite
 class Bond(Iterable, SupportsDunderLt):
     """A bond between two binding sites on two components."""
     sites: frozenset[BindingSite]
+    _component_ids: frozenset[ID] = field(
+        init=False, repr=False, compare=False)
 
     def __init__(self, comp_id1: ID, site1: ID, comp_id2: ID, site2: ID):
         if comp_id1 == comp_id2:
@@ -22,25 +24,34 @@ class Bond(Iterable, SupportsDunderLt):
             self, 'sites',
             frozenset((comp_and_site1, comp_and_site2))
         )
+        object.__setattr__(
+            self, '_component_ids', frozenset((comp_id1, comp_id2)))
+
+    def __hash__(self) -> int:
+        # The hash of a frozenset is cached by itself.
+        return hash(self.sites)
 
     def __iter__(self) -> Iterator[BindingSite]:
-        return iter(sorted(self.sites))
+        return iter(self._sorted_sites)
 
     def __lt__(self, other):
         if not isinstance(other, Bond):
             return NotImplemented
-        self_values = sorted(self.sites)
-        other_values = sorted(other.sites)
-        return self_values < other_values
+        return self._sorted_sites < other._sorted_sites
+
+    @cached_property
+    def _sorted_sites(self) -> tuple[BindingSite, ...]:
+        # Computed once since bonds are iterated and sorted on hot paths.
+        return tuple(sorted(self.sites))
 
     @property
     def component_ids(self) -> frozenset[ID]:
         """Return the component IDs involved in the bond."""
-        return frozenset(site.component_id for site in self.sites)
+        return self._component_ids
 
     def to_tuple(self) -> tuple[ID, ID, ID, ID]:
         """Return the bond as a tuple of component and site IDs."""
-        site1, site2 = sorted(self.sites)
+        site1, site2 = self._sorted_sites
         return (
             site1.component_id, site1.site_id,
             site2.component_id, site2.site_id,
@@ -0,0 +1,47 @@
+from collections.abc import Iterator
+
+from .assembly import Assembly
+
+
+class AssemblyInternTable:
+    """Table of canonical instances of assemblies.
+
+    Interning makes equal assemblies (same components, bonds and ID)
+    share one instance, so that dict and set lookups of interned
+    assemblies succeed on the identity check, without comparing the
+    components and bonds, and the cached values of an assembly (e.g.,
+    its hash and sorted bonds) are computed only once.
+
+    The table holds strong references to the interned assemblies;
+    use separate tables for separate tasks and `clear` them when done.
+
+    Examples
+    --------
+    >>> table = AssemblyInternTable()
+    >>> a = table.intern(Assembly(components={}, bonds=[], id_='A'))
+    >>> table.intern(Assembly(components={}, bonds=[], id_='A')) is a
+    True
+    """
+    def __init__(self) -> None:
+        self._table: dict[Assembly, Assembly] = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, assembly: object) -> bool:
+        return assembly in self._table
+
+    def __iter__(self) -> Iterator[Assembly]:
+        return iter(self._table)
+
+    def intern(self, assembly: Assembly) -> Assembly:
+        """Return the canonical instance equal to the assembly.
+
+        If no equal assembly has been interned, the given assembly is
+        added to the table and returned.
+        """
+        return self._table.setdefault(assembly, assembly)
+
+    def clear(self) -> None:
+        """Remove all the interned assemblies."""
+        self._table.clear()
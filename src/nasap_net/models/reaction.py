@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Self, TYPE_CHECKING
 
 from nasap_net.exceptions import IDNotSetError, NasapNetError
@@ -68,19 +68,23 @@ class Reaction:
     def __lt__(self, other):
         if not isinstance(other, Reaction):
             return NotImplemented
-        def key(reaction: Reaction) -> tuple:
-            return (
-                reaction.init_assem_id,
-                reaction.entering_assem_id,
-                reaction.product_assem_id,
-                reaction.leaving_assem_id,
-                reaction.metal_bs,
-                reaction.leaving_bs,
-                reaction.entering_bs,
-                reaction.duplicate_count_or_none,
-                reaction.id_or_none,
-            )
-        return key(self) < key(other)
+        return self._sort_key < other._sort_key
+
+    @cached_property
+    def _sort_key(self) -> tuple:
+        # Computed once per reaction, since sorting compares each reaction
+        # many times.
+        return (
+            self.init_assem_id,
+            self.entering_assem_id,
+            self.product_assem_id,
+            self.leaving_assem_id,
+            self.metal_bs,
+            self.leaving_bs,
+            self.entering_bs,
+            self.duplicate_count_or_none,
+            self.id_or_none,
+        )
 
     def __str__(self):
         equation = self.equation_str
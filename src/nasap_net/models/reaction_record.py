@@ -0,0 +1,174 @@
+"""Compact records of reactions referring to assemblies by index.
+
+A `Reaction` holds its assemblies as objects and is a regular dataclass
+instance with a ``__dict__``. For networks with millions of reactions,
+`ReactionRecord` stores the same information with ``__slots__``, referring
+to the assemblies by their indices in a shared `AssemblyTable`; a full
+`Reaction` is only materialised when needed.
+"""
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from nasap_net.types import ID
+from .assembly import Assembly
+from .binding_site import BindingSite
+from .reaction import Reaction
+
+
+@dataclass(frozen=True, slots=True)
+class ReactionRecord:
+    """A reaction referring to its assemblies by index.
+
+    Attributes
+    ----------
+    init_index, entering_index, product_index, leaving_index : int | None
+        The indices of the assemblies in the `AssemblyTable`;
+        `entering_index` and `leaving_index` are None if there is no
+        entering or leaving assembly.
+    metal_bs, leaving_bs, entering_bs : BindingSite
+        The binding sites of the reaction.
+    duplicate_count : int | None
+        The duplicate count, or None if not set.
+    id_ : ID | None
+        The ID of the reaction, or None if not set.
+    """
+    init_index: int
+    entering_index: int | None
+    product_index: int
+    leaving_index: int | None
+    metal_bs: BindingSite
+    leaving_bs: BindingSite
+    entering_bs: BindingSite
+    duplicate_count: int | None = None
+    id_: ID | None = None
+
+    def is_inter(self) -> bool:
+        """Return True if the reaction is an inter-molecular reaction."""
+        return self.entering_index is not None
+
+    def is_intra(self) -> bool:
+        """Return True if the reaction is an intra-molecular reaction."""
+        return self.entering_index is None
+
+    def sort_key(self) -> tuple[int, int, int, int]:
+        """Return a key to sort records by their assembly indices.
+
+        Use it as ``sorted(records, key=ReactionRecord.sort_key)``, so
+        that the key is computed once per record. Missing entering and
+        leaving assemblies come first.
+        """
+        return (
+            self.init_index,
+            -1 if self.entering_index is None else self.entering_index,
+            self.product_index,
+            -1 if self.leaving_index is None else self.leaving_index,
+        )
+
+
+class AssemblyTable:
+    """Table of assemblies shared by `ReactionRecord` objects.
+
+    Equal assemblies are stored once and share one index.
+    """
+    def __init__(self, assemblies: Iterable[Assembly] = ()) -> None:
+        self._assemblies: list[Assembly] = []
+        self._index: dict[Assembly, int] = {}
+        for assembly in assemblies:
+            self.add(assembly)
+
+    def __len__(self) -> int:
+        return len(self._assemblies)
+
+    def __getitem__(self, index: int) -> Assembly:
+        return self._assemblies[index]
+
+    def __iter__(self) -> Iterator[Assembly]:
+        return iter(self._assemblies)
+
+    def add(self, assembly: Assembly) -> int:
+        """Add an assembly if not yet added, and return its index."""
+        index = self._index.get(assembly)
+        if index is None:
+            index = len(self._assemblies)
+            self._assemblies.append(assembly)
+            self._index[assembly] = index
+        return index
+
+    def index(self, assembly: Assembly) -> int:
+        """Return the index of an assembly.
+
+        Raises
+        ------
+        KeyError
+            If the assembly is not in the table.
+        """
+        return self._index[assembly]
+
+    def to_record(self, reaction: Reaction) -> ReactionRecord:
+        """Convert a reaction to a record, adding its assemblies."""
+        return ReactionRecord(
+            init_index=self.add(reaction.init_assem),
+            entering_index=self._add_optional(reaction.entering_assem),
+            product_index=self.add(reaction.product_assem),
+            leaving_index=self._add_optional(reaction.leaving_assem),
+            metal_bs=reaction.metal_bs,
+            leaving_bs=reaction.leaving_bs,
+            entering_bs=reaction.entering_bs,
+            duplicate_count=reaction.duplicate_count_or_none,
+            id_=reaction.id_or_none,
+        )
+
+    def to_reaction(self, record: ReactionRecord) -> Reaction:
+        """Materialise a record to a full reaction."""
+        return Reaction(
+            init_assem=self._assemblies[record.init_index],
+            entering_assem=self._get_optional(record.entering_index),
+            product_assem=self._assemblies[record.product_index],
+            leaving_assem=self._get_optional(record.leaving_index),
+            metal_bs=record.metal_bs,
+            leaving_bs=record.leaving_bs,
+            entering_bs=record.entering_bs,
+            duplicate_count=record.duplicate_count,
+            id_=record.id_,
+        )
+
+    def iter_reactions(
+            self, records: Iterable[ReactionRecord]) -> Iterator[Reaction]:
+        """Materialise records to full reactions one by one."""
+        for record in records:
+            yield self.to_reaction(record)
+
+    def _add_optional(self, assembly: Assembly | None) -> int | None:
+        if assembly is None:
+            return None
+        return self.add(assembly)
+
+    def _get_optional(self, index: int | None) -> Assembly | None:
+        if index is None:
+            return None
+        return self._assemblies[index]
+
+
+def compact_reactions(
+        reactions: Iterable[Reaction],
+        assembly_table: AssemblyTable | None = None,
+) -> tuple[AssemblyTable, list[ReactionRecord]]:
+    """Convert reactions to records referring to a shared assembly table.
+
+    Parameters
+    ----------
+    reactions : Iterable[Reaction]
+        The reactions to convert.
+    assembly_table : AssemblyTable | None, optional
+        The table to add the assemblies to. If None, a new table is
+        created.
+
+    Returns
+    -------
+    tuple[AssemblyTable, list[ReactionRecord]]
+        The assembly table and the records, in the order of the reactions.
+    """
+    if assembly_table is None:
+        assembly_table = AssemblyTable()
+    records = [assembly_table.to_record(reaction) for reaction in reactions]
+    return assembly_table, records
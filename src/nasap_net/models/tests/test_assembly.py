@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from nasap_net.models import Assembly, Bond, Component
@@ -111,3 +113,31 @@ def test_copy_with_invalid_none():
         assem.copy_with(components=None)  # type: ignore[arg-type]
     with pytest.raises(TypeError):
         assem.copy_with(bonds=None)  # type: ignore[arg-type]
+
+
+def test_equality_and_hash():
+    M = Component(kind='M', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assembly = Assembly(
+        components={'M0': M, 'X0': X}, bonds=[Bond('M0', 0, 'X0', 0)])
+    same = Assembly(
+        components={'X0': X, 'M0': M}, bonds=[Bond('X0', 0, 'M0', 0)])
+    assert assembly == same
+    assert hash(assembly) == hash(same)
+    assert assembly != same.copy_with(id_='A')
+    assert assembly != assembly.copy_with(bonds=[Bond('M0', 1, 'X0', 0)])
+    assert assembly != 'not an assembly'
+
+
+def test_pickle():
+    M = Component(kind='M', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assembly = Assembly(
+        components={'M0': M, 'X0': X}, bonds=[Bond('M0', 0, 'X0', 0)],
+        id_='MX')
+    # Fill the caches, which are not pickled.
+    hash(assembly)
+    assert assembly.component_id_to_kind == {'M0': 'M', 'X0': 'X'}
+    loaded = pickle.loads(pickle.dumps(assembly))
+    assert loaded == assembly
+    assert loaded.component_id_to_kind == {'M0': 'M', 'X0': 'X'}
@@ -16,3 +16,12 @@ def test_bond_same_site_error():
         Bond(comp_id1="M1", site1="a", comp_id2="M1", site2="b")
     # Should not raise
     Bond(comp_id1="M1", site1="a", comp_id2="M2", site2="a")
+
+
+def test_iter_and_ordering():
+    bond = Bond(comp_id1="M1", site1="b", comp_id2="L1", site2="a")
+    assert list(bond) == [BindingSite("L1", "a"), BindingSite("M1", "b")]
+    assert bond.to_tuple() == ("L1", "a", "M1", "b")
+    assert bond.component_ids == frozenset({"L1", "M1"})
+    assert bond == Bond(comp_id1="L1", site1="a", comp_id2="M1", site2="b")
+    assert bond < Bond(comp_id1="L1", site1="b", comp_id2="M1", site2="a")
@@ -0,0 +1,24 @@
+from nasap_net.models import Assembly, AssemblyInternTable, Bond, Component
+
+
+def test_intern():
+    M = Component(kind='M', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+
+    def MX():
+        return Assembly(
+            components={'M0': M, 'X0': X}, bonds=[Bond('M0', 0, 'X0', 0)])
+
+    table = AssemblyInternTable()
+    first = table.intern(MX())
+    second = MX()
+    assert second is not first
+    assert table.intern(second) is first
+    assert table.intern(second.copy_with(id_='MX')) is not first
+    assert len(table) == 2
+    assert second in table
+    assert list(table) == [first, second.copy_with(id_='MX')]
+
+    table.clear()
+    assert len(table) == 0
+    assert table.intern(second) is second
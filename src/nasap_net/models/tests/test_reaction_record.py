@@ -0,0 +1,78 @@
+import pytest
+
+from nasap_net.models import Assembly, AssemblyTable, BindingSite, \
+    Component, Reaction, ReactionRecord, compact_reactions
+
+
+@pytest.fixture
+def reactions():
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    MX2 = Assembly(
+        id_='MX2', components={'X0': X, 'M0': M, 'X1': X}, bonds=[])
+    free_L = Assembly(id_='free_L', components={'L0': L}, bonds=[])
+    MLX = Assembly(
+        id_='MLX', components={'X0': X, 'M0': M, 'L0': L}, bonds=[])
+    free_X = Assembly(id_='free_X', components={'X0': X}, bonds=[])
+    inter = Reaction(
+        init_assem=MX2,
+        entering_assem=free_L,
+        product_assem=MLX,
+        leaving_assem=free_X,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('X0', 0),
+        entering_bs=BindingSite('L0', 0),
+        duplicate_count=4,
+        id_='R1',
+    )
+    intra = Reaction(
+        init_assem=MLX,
+        entering_assem=None,
+        product_assem=MLX,
+        leaving_assem=None,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('L0', 0),
+        entering_bs=BindingSite('L0', 1),
+    )
+    return [inter, intra]
+
+
+def test_compact_reactions(reactions):
+    table, records = compact_reactions(reactions)
+    assert list(table) == [
+        reactions[0].init_assem, reactions[0].entering_assem,
+        reactions[0].product_assem, reactions[0].leaving_assem]
+    assert records == [
+        ReactionRecord(
+            0, 1, 2, 3, BindingSite('M0', 0), BindingSite('X0', 0),
+            BindingSite('L0', 0), duplicate_count=4, id_='R1'),
+        ReactionRecord(
+            2, None, 2, None, BindingSite('M0', 0), BindingSite('L0', 0),
+            BindingSite('L0', 1)),
+    ]
+    assert records[0].is_inter() and records[1].is_intra()
+    assert list(table.iter_reactions(records)) == reactions
+    assert table.to_reaction(records[1]).product_assem \
+        is reactions[0].product_assem
+
+
+def test_shared_table(reactions):
+    table = AssemblyTable([reactions[1].init_assem])
+    _, records = compact_reactions(reactions, table)
+    assert len(table) == 4
+    assert records[1].init_index == 0
+    assert table.index(reactions[0].init_assem) == 1
+    with pytest.raises(KeyError):
+        table.index(reactions[0].init_assem.copy_with(id_='other'))
+
+
+def test_slots(reactions):
+    _, records = compact_reactions(reactions)
+    assert not hasattr(records[0], '__dict__')
+
+
+def test_sort_key(reactions):
+    _, records = compact_reactions(reactions)
+    assert sorted(records, key=ReactionRecord.sort_key) == records
+    assert sorted(reversed(records), key=ReactionRecord.sort_key) == records
@@ -0,0 +1,6 @@
+from .cache import StageCache, parse_size
+from .config import AssemblyEnumerationConfig, CacheConfig, \
+    ClassificationConfig, PipelineConfig, PipelineConfigError, \
+    ReactionEnumerationConfig, ReversePairingConfig, load_pipeline_config, \
+    parse_pipeline_config
+from .runner import StageReport, run_pipeline
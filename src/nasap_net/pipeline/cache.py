@@ -0,0 +1,351 @@
+"""Content-addressed on-disk cache of enumeration results.
+
+The results of `enumerate_assemblies` and `enumerate_reactions` are stored
+under a key computed from their inputs, so that experiments sharing a
+template and parameters reuse each other's results, even with different
+output directories::
+
+    cache = StageCache('~/.cache/nasap-net', max_size=2 << 30)
+    assemblies = cache.enumerate_assemblies(
+        template, leaving_ligand=X, metal_kinds=['M'])
+    reactions = cache.enumerate_reactions(assemblies, mle_kinds)
+
+Each entry is a directory named ``<stage>-<key>`` in the cache directory,
+holding the results in the binary assembly-space format or the columnar
+reaction format. The keys include the version of nasap-net, so that
+results are never reused across versions. When the total size of the
+entries exceeds `max_size`, the least recently used entries are removed.
+"""
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import shutil
+import uuid
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any
+
+from nasap_net.assembly_enumeration import enumerate_assemblies
+from nasap_net.io import load_assembly_space, load_reactions_columnar, \
+    save_assembly_space, save_reactions_columnar
+from nasap_net.models import Assembly, Component, MLEKind, Reaction
+from nasap_net.reaction_enumeration import enumerate_reactions
+from nasap_net.types import ID
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_SIZE = 1 << 30  # 1 GiB
+
+_ASSEMBLIES_STAGE = 'assemblies'
+_REACTIONS_STAGE = 'reactions'
+_TEMP_PREFIX = '.tmp-'
+
+
+class StageCache:
+    """Content-addressed on-disk cache of enumeration results.
+
+    Attributes
+    ----------
+    cache_dir : Path
+        The directory of the cache. Created on the first write.
+    max_size : int | None
+        The maximum total size of the entries in bytes.
+        If None, entries are never evicted.
+    hits : int
+        The number of lookups served from the cache.
+    misses : int
+        The number of lookups not found in the cache.
+    """
+    def __init__(
+            self,
+            cache_dir: os.PathLike | str,
+            *,
+            max_size: int | None = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if max_size is not None and max_size < 0:
+            raise ValueError('max_size must be non-negative')
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def enumerate_assemblies(
+            self,
+            template: Assembly,
+            *,
+            leaving_ligand: Component,
+            leaving_ligand_site: ID | None = None,
+            metal_kinds: Iterable[str],
+            symmetry_operations: Iterable[Mapping[Any, ID]] | None = None,
+            comp_kind_order_in_formula: Iterable[str] | None = None,
+            **options: Any,
+    ) -> list[Assembly]:
+        """Return the result of `enumerate_assemblies`, from the cache if
+        available.
+
+        The parameters are the same as those of `enumerate_assemblies`.
+        `options` (e.g., ``progress_callback``) are passed on to it and
+        are not part of the key.
+        """
+        metal_kinds = list(metal_kinds)
+        if symmetry_operations is not None:
+            symmetry_operations = list(symmetry_operations)
+        if comp_kind_order_in_formula is not None:
+            comp_kind_order_in_formula = list(comp_kind_order_in_formula)
+        key = self.assemblies_key(
+            template,
+            leaving_ligand=leaving_ligand,
+            leaving_ligand_site=leaving_ligand_site,
+            metal_kinds=metal_kinds,
+            symmetry_operations=symmetry_operations,
+            comp_kind_order_in_formula=comp_kind_order_in_formula,
+        )
+        entry = self._lookup(_ASSEMBLIES_STAGE, key)
+        if entry is not None:
+            return load_assembly_space(entry)
+
+        assemblies = enumerate_assemblies(
+            template,
+            leaving_ligand=leaving_ligand,
+            leaving_ligand_site=leaving_ligand_site,
+            metal_kinds=metal_kinds,
+            symmetry_operations=symmetry_operations,
+            comp_kind_order_in_formula=comp_kind_order_in_formula,
+            **options,
+        )
+        self._store(
+            _ASSEMBLIES_STAGE, key,
+            lambda path: save_assembly_space(assemblies, path))
+        return assemblies
+
+    def enumerate_reactions(
+            self,
+            assemblies: Iterable[Assembly],
+            mle_kinds: Iterable[MLEKind],
+            *,
+            min_temp_ring_size: int | None = None,
+            **options: Any,
+    ) -> list[Reaction]:
+        """Return the result of `enumerate_reactions` as a list, from the
+        cache if available.
+
+        The parameters are the same as those of `enumerate_reactions`.
+        `options` (e.g., ``num_workers``) are passed on to it and are not
+        part of the key. The assemblies must have unique IDs; the cached
+        reactions refer to them by ID.
+        """
+        assemblies = list(assemblies)
+        mle_kinds = list(mle_kinds)
+        key = self.reactions_key(
+            assemblies, mle_kinds, min_temp_ring_size=min_temp_ring_size)
+        entry = self._lookup(_REACTIONS_STAGE, key)
+        if entry is not None:
+            return load_reactions_columnar(entry, assemblies, mmap=False)
+
+        reactions = list(enumerate_reactions(
+            assemblies, mle_kinds,
+            min_temp_ring_size=min_temp_ring_size, **options))
+        self._store(
+            _REACTIONS_STAGE, key,
+            lambda path: save_reactions_columnar(reactions, path))
+        return reactions
+
+    @staticmethod
+    def assemblies_key(
+            template: Assembly,
+            *,
+            leaving_ligand: Component,
+            leaving_ligand_site: ID | None = None,
+            metal_kinds: Iterable[str],
+            symmetry_operations: Iterable[Mapping[Any, ID]] | None = None,
+            comp_kind_order_in_formula: Iterable[str] | None = None,
+    ) -> str:
+        """Return the key of the assemblies enumerated from the inputs."""
+        return _compute_key(_ASSEMBLIES_STAGE, {
+            'template': template,
+            'leaving_ligand': leaving_ligand,
+            'leaving_ligand_site': leaving_ligand_site,
+            # The order of the metal kinds does not affect the result.
+            'metal_kinds': frozenset(metal_kinds),
+            'symmetry_operations': (
+                None if symmetry_operations is None
+                else list(symmetry_operations)),
+            'comp_kind_order_in_formula': (
+                None if comp_kind_order_in_formula is None
+                else list(comp_kind_order_in_formula)),
+        })
+
+    @staticmethod
+    def reactions_key(
+            assemblies: Iterable[Assembly],
+            mle_kinds: Iterable[MLEKind],
+            *,
+            min_temp_ring_size: int | None = None,
+    ) -> str:
+        """Return the key of the reactions enumerated from the inputs."""
+        return _compute_key(_REACTIONS_STAGE, {
+            'assemblies': list(assemblies),
+            'mle_kinds': list(mle_kinds),
+            'min_temp_ring_size': min_temp_ring_size,
+        })
+
+    @property
+    def size(self) -> int:
+        """The total size of the entries in bytes."""
+        return sum(size for _, size, _ in self._list_entries())
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        for path, _, _ in self._list_entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the total size
+        does not exceed `max_size`.
+        """
+        if self.max_size is None:
+            return
+        entries = sorted(self._list_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_size:
+                break
+            logger.info('Evicting cache entry "%s".', path.name)
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def _entry_path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / f'{stage}-{key}'
+
+    def _lookup(self, stage: str, key: str) -> Path | None:
+        path = self._entry_path(stage, key)
+        if not path.is_dir():
+            self.misses += 1
+            logger.info('Cache miss for %s (%s).', stage, key[:12])
+            return None
+        self.hits += 1
+        logger.info('Cache hit for %s (%s).', stage, key[:12])
+        # The modification time of the entry records its last use.
+        os.utime(path)
+        return path
+
+    def _store(
+            self, stage: str, key: str, write: Callable[[Path], None],
+    ) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary directory first, so that concurrent runs
+        # never see an incomplete entry.
+        temp_path = self.cache_dir / f'{_TEMP_PREFIX}{uuid.uuid4().hex}'
+        try:
+            write(temp_path)
+            temp_path.rename(self._entry_path(stage, key))
+        except OSError:
+            # Stored by another run in the meantime.
+            shutil.rmtree(temp_path, ignore_errors=True)
+            if not self._entry_path(stage, key).is_dir():
+                raise
+        self.evict()
+
+    def _list_entries(self) -> list[tuple[Path, int, float]]:
+        """Return the path, size and last use time of each entry."""
+        if not self.cache_dir.is_dir():
+            return []
+        entries = []
+        for path in self.cache_dir.iterdir():
+            if path.name.startswith(_TEMP_PREFIX) or not path.is_dir():
+                continue
+            try:
+                size = sum(
+                    file.stat().st_size for file in path.iterdir())
+                last_used = path.stat().st_mtime
+            except FileNotFoundError:
+                # Removed by another run in the meantime.
+                continue
+            entries.append((path, size, last_used))
+        return entries
+
+
+def parse_size(size: int | str) -> int:
+    """Parse a size in bytes, given as an integer or a string with a unit,
+    e.g., ``'500MB'`` or ``'2 GiB'``.
+
+    Raises
+    ------
+    ValueError
+        If the size is invalid.
+    """
+    if isinstance(size, int):
+        if size < 0:
+            raise ValueError(f'Invalid size: {size!r}')
+        return size
+    text = size.strip().upper().removesuffix('B').removesuffix('I')
+    multiplier = 1
+    for i, unit in enumerate('KMGT', start=1):
+        if text.endswith(unit):
+            text = text[:-1]
+            multiplier = 1 << (10 * i)
+            break
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError(f'Invalid size: {size!r}') from None
+    if value < 0:
+        raise ValueError(f'Invalid size: {size!r}')
+    return int(value * multiplier)
+
+
+def nasap_net_version() -> str:
+    """Return the installed version of nasap-net, or 'unknown'."""
+    try:
+        return importlib.metadata.version('nasap-net')
+    except importlib.metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def _compute_key(stage: str, inputs: Mapping[str, Any]) -> str:
+    document = {
+        'format': CACHE_FORMAT_VERSION,
+        'nasap_net': nasap_net_version(),
+        'stage': stage,
+        'inputs': _canonical(dict(inputs)),
+    }
+    return hashlib.sha256(json.dumps(
+        document, separators=(',', ':')).encode()).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert a value into JSON-serializable data, independent of the
+    iteration order of sets and mappings.
+
+    Integers and strings stay distinct (e.g., ``1`` and ``'1'``), since
+    JSON distinguishes them.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Assembly):
+        return {
+            'id': value.id_or_none,
+            'components': _canonical(dict(value.components)),
+            'bonds': _canonical(value.bonds),
+        }
+    if isinstance(value, Mapping):
+        return _sorted([
+            [_canonical(k), _canonical(v)] for k, v in value.items()])
+    if isinstance(value, (set, frozenset)):
+        return _sorted([_canonical(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if is_dataclass(value):
+        return {
+            f.name: _canonical(getattr(value, f.name))
+            for f in fields(value) if f.compare}
+    raise TypeError(f'Cannot compute a cache key of {value!r}')
+
+
+def _sorted(values: list[Any]) -> list[Any]:
+    return sorted(values, key=lambda v: json.dumps(v, separators=(',', ':')))
@@ -0,0 +1,252 @@
+"""Configuration of the pipeline, loaded from a YAML file.
+
+Example::
+
+    output_dir: output             # relative to the config file
+    components:
+      M: {sites: [0, 1]}
+      L: {sites: [0, 1]}
+      X: {sites: [0]}
+      # aux_edges: [{sites: [0, 1], kind: cis}, ...]
+    assembly_enumeration:
+      template:
+        components: {M0: M, M1: M, L0: L, L1: L, L2: L}
+        bonds: [[L0, 1, M0, 0], [M0, 1, L1, 0], [L1, 1, M1, 0], ...]
+      leaving_ligand: X
+      metal_kinds: [M]
+      symmetry_operations:         # optional; component ID mappings
+        - {M0: M1, M1: M0, L0: L1, L1: L0}
+      extra_assemblies: []         # assemblies to add to the enumerated ones
+      comp_kind_order_in_formula: [M, L, X]
+      # Alternatively, `assemblies_file: assemblies.yaml` loads the
+      # assemblies instead of enumerating them.
+    reaction_enumeration:
+      mle_kinds:
+        - {metal: M, leaving: X, entering: L}
+        - {metal: M, leaving: L, entering: X}
+      min_temp_ring_size: 3
+      num_workers: 4
+    reverse_pairing:
+      enabled: true
+    classification:                # optional
+      classifier: my_rules.py:classify_reaction   # or package.module:name
+      num_workers: 4
+    cache:                         # optional; shared between experiments
+      dir: ~/.cache/nasap-net      # relative to the config file
+      max_size: 2GB
+"""
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from nasap_net.exceptions import NasapNetError
+from nasap_net.io import build_assembly, build_component
+from nasap_net.models import Assembly, Component, MLEKind
+from nasap_net.types import ID
+from .cache import DEFAULT_MAX_SIZE, parse_size
+
+
+class PipelineConfigError(NasapNetError):
+    """Raised when the pipeline configuration is invalid."""
+    pass
+
+
+@dataclass(frozen=True)
+class AssemblyEnumerationConfig:
+    template: Assembly | None = None
+    leaving_ligand: Component | None = None
+    leaving_ligand_site: ID | None = None
+    metal_kinds: tuple[str, ...] = ()
+    symmetry_operations: tuple[Mapping[ID, ID], ...] | None = None
+    extra_assemblies: tuple[Assembly, ...] = ()
+    comp_kind_order_in_formula: tuple[str, ...] | None = None
+    assemblies_file: Path | None = None
+
+
+@dataclass(frozen=True)
+class ReactionEnumerationConfig:
+    mle_kinds: tuple[MLEKind, ...]
+    min_temp_ring_size: int | None = None
+    num_workers: int | None = None
+    chunksize: int = 16
+
+
+@dataclass(frozen=True)
+class ReversePairingConfig:
+    enabled: bool = True
+
+
+@dataclass(frozen=True)
+class ClassificationConfig:
+    classifier: str
+    num_workers: int | None = None
+    chunksize: int = 256
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    dir: Path
+    max_size: int | None = DEFAULT_MAX_SIZE
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Configuration of the pipeline.
+
+    Use `load_pipeline_config` to load it from a YAML file.
+
+    `raw_sections` holds the YAML sections the stages are configured by;
+    they are used to detect configuration changes between runs.
+    """
+    output_dir: Path
+    base_dir: Path
+    assembly_enumeration: AssemblyEnumerationConfig
+    reaction_enumeration: ReactionEnumerationConfig
+    reverse_pairing: ReversePairingConfig = ReversePairingConfig()
+    classification: ClassificationConfig | None = None
+    cache: CacheConfig | None = None
+    raw_sections: Mapping[str, Any] = field(
+        default_factory=dict, repr=False, compare=False)
+
+    def section_digest(self, *names: str) -> str:
+        """Return a digest of the given raw sections, ignoring the settings
+        which do not affect the results (e.g., the number of workers).
+        """
+        sections = {
+            name: _strip_execution_settings(self.raw_sections.get(name))
+            for name in names}
+        return hashlib.sha256(json.dumps(
+            sections, sort_keys=True, default=str).encode()).hexdigest()
+
+
+_EXECUTION_SETTINGS = frozenset({'num_workers', 'chunksize'})
+
+
+def _strip_execution_settings(section: Any) -> Any:
+    if not isinstance(section, Mapping):
+        return section
+    return {
+        key: value for key, value in section.items()
+        if key not in _EXECUTION_SETTINGS}
+
+
+def load_pipeline_config(file_path: os.PathLike | str) -> PipelineConfig:
+    """Load the pipeline configuration from a YAML file.
+
+    Relative paths in the file are resolved against the directory of the
+    file.
+
+    Raises
+    ------
+    PipelineConfigError
+        If the configuration is invalid.
+    """
+    file_path = Path(file_path)
+    with open(file_path, encoding='utf-8') as f:
+        raw = yaml.safe_load(f)
+    return parse_pipeline_config(raw, base_dir=file_path.parent)
+
+
+def parse_pipeline_config(
+        raw: Any, *, base_dir: os.PathLike | str = '.',
+) -> PipelineConfig:
+    """Parse the pipeline configuration from a mapping loaded from YAML.
+
+    Raises
+    ------
+    PipelineConfigError
+        If the configuration is invalid.
+    """
+    base_dir = Path(base_dir)
+    if not isinstance(raw, Mapping):
+        raise PipelineConfigError('The configuration must be a mapping.')
+    try:
+        components = {
+            kind: build_component({'kind': kind, **spec})
+            for kind, spec in raw.get('components', {}).items()}
+        classification = None
+        if raw.get('classification') is not None:
+            classification = _parse_classification(raw['classification'])
+        cache = None
+        if raw.get('cache') is not None:
+            cache = _parse_cache(raw['cache'], base_dir)
+        return PipelineConfig(
+            output_dir=base_dir / raw.get('output_dir', 'output'),
+            base_dir=base_dir,
+            assembly_enumeration=_parse_assembly_enumeration(
+                raw['assembly_enumeration'], components, base_dir),
+            reaction_enumeration=_parse_reaction_enumeration(
+                raw['reaction_enumeration']),
+            reverse_pairing=ReversePairingConfig(
+                **(raw.get('reverse_pairing') or {})),
+            classification=classification,
+            cache=cache,
+            raw_sections={
+                key: value for key, value in raw.items()
+                if key not in ('output_dir', 'cache')},
+        )
+    except PipelineConfigError:
+        raise
+    except (KeyError, TypeError, ValueError) as e:
+        raise PipelineConfigError(
+            f'Invalid pipeline configuration: {e!r}') from e
+
+
+def _parse_assembly_enumeration(
+        raw: Mapping[str, Any],
+        components: Mapping[str, Component],
+        base_dir: Path,
+) -> AssemblyEnumerationConfig:
+    if raw.get('assemblies_file') is not None:
+        return AssemblyEnumerationConfig(
+            assemblies_file=base_dir / raw['assemblies_file'])
+    if 'template' not in raw:
+        raise PipelineConfigError(
+            'assembly_enumeration requires either template or '
+            'assemblies_file.')
+    order = raw.get('comp_kind_order_in_formula')
+    return AssemblyEnumerationConfig(
+        template=build_assembly(raw['template'], components),
+        leaving_ligand=components[raw['leaving_ligand']],
+        leaving_ligand_site=raw.get('leaving_ligand_site'),
+        metal_kinds=tuple(raw['metal_kinds']),
+        symmetry_operations=_parse_symmetry_operations(
+            raw.get('symmetry_operations')),
+        extra_assemblies=tuple(
+            build_assembly(mapping, components)
+            for mapping in raw.get('extra_assemblies', [])),
+        comp_kind_order_in_formula=None if order is None else tuple(order),
+    )
+
+
+def _parse_reaction_enumeration(
+        raw: Mapping[str, Any]) -> ReactionEnumerationConfig:
+    return ReactionEnumerationConfig(
+        mle_kinds=tuple(MLEKind(**kind) for kind in raw['mle_kinds']),
+        **{key: value for key, value in raw.items() if key != 'mle_kinds'},
+    )
+
+
+def _parse_classification(raw: Mapping[str, Any]) -> ClassificationConfig:
+    return ClassificationConfig(**raw)
+
+
+def _parse_symmetry_operations(
+        raw: Any) -> tuple[Mapping[ID, ID], ...] | None:
+    if raw is None:
+        return None
+    return tuple(dict(mapping) for mapping in raw)
+
+
+def _parse_cache(raw: Mapping[str, Any], base_dir: Path) -> CacheConfig:
+    max_size = raw.get('max_size', DEFAULT_MAX_SIZE)
+    return CacheConfig(
+        dir=base_dir / Path(raw['dir']).expanduser(),
+        max_size=None if max_size is None else parse_size(max_size),
+    )
@@ -0,0 +1,378 @@
+"""Stages of the pipeline and their execution with caching.
+
+The stages run in order, each one saving its results to the output
+directory:
+
+1. ``assemblies``: enumerate (or load) the assemblies
+   -> ``assemblies.yaml``
+2. ``reactions``: enumerate the reactions -> ``reactions.csv``
+3. ``reverse_pairs``: pair the reverse reactions -> ``reverse_pairs.csv``
+4. ``classification``: classify the reactions
+   -> ``classification_result.csv``
+
+A stage is skipped if its configuration and its input files are unchanged
+since its last run and its output files are intact; this is recorded in
+``pipeline_manifest.json`` in the output directory.
+
+If a ``cache`` is configured, the enumeration stages which do run look up
+their results in the content-addressed `StageCache` first, so that the
+results are shared between output directories.
+"""
+import csv
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Literal
+
+from nasap_net.assembly_enumeration import enumerate_assemblies
+from nasap_net.helpers import assign_composition_formula_ids
+from nasap_net.io import load_assemblies, load_reactions, \
+    save_assemblies, save_classification_result, save_reactions
+from nasap_net.models import Assembly, Reaction
+from nasap_net.reaction_classification import classify_reactions
+from nasap_net.reaction_enumeration import enumerate_reactions
+from nasap_net.reaction_pairing import pair_reverse_reactions
+from nasap_net.types import ID
+from .cache import StageCache, nasap_net_version
+from .config import PipelineConfig, PipelineConfigError
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+MANIFEST_FILE_NAME = 'pipeline_manifest.json'
+ASSEMBLIES_FILE_NAME = 'assemblies.yaml'
+REACTIONS_FILE_NAME = 'reactions.csv'
+REVERSE_PAIRS_FILE_NAME = 'reverse_pairs.csv'
+CLASSIFICATION_FILE_NAME = 'classification_result.csv'
+
+StageStatus = Literal['run', 'cached', 'disabled']
+
+
+@dataclass(frozen=True)
+class StageReport:
+    """Result of a stage of a pipeline run.
+
+    Attributes
+    ----------
+    name : str
+        The name of the stage.
+    status : {'run', 'cached', 'disabled'}
+        Whether the stage was run, skipped because its results were up to
+        date, or disabled in the configuration.
+    elapsed : float
+        The time spent on the stage in seconds.
+    outputs : tuple[Path, ...]
+        The output files of the stage.
+    """
+    name: str
+    status: StageStatus
+    elapsed: float
+    outputs: tuple[Path, ...] = ()
+
+
+def run_pipeline(
+        config: PipelineConfig, *, force: bool = False,
+) -> list[StageReport]:
+    """Run the pipeline.
+
+    Parameters
+    ----------
+    config : PipelineConfig
+        The configuration, e.g., loaded with `load_pipeline_config`.
+    force : bool, optional
+        If True, all the stages are run even if their results are up to
+        date. Default is False.
+
+    Returns
+    -------
+    list[StageReport]
+        The reports of the stages, in order.
+    """
+    run = _PipelineRun(config, force=force)
+    return [
+        run.run_stage(
+            'assemblies', run.assemblies_fingerprint,
+            [ASSEMBLIES_FILE_NAME], run.compute_assemblies),
+        run.run_stage(
+            'reactions', run.reactions_fingerprint,
+            [REACTIONS_FILE_NAME], run.compute_reactions),
+        run.run_stage(
+            'reverse_pairs', run.reverse_pairs_fingerprint,
+            [REVERSE_PAIRS_FILE_NAME], run.compute_reverse_pairs,
+            enabled=config.reverse_pairing.enabled),
+        run.run_stage(
+            'classification', run.classification_fingerprint,
+            [CLASSIFICATION_FILE_NAME], run.compute_classification,
+            enabled=config.classification is not None),
+    ]
+
+
+class _PipelineRun:
+    def __init__(self, config: PipelineConfig, *, force: bool) -> None:
+        self.config = config
+        self.force = force
+        self.output_dir = config.output_dir
+        self.manifest_path = self.output_dir / MANIFEST_FILE_NAME
+        self.manifest: dict[str, Any] = {}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(
+                self.manifest_path.read_text(encoding='utf-8'))
+        self._assemblies: list[Assembly] | None = None
+        self._reactions: list[Reaction] | None = None
+        self.cache: StageCache | None = None
+        if config.cache is not None:
+            self.cache = StageCache(
+                config.cache.dir, max_size=config.cache.max_size)
+
+    def run_stage(
+            self,
+            name: str,
+            get_fingerprint: Callable[[], str],
+            output_names: Iterable[str],
+            compute: Callable[[], None],
+            *,
+            enabled: bool = True,
+    ) -> StageReport:
+        if not enabled:
+            logger.info('Stage "%s": disabled.', name)
+            return StageReport(name, 'disabled', 0.0)
+
+        start = time.perf_counter()
+        outputs = tuple(self.output_dir / name for name in output_names)
+        fingerprint = get_fingerprint()
+        entry = self.manifest.get(name)
+        if (not self.force and entry is not None
+                and entry['fingerprint'] == fingerprint
+                and self._outputs_intact(entry, outputs)):
+            elapsed = time.perf_counter() - start
+            logger.info(
+                'Stage "%s": up to date, skipped (%.2f s).', name, elapsed)
+            return StageReport(name, 'cached', elapsed, outputs)
+
+        logger.info('Stage "%s": running...', name)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        compute()
+        elapsed = time.perf_counter() - start
+        self.manifest[name] = {
+            'fingerprint': fingerprint,
+            'outputs': {path.name: _file_digest(path) for path in outputs},
+            'elapsed': elapsed,
+        }
+        self.manifest_path.write_text(
+            json.dumps(self.manifest, indent=2), encoding='utf-8')
+        logger.info('Stage "%s": done (%.2f s).', name, elapsed)
+        return StageReport(name, 'run', elapsed, outputs)
+
+    @staticmethod
+    def _outputs_intact(
+            entry: Mapping[str, Any], outputs: Iterable[Path]) -> bool:
+        return all(
+            path.exists() and entry['outputs'].get(path.name)
+            == _file_digest(path)
+            for path in outputs)
+
+    # Fingerprints
+
+    def _fingerprint(self, *parts: str) -> str:
+        return hashlib.sha256(
+            '\n'.join((nasap_net_version(), *parts)).encode()).hexdigest()
+
+    def _output_digest(self, name: str) -> str:
+        return _file_digest(self.output_dir / name)
+
+    def assemblies_fingerprint(self) -> str:
+        parts = [self.config.section_digest(
+            'components', 'assembly_enumeration')]
+        assemblies_file = self.config.assembly_enumeration.assemblies_file
+        if assemblies_file is not None:
+            parts.append(_file_digest(assemblies_file))
+        return self._fingerprint(*parts)
+
+    def reactions_fingerprint(self) -> str:
+        return self._fingerprint(
+            self.config.section_digest('reaction_enumeration'),
+            self._output_digest(ASSEMBLIES_FILE_NAME))
+
+    def reverse_pairs_fingerprint(self) -> str:
+        return self._fingerprint(
+            self.config.section_digest('reverse_pairing'),
+            self._output_digest(REACTIONS_FILE_NAME))
+
+    def classification_fingerprint(self) -> str:
+        return self._fingerprint(
+            self.config.section_digest('classification'),
+            self._output_digest(REACTIONS_FILE_NAME),
+            _source_digest(self.classifier))
+
+    # Inputs, loaded from the outputs of the previous stages if they were
+    # skipped
+
+    @property
+    def assemblies(self) -> list[Assembly]:
+        if self._assemblies is None:
+            self._assemblies = load_assemblies(
+                self.output_dir / ASSEMBLIES_FILE_NAME)
+        return self._assemblies
+
+    @property
+    def reactions(self) -> list[Reaction]:
+        if self._reactions is None:
+            assemblies = self.assemblies
+            components = [
+                comp for assembly in assemblies
+                for comp in assembly.components.values()]
+            self._reactions = load_reactions(
+                self.output_dir / REACTIONS_FILE_NAME,
+                assemblies,
+                assembly_id_type=_id_type(a.id_ for a in assemblies),
+                component_id_type=_id_type(
+                    comp_id for assembly in assemblies
+                    for comp_id in assembly.components),
+                site_id_type=_id_type(
+                    site_id for comp in components
+                    for site_id in comp.site_ids),
+                reaction_id_type='int',
+            )
+        return self._reactions
+
+    @cached_property
+    def classifier(self) -> Callable[[Reaction], str]:
+        assert self.config.classification is not None
+        return _import_classifier(
+            self.config.classification.classifier, self.config.base_dir)
+
+    # Stages
+
+    def compute_assemblies(self) -> None:
+        conf = self.config.assembly_enumeration
+        if conf.assemblies_file is not None:
+            assemblies = load_assemblies(conf.assemblies_file)
+        else:
+            assert conf.template is not None
+            assert conf.leaving_ligand is not None
+            enumerate_ = (
+                enumerate_assemblies if self.cache is None
+                else self.cache.enumerate_assemblies)
+            assemblies = enumerate_(
+                conf.template,
+                leaving_ligand=conf.leaving_ligand,
+                leaving_ligand_site=conf.leaving_ligand_site,
+                metal_kinds=conf.metal_kinds,
+                symmetry_operations=conf.symmetry_operations,
+                comp_kind_order_in_formula=conf.comp_kind_order_in_formula,
+            )
+            if conf.extra_assemblies:
+                # IDs are reassigned to keep them unique.
+                assemblies = assign_composition_formula_ids(
+                    [*assemblies, *conf.extra_assemblies],
+                    order=conf.comp_kind_order_in_formula)
+        save_assemblies(
+            assemblies, self.output_dir / ASSEMBLIES_FILE_NAME,
+            overwrite=True)
+        self._assemblies = assemblies
+        logger.info('%d assemblies.', len(assemblies))
+
+    def compute_reactions(self) -> None:
+        conf = self.config.reaction_enumeration
+        enumerate_ = (
+            enumerate_reactions if self.cache is None
+            else self.cache.enumerate_reactions)
+        reactions = [
+            reaction.copy_with(id_=i)
+            for i, reaction in enumerate(enumerate_(
+                self.assemblies, conf.mle_kinds,
+                min_temp_ring_size=conf.min_temp_ring_size,
+                num_workers=conf.num_workers,
+                chunksize=conf.chunksize,
+            ))
+        ]
+        save_reactions(
+            reactions, self.output_dir / REACTIONS_FILE_NAME, overwrite=True)
+        self._reactions = reactions
+        logger.info('%d reactions.', len(reactions))
+
+    def compute_reverse_pairs(self) -> None:
+        reaction_to_reverse = pair_reverse_reactions(self.reactions)
+        with open(
+                self.output_dir / REVERSE_PAIRS_FILE_NAME, 'w', newline='',
+                encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'reverse_id'])
+            for id_, reverse_id in reaction_to_reverse.items():
+                writer.writerow(
+                    [id_, '' if reverse_id is None else reverse_id])
+
+    def compute_classification(self) -> None:
+        conf = self.config.classification
+        assert conf is not None
+        reaction_to_class = classify_reactions(
+            self.reactions, self.classifier,
+            num_workers=conf.num_workers, chunksize=conf.chunksize,
+            log_level=None)
+        save_classification_result(
+            reaction_to_class, self.output_dir / CLASSIFICATION_FILE_NAME,
+            overwrite=True)
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _source_digest(obj: Any) -> str:
+    source_file = inspect.getsourcefile(obj)
+    if source_file is None:
+        return ''
+    return _file_digest(Path(source_file))
+
+
+def _id_type(ids: Iterable[ID]) -> Literal['str', 'int']:
+    types = {type(id_) for id_ in ids}
+    if types <= {int}:
+        return 'int'
+    if types <= {str}:
+        return 'str'
+    raise ValueError(
+        'IDs mixing str and int cannot be restored from CSV files.')
+
+
+def _import_classifier(spec: str, base_dir: Path) -> Callable[[Reaction], str]:
+    """Import a classifier given as ``module:name`` or ``path.py:name``.
+
+    A file is imported as a module named after it, with its directory
+    added to `sys.path`, so that the classifier can be pickled to worker
+    processes.
+    """
+    module_name, sep, attr = spec.rpartition(':')
+    if not sep or not module_name or not attr:
+        raise PipelineConfigError(
+            f'Invalid classifier "{spec}"; expected "module:name" or '
+            f'"path/to/file.py:name".')
+    if module_name.endswith('.py'):
+        path = (base_dir / module_name).resolve()
+        if str(path.parent) not in sys.path:
+            sys.path.insert(0, str(path.parent))
+        module_name = path.stem
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise PipelineConfigError(
+            f'Cannot import classifier module "{module_name}": {e}'
+        ) from e
+    try:
+        return getattr(module, attr)
+    except AttributeError:
+        raise PipelineConfigError(
+            f'Classifier "{attr}" not found in module "{module_name}".'
+        ) from None
@@ -0,0 +1,125 @@
+import pytest
+
+from nasap_net.models import Assembly, Bond, Component, MLEKind
+from nasap_net.pipeline import StageCache, parse_size
+
+
+@pytest.fixture
+def M():
+    return Component(kind='M', sites=[0, 1])
+
+
+@pytest.fixture
+def L():
+    return Component(kind='L', sites=[0, 1])
+
+
+@pytest.fixture
+def X():
+    return Component(kind='X', sites=[0])
+
+
+@pytest.fixture
+def M2L2(M, L):
+    return Assembly(
+        components={'M0': M, 'M1': M, 'L0': L, 'L1': L},
+        bonds=[
+            Bond('M0', 1, 'L0', 0), Bond('L0', 1, 'M1', 0),
+            Bond('M1', 1, 'L1', 0), Bond('L1', 1, 'M0', 0)])
+
+
+@pytest.fixture
+def mle_kinds():
+    return [MLEKind('M', 'X', 'L'), MLEKind('M', 'L', 'X')]
+
+
+def test_enumerate_assemblies(tmp_path, M2L2, X):
+    cache = StageCache(tmp_path)
+    first = cache.enumerate_assemblies(
+        M2L2, leaving_ligand=X, metal_kinds=['M'])
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    second = StageCache(tmp_path).enumerate_assemblies(
+        M2L2, leaving_ligand=X, metal_kinds=['M'])
+    assert second == first
+    assert [a.id_ for a in second] == [a.id_ for a in first]
+
+
+def test_enumerate_reactions(tmp_path, M2L2, X, mle_kinds):
+    cache = StageCache(tmp_path)
+    assemblies = cache.enumerate_assemblies(
+        M2L2, leaving_ligand=X, metal_kinds=['M'])
+    first = cache.enumerate_reactions(assemblies, mle_kinds)
+    second = cache.enumerate_reactions(assemblies, mle_kinds)
+    assert cache.hits == 1
+    assert second == first
+
+
+def test_key_depends_on_inputs(M2L2, M, X, mle_kinds):
+    key = StageCache.assemblies_key(
+        M2L2, leaving_ligand=X, metal_kinds=['M'])
+    assert key == StageCache.assemblies_key(
+        M2L2.copy_with(), leaving_ligand=X, metal_kinds={'M'})
+    assert key != StageCache.assemblies_key(
+        M2L2, leaving_ligand=Component(kind='X', sites=[1]),
+        metal_kinds=['M'])
+    assert key != StageCache.assemblies_key(
+        M2L2, leaving_ligand=X, metal_kinds=['M'],
+        symmetry_operations=[{'M0': 'M1', 'M1': 'M0', 'L0': 'L1', 'L1': 'L0'}])
+
+    assemblies = [M2L2.copy_with(id_='M2L2')]
+    key = StageCache.reactions_key(assemblies, mle_kinds)
+    assert key != StageCache.reactions_key(assemblies, mle_kinds[:1])
+    assert key != StageCache.reactions_key(
+        assemblies, mle_kinds, min_temp_ring_size=3)
+    assert key != StageCache.reactions_key(
+        [M2L2.copy_with(id_=1)], mle_kinds)
+
+
+def test_key_distinguishes_id_types(M, X):
+    str_ids = Assembly(components={'0': M}, bonds=[])
+    int_ids = Assembly(components={0: M}, bonds=[])
+    assert StageCache.assemblies_key(
+        str_ids, leaving_ligand=X, metal_kinds=['M']
+    ) != StageCache.assemblies_key(
+        int_ids, leaving_ligand=X, metal_kinds=['M'])
+
+
+def test_eviction(tmp_path, M2L2, X, mle_kinds):
+    cache = StageCache(tmp_path)
+    assemblies = cache.enumerate_assemblies(
+        M2L2, leaving_ligand=X, metal_kinds=['M'])
+    cache.enumerate_reactions(assemblies, mle_kinds)
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # Only the most recently used entry fits.
+    cache.max_size = cache.size - 1
+    cache.enumerate_reactions(assemblies, mle_kinds)
+    cache.evict()
+    assert [path.name.split('-')[0] for path in tmp_path.iterdir()] == [
+        'reactions']
+
+
+def test_clear(tmp_path, M2L2, X):
+    cache = StageCache(tmp_path)
+    cache.enumerate_assemblies(M2L2, leaving_ligand=X, metal_kinds=['M'])
+    assert cache.size > 0
+    cache.clear()
+    assert cache.size == 0
+
+
+@pytest.mark.parametrize('size, expected', [
+    (100, 100),
+    ('100', 100),
+    ('2KB', 2048),
+    ('1.5 MiB', 3 << 19),
+    ('2GB', 2 << 30),
+])
+def test_parse_size(size, expected):
+    assert parse_size(size) == expected
+
+
+@pytest.mark.parametrize('size', [-1, 'abc', '-1MB'])
+def test_parse_size_invalid(size):
+    with pytest.raises(ValueError):
+        parse_size(size)
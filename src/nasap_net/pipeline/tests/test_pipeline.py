@@ -0,0 +1,202 @@
+import json
+
+import pytest
+import yaml
+
+from nasap_net.cli import main
+from nasap_net.models import Reaction
+from nasap_net.pipeline import PipelineConfigError, load_pipeline_config, \
+    parse_pipeline_config, run_pipeline
+
+
+def classify(reaction: Reaction) -> str:
+    return 'inter' if reaction.is_inter() else 'intra'
+
+
+@pytest.fixture
+def raw_config():
+    return {
+        'output_dir': 'out',
+        'components': {
+            'M': {'sites': [0, 1]},
+            'L': {'sites': [0, 1]},
+            'X': {'sites': [0]},
+        },
+        'assembly_enumeration': {
+            'template': {
+                'components': {'M0': 'M', 'M1': 'M', 'L0': 'L', 'L1': 'L'},
+                'bonds': [
+                    ['M0', 1, 'L0', 0], ['L0', 1, 'M1', 0],
+                    ['M1', 1, 'L1', 0], ['L1', 1, 'M0', 0]],
+            },
+            'leaving_ligand': 'X',
+            'metal_kinds': ['M'],
+            'comp_kind_order_in_formula': ['M', 'L', 'X'],
+        },
+        'reaction_enumeration': {
+            'mle_kinds': [
+                {'metal': 'M', 'leaving': 'X', 'entering': 'L'},
+                {'metal': 'M', 'leaving': 'L', 'entering': 'X'},
+            ],
+        },
+        'classification': {
+            'classifier': f'{__name__}:classify',
+        },
+    }
+
+
+@pytest.fixture
+def config_file(tmp_path, raw_config):
+    path = tmp_path / 'config.yaml'
+    path.write_text(yaml.safe_dump(raw_config), encoding='utf-8')
+    return path
+
+
+def _statuses(reports):
+    return {report.name: report.status for report in reports}
+
+
+def test_parse(raw_config, tmp_path):
+    config = parse_pipeline_config(raw_config, base_dir=tmp_path)
+    assert config.output_dir == tmp_path / 'out'
+    assert config.assembly_enumeration.metal_kinds == ('M',)
+    assert len(config.reaction_enumeration.mle_kinds) == 2
+    assert config.reverse_pairing.enabled
+    assert config.classification is not None
+
+
+def test_parse_invalid(raw_config):
+    del raw_config['reaction_enumeration']
+    with pytest.raises(PipelineConfigError):
+        parse_pipeline_config(raw_config)
+
+
+def test_parse_unknown_option(raw_config):
+    raw_config['reaction_enumeration']['unknown'] = 1
+    with pytest.raises(PipelineConfigError):
+        parse_pipeline_config(raw_config)
+
+
+def test_section_digest_ignores_num_workers(raw_config):
+    digest = parse_pipeline_config(raw_config).section_digest(
+        'reaction_enumeration')
+    raw_config['reaction_enumeration']['num_workers'] = 4
+    assert parse_pipeline_config(raw_config).section_digest(
+        'reaction_enumeration') == digest
+
+
+def test_run(config_file):
+    config = load_pipeline_config(config_file)
+    reports = run_pipeline(config)
+    assert _statuses(reports) == {
+        'assemblies': 'run', 'reactions': 'run',
+        'reverse_pairs': 'run', 'classification': 'run'}
+    out = config.output_dir
+    for name in [
+            'assemblies.yaml', 'reactions.csv', 'reverse_pairs.csv',
+            'classification_result.csv', 'pipeline_manifest.json']:
+        assert (out / name).exists()
+    manifest = json.loads(
+        (out / 'pipeline_manifest.json').read_text(encoding='utf-8'))
+    assert set(manifest) == {
+        'assemblies', 'reactions', 'reverse_pairs', 'classification'}
+
+
+def test_rerun_cached(config_file):
+    config = load_pipeline_config(config_file)
+    run_pipeline(config)
+    reports = run_pipeline(config)
+    assert set(_statuses(reports).values()) == {'cached'}
+
+    reports = run_pipeline(config, force=True)
+    assert set(_statuses(reports).values()) == {'run'}
+
+
+def test_rerun_after_config_change(config_file, raw_config):
+    run_pipeline(load_pipeline_config(config_file))
+
+    raw_config['reaction_enumeration']['mle_kinds'].pop()
+    config_file.write_text(yaml.safe_dump(raw_config), encoding='utf-8')
+    reports = run_pipeline(load_pipeline_config(config_file))
+    assert _statuses(reports) == {
+        'assemblies': 'cached', 'reactions': 'run',
+        'reverse_pairs': 'run', 'classification': 'run'}
+
+
+def test_rerun_after_output_change(config_file):
+    config = load_pipeline_config(config_file)
+    run_pipeline(config)
+
+    reactions_file = config.output_dir / 'reactions.csv'
+    reactions_file.write_text('', encoding='utf-8')
+    reports = run_pipeline(config)
+    assert _statuses(reports) == {
+        'assemblies': 'cached', 'reactions': 'run',
+        'reverse_pairs': 'cached', 'classification': 'cached'}
+
+
+def test_disabled_stages(config_file, raw_config):
+    raw_config['reverse_pairing'] = {'enabled': False}
+    del raw_config['classification']
+    config_file.write_text(yaml.safe_dump(raw_config), encoding='utf-8')
+    reports = run_pipeline(load_pipeline_config(config_file))
+    assert _statuses(reports) == {
+        'assemblies': 'run', 'reactions': 'run',
+        'reverse_pairs': 'disabled', 'classification': 'disabled'}
+
+
+def test_classifier_file(config_file, raw_config, tmp_path):
+    (tmp_path / 'pipeline_test_rules.py').write_text(
+        'def classify(reaction):\n    return "any"\n', encoding='utf-8')
+    raw_config['classification'] = {
+        'classifier': 'pipeline_test_rules.py:classify'}
+    config_file.write_text(yaml.safe_dump(raw_config), encoding='utf-8')
+    config = load_pipeline_config(config_file)
+    run_pipeline(config)
+    result = (config.output_dir / 'classification_result.csv').read_text(
+        encoding='utf-8')
+    assert 'any' in result
+
+
+def test_cli(config_file, capsys):
+    assert main(['run', str(config_file)]) == 0
+    assert 'classification' in capsys.readouterr().out
+
+
+def test_cli_invalid_config(tmp_path, capsys):
+    path = tmp_path / 'config.yaml'
+    path.write_text('- not a mapping\n', encoding='utf-8')
+    assert main(['run', str(path)]) == 2
+    assert 'error' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('classifier', [
+    'no_separator', f'{__name__}:missing', 'nasap_net_missing_module:f'])
+def test_cli_invalid_classifier(config_file, raw_config, classifier, capsys):
+    raw_config['classification'] = {'classifier': classifier}
+    config_file.write_text(yaml.safe_dump(raw_config), encoding='utf-8')
+    assert main(['run', str(config_file)]) == 2
+    assert capsys.readouterr().err.startswith('nasap-net: error: ')
+
+
+def test_cli_missing_config(tmp_path, capsys):
+    assert main(['run', str(tmp_path / 'missing.yaml')]) == 2
+    assert capsys.readouterr().err.startswith('nasap-net: error: ')
+
+
+def test_shared_cache(tmp_path, raw_config):
+    raw_config['cache'] = {'dir': 'cache', 'max_size': '10MB'}
+    raw_config['output_dir'] = 'out1'
+    first = parse_pipeline_config(raw_config, base_dir=tmp_path)
+    raw_config['output_dir'] = 'out2'
+    second = parse_pipeline_config(raw_config, base_dir=tmp_path)
+    assert first.cache is not None
+    assert first.cache.max_size == 10 << 20
+
+    run_pipeline(first)
+    assert len(list((tmp_path / 'cache').iterdir())) == 2
+    run_pipeline(second)
+    assert len(list((tmp_path / 'cache').iterdir())) == 2
+    for name in ['assemblies.yaml', 'reactions.csv']:
+        assert (tmp_path / 'out1' / name).read_bytes() == (
+            tmp_path / 'out2' / name).read_bytes()
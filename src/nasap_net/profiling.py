@@ -0,0 +1,159 @@
+"""Opt-in instrumentation of the hot paths of nasap-net.
+
+Calls of the instrumented functions (e.g., `convert_assembly_to_graph`,
+`is_isomorphic` and `EquivalentAssemblyFinder.find`) are counted and timed,
+and some events (e.g., VF2 outcomes and candidate bucket sizes) are
+recorded, while a `profiling` context is active::
+
+    from nasap_net.profiling import profiling
+
+    with profiling() as profile:
+        reactions = list(enumerate_reactions(assemblies))
+    print(profile.to_json())
+
+When no context is active, no data is collected, but each call of an
+instrumented function still goes through a wrapper that checks a
+module-level variable. Only functions doing substantial work per call are
+instrumented, so that this overhead is negligible; cheap functions called
+for every object (e.g., the validation in the `Assembly` constructor) are
+not.
+
+The data is collected in the current process only; calls in worker
+processes (e.g., of `classify_reactions` with `num_workers`) are not
+recorded.
+"""
+import functools
+import json
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+class Profile:
+    """Data collected while a `profiling` context is active.
+
+    Attributes
+    ----------
+    call_counts : Counter[str]
+        The number of calls of each instrumented function.
+    call_times : defaultdict[str, float]
+        The total time in seconds spent in each instrumented function,
+        including the nested calls.
+    counters : Counter[str]
+        Counts of events, e.g., ``'vf2.isomorphic'``.
+    histograms : defaultdict[str, Counter[Hashable]]
+        Histograms of recorded values,
+        e.g., ``'finder.signature_bucket_size'``.
+    """
+    def __init__(self) -> None:
+        self.call_counts: Counter[str] = Counter()
+        self.call_times: defaultdict[str, float] = defaultdict(float)
+        self.counters: Counter[str] = Counter()
+        self.histograms: defaultdict[str, Counter[Hashable]] = \
+            defaultdict(Counter)
+
+    def report(self) -> dict[str, Any]:
+        """Return the collected data as a JSON-serializable dict.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dict with the keys:
+
+            - ``'calls'``: for each function, a dict with ``'count'``,
+              ``'total_time'`` and ``'mean_time'`` (in seconds).
+            - ``'counters'``: the event counts.
+            - ``'histograms'``: for each histogram, a dict from the
+              recorded values (as strings) to their counts, sorted by value.
+        """
+        return {
+            'calls': {
+                name: {
+                    'count': num_calls,
+                    'total_time': self.call_times[name],
+                    'mean_time': self.call_times[name] / num_calls,
+                }
+                for name, num_calls in sorted(self.call_counts.items())
+            },
+            'counters': dict(sorted(self.counters.items())),
+            'histograms': {
+                name: {
+                    str(value): num for value, num
+                    in sorted(histogram.items(), key=_histogram_sort_key)
+                }
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+    def to_json(self, *, indent: int | None = 2) -> str:
+        """Return `report` as a JSON string."""
+        return json.dumps(self.report(), indent=indent)
+
+
+_active_profile: Profile | None = None
+
+
+@contextmanager
+def profiling() -> Iterator[Profile]:
+    """Collect profiling data within the context.
+
+    Contexts can be nested; data is collected by the innermost one only.
+
+    Yields
+    ------
+    Profile
+        The profile the data is collected in. It can be inspected
+        after the context exits.
+    """
+    global _active_profile
+    outer = _active_profile
+    profile = Profile()
+    _active_profile = profile
+    try:
+        yield profile
+    finally:
+        _active_profile = outer
+
+
+def profiled(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator counting and timing the calls of a function under a name.
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            profile = _active_profile
+            if profile is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.call_times[name] += time.perf_counter() - start
+                profile.call_counts[name] += 1
+        return wrapper
+    return decorator
+
+
+def count(name: str, n: int = 1) -> None:
+    """Count an event if profiling is active."""
+    if _active_profile is not None:
+        _active_profile.counters[name] += n
+
+
+def record(name: str, value: Hashable) -> None:
+    """Record a value in a histogram if profiling is active."""
+    if _active_profile is not None:
+        _active_profile.histograms[name][value] += 1
+
+
+def _histogram_sort_key(item: tuple[Hashable, int]) -> tuple[str, Any]:
+    value = item[0]
+    # Sort numbers numerically and the other values by their strings.
+    if isinstance(value, (int, float)):
+        return ('', value)
+    return (type(value).__name__, str(value))
@@ -0,0 +1,119 @@
+"""Structured progress reports of long-running enumerations.
+
+Functions accepting a ``progress_callback`` call it with a `Progress`
+snapshot at most once per ``progress_interval`` seconds, and once more
+when they finish (with ``finished=True``)::
+
+    def print_progress(progress: Progress) -> None:
+        print(f'{progress.done}/{progress.total} eta={progress.eta}')
+
+    reactions = list(enumerate_reactions(
+        assemblies, mle_kinds, progress_callback=print_progress))
+
+The callback is always called in the calling process, also when the work
+is distributed to worker processes. When no callback is given, nothing is
+measured.
+"""
+import time
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+DEFAULT_PROGRESS_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class Progress:
+    """Snapshot of the progress of a task.
+
+    Attributes
+    ----------
+    task : str
+        The name of the task, e.g., ``'enumerate_reactions'``.
+    done : int
+        The number of units done.
+    total : int | None
+        The total number of units, or None if unknown in advance.
+    elapsed : float
+        The time elapsed since the start of the task, in seconds.
+    counts : Mapping[Hashable, int]
+        Task-specific counts, e.g., the number of reactions found.
+    finished : bool
+        Whether the task has finished.
+    """
+    task: str
+    done: int
+    total: int | None
+    elapsed: float
+    counts: Mapping[Hashable, int] = field(
+        default_factory=lambda: MappingProxyType({}))
+    finished: bool = False
+
+    @property
+    def throughput(self) -> float | None:
+        """The number of units done per second, or None if unknown."""
+        if self.elapsed <= 0:
+            return None
+        return self.done / self.elapsed
+
+    @property
+    def eta(self) -> float | None:
+        """The estimated remaining time in seconds, or None if unknown."""
+        if self.finished:
+            return 0.0
+        throughput = self.throughput
+        if self.total is None or not throughput:
+            return None
+        return (self.total - self.done) / throughput
+
+
+ProgressCallback = Callable[[Progress], None]
+
+
+class ProgressReporter:
+    """Helper to call a progress callback at a limited rate.
+
+    Task implementations call `advance` for each unit done and update
+    `counts` in place; the callback is called when at least `interval`
+    seconds have passed since the last call, and by `finish`.
+    """
+    def __init__(
+            self,
+            callback: ProgressCallback,
+            task: str,
+            *,
+            total: int | None = None,
+            interval: float = DEFAULT_PROGRESS_INTERVAL,
+    ) -> None:
+        if interval < 0:
+            raise ValueError('interval must be non-negative')
+        self.callback = callback
+        self.task = task
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.counts: dict[Hashable, int] = {}
+        self._start = time.monotonic()
+        self._next_report = self._start + interval
+
+    def advance(self, n: int = 1) -> None:
+        """Mark `n` units as done, and report if due."""
+        self.done += n
+        now = time.monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self.interval
+            self._report(now, finished=False)
+
+    def finish(self) -> None:
+        """Report the final progress."""
+        self._report(time.monotonic(), finished=True)
+
+    def _report(self, now: float, *, finished: bool) -> None:
+        self.callback(Progress(
+            task=self.task,
+            done=self.done,
+            total=self.total,
+            elapsed=now - self._start,
+            counts=MappingProxyType(dict(self.counts)),
+            finished=finished,
+        ))
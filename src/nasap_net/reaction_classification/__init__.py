@@ -1,6 +1,10 @@
-from .connection_count import get_connection_count_of_kind
+from .assembly_cache import clear_assembly_cache, get_connection_count_matrix
+from .connection_count import get_connection_count_of_kind, \
+    get_connection_counts_of_kind
+from .connection_matrix import ConnectionCountMatrix
 from .exceptions import IncompleteReactionClassifierError
 from .execution import classify_reactions
+from .feature_table import FEATURE_COLUMNS, build_reaction_feature_table
 from .models import ReactionToClassify
 from .ring_breaking_size import get_min_breaking_ring_size
 from .ring_formation_size import get_min_forming_ring_size
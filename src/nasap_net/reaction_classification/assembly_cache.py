@@ -0,0 +1,101 @@
+"""Per-assembly cache of quantities derived during reaction classification.
+
+Reactions in a network share a comparatively small number of assemblies,
+so quantities that only depend on an assembly (rough graphs, distances
+between components, connection counts) are computed once per assembly and
+reused by every reaction that refers to it.
+
+The caches are bounded LRU caches local to the current process; each worker
+of a parallel classification keeps its own copy.
+"""
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+from nasap_net.models import Assembly
+from nasap_net.models.assembly import BondNotFoundError
+from nasap_net.rough_graph import convert_assembly_to_rough_graph
+from nasap_net.rough_graph.conversion import RoughGraphConversionResult
+from nasap_net.types import ID
+from .connection_matrix import ConnectionCountMatrix
+
+ASSEMBLY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ASSEMBLY_CACHE_SIZE)
+def get_rough_graph(assembly: Assembly) -> RoughGraphConversionResult:
+    """Return the rough graph of the assembly.
+
+    The returned graph is shared between callers and must not be modified.
+    """
+    return convert_assembly_to_rough_graph(assembly)
+
+
+@lru_cache(maxsize=ASSEMBLY_CACHE_SIZE)
+def get_component_distances(
+        assembly: Assembly,
+        source_component_id: ID,
+        *,
+        excluded_neighbor_id: ID | None = None,
+) -> Mapping[ID, int]:
+    """Return the distances from a component to all reachable components.
+
+    The distance is the number of bonds on the shortest path between
+    two components.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        The assembly containing the components.
+    source_component_id : ID
+        The ID of the component to measure the distances from.
+    excluded_neighbor_id : ID | None, optional
+        If given, the bond between the source component and this component
+        is ignored, as if it had been removed from the assembly.
+        Default is None.
+
+    Returns
+    -------
+    Mapping[ID, int]
+        A mapping from the IDs of the reachable components
+        (including the source itself) to their distances.
+        Unreachable components are not included.
+
+    Raises
+    ------
+    BondNotFoundError
+        If `excluded_neighbor_id` is given but there is no bond between it
+        and the source component.
+    """
+    conv_res = get_rough_graph(assembly)
+    graph = conv_res.graph
+    source = conv_res.core_mapping[source_component_id]
+
+    if excluded_neighbor_id is not None:
+        if not assembly.has_bond_between_components(
+                source_component_id, excluded_neighbor_id):
+            raise BondNotFoundError(
+                comp_id1=source_component_id, comp_id2=excluded_neighbor_id)
+        graph = graph.copy()
+        graph.delete_edges([
+            (source, conv_res.core_mapping[excluded_neighbor_id])])
+
+    (distances,) = graph.distances(source=[source])
+    return MappingProxyType({
+        comp_id: int(distances[v_index])
+        for comp_id, v_index in conv_res.core_mapping.items()
+        if distances[v_index] != float('inf')
+    })
+
+
+@lru_cache(maxsize=ASSEMBLY_CACHE_SIZE)
+def get_connection_count_matrix(assembly: Assembly) -> ConnectionCountMatrix:
+    """Return the component × kind connection count matrix of the assembly."""
+    return ConnectionCountMatrix.from_assembly(assembly)
+
+
+def clear_assembly_cache() -> None:
+    """Clear all per-assembly caches of the current process."""
+    get_rough_graph.cache_clear()
+    get_component_distances.cache_clear()
+    get_connection_count_matrix.cache_clear()
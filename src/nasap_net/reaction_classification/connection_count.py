@@ -1,5 +1,11 @@
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
 from nasap_net.models import Assembly
 from nasap_net.types import ID
+from .assembly_cache import get_connection_count_matrix
 
 
 def get_connection_count_of_kind(
@@ -23,15 +29,56 @@ def get_connection_count_of_kind(
     int
         The number of connections from the source component to components of the target kind.
     """
-    count = 0
-    for bond in assembly.bonds:
-        comp_id1, comp_id2 = bond.component_ids
-        if source_component_id == comp_id1:
-            other_comp_id = comp_id2
-        elif source_component_id == comp_id2:
-            other_comp_id = comp_id1
-        else:
-            continue
-        if assembly.components[other_comp_id].kind == target_kind:
-            count += 1
-    return count
+    if source_component_id not in assembly.components:
+        return 0
+    return get_connection_count_matrix(assembly).count(
+        source_component_id, target_kind)
+
+
+def get_connection_counts_of_kind(
+        assemblies: Sequence[Assembly],
+        source_component_ids: Sequence[ID],
+        target_kinds: Sequence[str],
+) -> npt.NDArray[np.int64]:
+    """Get the connection counts for a batch of queries.
+
+    Vectorized version of `get_connection_count_of_kind`.
+    Queries on the same assembly are answered by a single indexing of
+    the cached connection count matrix of the assembly.
+
+    Parameters
+    ----------
+    assemblies : Sequence[Assembly]
+        The assemblies containing the source components.
+    source_component_ids : Sequence[ID]
+        The IDs of the source components.
+    target_kinds : Sequence[str]
+        The kinds of the target components.
+
+    Returns
+    -------
+    npt.NDArray[np.int64]
+        ``result[i]`` is the number of connections from the component
+        ``source_component_ids[i]`` of ``assemblies[i]`` to components of
+        the kind ``target_kinds[i]``.
+
+    Raises
+    ------
+    ValueError
+        If the lengths of the arguments differ.
+    """
+    n = len(assemblies)
+    if len(source_component_ids) != n or len(target_kinds) != n:
+        raise ValueError('All arguments must have the same length.')
+
+    positions_by_assembly: dict[Assembly, list[int]] = {}
+    for i, assembly in enumerate(assemblies):
+        positions_by_assembly.setdefault(assembly, []).append(i)
+
+    result = np.zeros(n, dtype=np.int64)
+    for assembly, positions in positions_by_assembly.items():
+        matrix = get_connection_count_matrix(assembly)
+        result[positions] = matrix.take(
+            [source_component_ids[i] for i in positions],
+            [target_kinds[i] for i in positions])
+    return result
@@ -0,0 +1,129 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+
+from nasap_net.models import Assembly
+from nasap_net.types import ID
+
+
+@dataclass(frozen=True, init=False, eq=False)
+class ConnectionCountMatrix:
+    """Component × kind matrix of the connection counts of an assembly.
+
+    ``counts[i, j]`` is the number of bonds between the component
+    ``component_ids[i]`` and components of the kind ``kinds[j]``.
+
+    Use `from_assembly` to build the matrix of an assembly, or
+    `get_connection_count_matrix` to get the cached one.
+    """
+    component_ids: tuple[ID, ...]
+    kinds: tuple[str, ...]
+    counts: npt.NDArray[np.int64]
+    _component_index: dict[ID, int] = field(repr=False)
+    _kind_index: dict[str, int] = field(repr=False)
+
+    def __init__(
+            self,
+            component_ids: Iterable[ID],
+            kinds: Iterable[str],
+            counts: npt.ArrayLike,
+    ):
+        component_ids = tuple(component_ids)
+        kinds = tuple(kinds)
+        counts = np.array(counts, dtype=np.int64)
+        if counts.shape != (len(component_ids), len(kinds)):
+            raise ValueError(
+                f'Shape of counts {counts.shape} does not match '
+                f'({len(component_ids)}, {len(kinds)}).')
+        counts.flags.writeable = False
+        object.__setattr__(self, 'component_ids', component_ids)
+        object.__setattr__(self, 'kinds', kinds)
+        object.__setattr__(self, 'counts', counts)
+        object.__setattr__(
+            self, '_component_index',
+            {comp_id: i for i, comp_id in enumerate(component_ids)})
+        object.__setattr__(
+            self, '_kind_index', {kind: j for j, kind in enumerate(kinds)})
+
+    @classmethod
+    def from_assembly(cls, assembly: Assembly) -> Self:
+        """Build the connection count matrix of an assembly."""
+        component_ids = tuple(assembly.components)
+        kinds = tuple(sorted(
+            {comp.kind for comp in assembly.components.values()}))
+        comp_index = {comp_id: i for i, comp_id in enumerate(component_ids)}
+        kind_index = {kind: j for j, kind in enumerate(kinds)}
+
+        # Each bond contributes to both of its ends.
+        rows = np.empty(2 * len(assembly.bonds), dtype=np.intp)
+        cols = np.empty(2 * len(assembly.bonds), dtype=np.intp)
+        for i, bond in enumerate(assembly.bonds):
+            comp_id1, comp_id2 = bond.component_ids
+            rows[2 * i] = comp_index[comp_id1]
+            cols[2 * i] = kind_index[assembly.components[comp_id2].kind]
+            rows[2 * i + 1] = comp_index[comp_id2]
+            cols[2 * i + 1] = kind_index[assembly.components[comp_id1].kind]
+
+        counts = np.zeros((len(component_ids), len(kinds)), dtype=np.int64)
+        np.add.at(counts, (rows, cols), 1)
+        return cls(component_ids, kinds, counts)
+
+    def count(self, component_id: ID, kind: str) -> int:
+        """Return the number of connections from a component
+        to components of a kind.
+
+        Returns 0 if the assembly has no component of the kind.
+
+        Raises
+        ------
+        KeyError
+            If the component is not in the assembly.
+        """
+        j = self._kind_index.get(kind)
+        if j is None:
+            return 0
+        return int(self.counts[self._component_index[component_id], j])
+
+    def take(
+            self,
+            component_ids: Sequence[ID],
+            kinds: Sequence[str],
+    ) -> npt.NDArray[np.int64]:
+        """Return the connection counts for pairs of components and kinds.
+
+        Parameters
+        ----------
+        component_ids : Sequence[ID]
+            The IDs of the source components.
+        kinds : Sequence[str]
+            The target kinds, one for each source component.
+
+        Returns
+        -------
+        npt.NDArray[np.int64]
+            ``result[i]`` is the number of connections from
+            ``component_ids[i]`` to components of the kind ``kinds[i]``.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of `component_ids` and `kinds` differ.
+        KeyError
+            If any of the components is not in the assembly.
+        """
+        if len(component_ids) != len(kinds):
+            raise ValueError(
+                'component_ids and kinds must have the same length.')
+        rows = np.fromiter(
+            (self._component_index[comp_id] for comp_id in component_ids),
+            dtype=np.intp, count=len(component_ids))
+        cols = np.fromiter(
+            (self._kind_index.get(kind, -1) for kind in kinds),
+            dtype=np.intp, count=len(kinds))
+        known = cols >= 0
+        result = np.zeros(len(rows), dtype=np.int64)
+        result[known] = self.counts[rows[known], cols[known]]
+        return result
@@ -1,4 +1,4 @@
-from nasap_net import Reaction
+from nasap_net.models import Reaction
 
 
 class IncompleteReactionClassifierError(Exception):
@@ -1,7 +1,8 @@
 import logging
 from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 
-from nasap_net import Reaction
+from nasap_net.models import Reaction
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -9,12 +10,70 @@ logger.addHandler(logging.NullHandler())
 def classify_reactions(
         reactions: Iterable[Reaction],
         classifier: Callable[[Reaction], str],
+        *,
+        num_workers: int | None = None,
+        chunksize: int = 256,
+        log_level: int | None = logging.INFO,
 ) -> dict[Reaction, str]:
-    result = {}
-    for reaction in reactions:
-        cls = classifier(reaction)
-        result[reaction] = cls
+    """Classify reactions using a user-defined classifier.
+
+    Parameters
+    ----------
+    reactions : Iterable[Reaction]
+        The reactions to classify.
+    classifier : Callable[[Reaction], str]
+        A function that returns the class of a reaction.
+    num_workers : int | None, optional
+        The number of worker processes. If None or 1, the reactions are
+        classified serially in the current process. Otherwise, the reactions
+        are dispatched to a process pool in chunks of `chunksize` reactions;
+        in that case, `classifier` must be picklable, e.g., a function
+        defined at the top level of a module. Default is None.
+    chunksize : int, optional
+        The number of reactions sent to a worker at once in parallel mode.
+        Consecutive reactions tend to share assemblies, so larger chunks make
+        better use of the per-assembly caches of the workers.
+        Default is 256.
+    log_level : int | None, optional
+        The logging level of the message logged for each classified reaction.
+        If None, no per-reaction message is logged. Default is logging.INFO.
+
+    Returns
+    -------
+    dict[Reaction, str]
+        A mapping from each reaction to its class, in the order of the input.
 
-        logger.info("%s -> %s", reaction, cls)
+    Raises
+    ------
+    ValueError
+        If `num_workers` or `chunksize` is less than 1.
+    Exception
+        Any exception raised by `classifier` is propagated,
+        e.g., IncompleteReactionClassifierError.
+    """
+    if num_workers is not None and num_workers < 1:
+        raise ValueError("num_workers must be a positive integer")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
 
+    if num_workers is None or num_workers == 1:
+        result = {}
+        for reaction in reactions:
+            cls = classifier(reaction)
+            result[reaction] = cls
+            if log_level is not None:
+                logger.log(log_level, "%s -> %s", reaction, cls)
+        return result
+
+    reactions = list(reactions)
+    result = {}
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        classes = executor.map(classifier, reactions, chunksize=chunksize)
+        for reaction, cls in zip(reactions, classes):
+            result[reaction] = cls
+            if log_level is not None:
+                logger.log(log_level, "%s -> %s", reaction, cls)
+    logger.debug(
+        "Classified %d reactions with %d workers.",
+        len(reactions), num_workers)
     return result
@@ -0,0 +1,138 @@
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from nasap_net.models import Reaction
+from nasap_net.types import ID
+from .assembly_cache import get_component_distances
+from .connection_count import get_connection_counts_of_kind
+
+FEATURE_COLUMNS = (
+    'metal_kind',
+    'leaving_kind',
+    'entering_kind',
+    'is_inter',
+    'forming_ring_size',
+    'breaking_ring_size',
+    'forming_ring_size_including_temporary',
+    'init_ligand_count_on_metal',
+    'init_metal_count_on_ligand',
+)
+
+
+def build_reaction_feature_table(
+        reactions: Iterable[Reaction],
+) -> pd.DataFrame:
+    """Build a table of the classification features of reactions.
+
+    The table contains, for a whole list of reactions, the same features
+    as the properties of `ReactionToClassify`, so that classifiers can be
+    written as vectorized operations on columns (e.g., boolean masks or
+    `numpy.select`) instead of being called once per reaction.
+
+    Parameters
+    ----------
+    reactions : Iterable[Reaction]
+        The reactions.
+
+    Returns
+    -------
+    pd.DataFrame
+        A table with one row per reaction, in the order of the input,
+        indexed by position (0, 1, ...), with the following columns:
+
+        - metal_kind, leaving_kind, entering_kind (category):
+          The kinds of the components of the metal, leaving and
+          entering binding sites.
+        - is_inter (bool): Whether the reaction is inter-molecular.
+        - forming_ring_size, breaking_ring_size,
+          forming_ring_size_including_temporary (Int64):
+          The minimum sizes of the rings formed, broken and formed
+          including temporary rings; <NA> if there is no such ring.
+        - init_ligand_count_on_metal, init_metal_count_on_ligand (int64):
+          The number of ligands (of the entering kind) bound to the metal,
+          and the number of metals (of the metal kind) bound to the
+          entering ligand, before the reaction.
+
+    Notes
+    -----
+    Features depending only on an assembly are computed once per assembly
+    and shared by all reactions referring to it (see `assembly_cache`).
+    """
+    reactions = list(reactions)
+
+    is_inter = np.fromiter(
+        (reaction.is_inter() for reaction in reactions),
+        dtype=bool, count=len(reactions))
+    entering_assems = [
+        reaction.entering_assem_strict if inter else reaction.init_assem
+        for reaction, inter in zip(reactions, is_inter)]
+
+    metal_kinds = [
+        r.init_assem.get_component_kind_of_site(r.metal_bs)
+        for r in reactions]
+    leaving_kinds = [
+        r.init_assem.get_component_kind_of_site(r.leaving_bs)
+        for r in reactions]
+    entering_kinds = [
+        assem.get_component_kind_of_site(r.entering_bs)
+        for r, assem in zip(reactions, entering_assems)]
+
+    # Distances from the metal to the leaving and entering components.
+    # See `get_min_forming_ring_size`, `get_min_breaking_ring_size` and
+    # `get_min_forming_ring_size_including_temporary` for the rationale.
+    leaving_dist_wo_bond = np.full(len(reactions), np.nan)
+    entering_dist_wo_bond = np.full(len(reactions), np.nan)
+    entering_dist = np.full(len(reactions), np.nan)
+    for i, reaction in enumerate(reactions):
+        metal_id = reaction.metal_bs.component_id
+        leaving_id = reaction.leaving_bs.component_id
+        distances = get_component_distances(
+            reaction.init_assem, metal_id, excluded_neighbor_id=leaving_id)
+        leaving_dist_wo_bond[i] = _get_distance(distances, leaving_id)
+        if is_inter[i]:
+            continue
+        entering_id = reaction.entering_bs.component_id
+        entering_dist_wo_bond[i] = _get_distance(distances, entering_id)
+        entering_dist[i] = _get_distance(
+            get_component_distances(reaction.init_assem, metal_id),
+            entering_id)
+
+    table = pd.DataFrame({
+        'metal_kind': pd.Categorical(metal_kinds),
+        'leaving_kind': pd.Categorical(leaving_kinds),
+        'entering_kind': pd.Categorical(entering_kinds),
+        'is_inter': is_inter,
+        'forming_ring_size': _distances_to_ring_sizes(entering_dist_wo_bond),
+        'breaking_ring_size': _distances_to_ring_sizes(leaving_dist_wo_bond),
+        'forming_ring_size_including_temporary':
+            _distances_to_ring_sizes(entering_dist),
+        'init_ligand_count_on_metal': get_connection_counts_of_kind(
+            [r.init_assem for r in reactions],
+            [r.metal_bs.component_id for r in reactions],
+            entering_kinds),
+        'init_metal_count_on_ligand': get_connection_counts_of_kind(
+            entering_assems,
+            [r.entering_bs.component_id for r in reactions],
+            metal_kinds),
+    })
+    assert tuple(table.columns) == FEATURE_COLUMNS
+    return table
+
+
+def _get_distance(distances: Mapping[ID, int], component_id: ID) -> float:
+    return distances.get(component_id, np.nan)
+
+
+def _distances_to_ring_sizes(
+        distances: npt.NDArray[np.float64]) -> pd.arrays.IntegerArray:
+    """Vectorized version of `distance_to_ring_size`.
+
+    NaN distances (no path) are converted to <NA>.
+    """
+    missing = np.isnan(distances)
+    lengths = np.where(missing, 0, distances + 1).astype(np.int64)
+    assert not np.any(lengths[~missing] % 2)
+    return pd.arrays.IntegerArray(lengths // 2, mask=missing)
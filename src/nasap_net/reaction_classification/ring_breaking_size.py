@@ -1,7 +1,6 @@
 from nasap_net.models import Reaction
-from nasap_net.reaction_pairing.sample_rev_generation import \
-    generate_sample_rev_reaction
-from .ring_formation_size import get_min_forming_ring_size
+from .assembly_cache import get_component_distances
+from .ring_formation_size import distance_to_ring_size
 
 
 def breaks_ring(reaction: Reaction) -> bool:
@@ -42,7 +41,15 @@ def get_min_breaking_ring_size(reaction: Reaction) -> int | None:
     int | None
         The minimum ring size broken, or None if no ring is broken.
     """
-    # TODO: Optimize this; currently we generate the full reverse reaction,
-    #   which might be inefficient.
-    rev = generate_sample_rev_reaction(reaction)
-    return get_min_forming_ring_size(rev)
+    # The ring broken by this reaction is the ring formed by its reverse
+    # reaction. Instead of generating the full reverse reaction, note that
+    # the product with the metal-entering bond removed is identical to the
+    # initial assembly with the metal-leaving bond removed; the leaving
+    # component stays in the product (and the reverse reaction is intra)
+    # exactly when it is still reachable from the metal in that assembly.
+    distances = get_component_distances(
+        reaction.init_assem, reaction.metal_bs.component_id,
+        excluded_neighbor_id=reaction.leaving_bs.component_id,
+    )
+    return distance_to_ring_size(
+        distances.get(reaction.leaving_bs.component_id))
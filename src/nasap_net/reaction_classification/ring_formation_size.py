@@ -1,5 +1,5 @@
 from nasap_net.models import Assembly, BindingSite, Reaction
-from nasap_net.rough_graph import convert_assembly_to_rough_graph
+from .assembly_cache import get_component_distances
 
 
 def forms_ring(reaction: Reaction) -> bool:
@@ -61,8 +61,8 @@ def get_min_forming_ring_size_internal(
     """Determine the minimum ring size formed between two binding sites
     within an assembly.
     """
-    # Create a modified assembly by removing the bond between
-    bond_removed_assem = assembly.remove_bond(metal_bs, leaving_bs)
+    # Distances are measured with the bond between the metal and leaving
+    # components removed.
 
     # The above bond removal ensures that
     # any path between the metal and entering binding sites
@@ -82,19 +82,25 @@ def get_min_forming_ring_size_internal(
     # X0(0)-(0)M0(1)    (0)L0(1)-(0)M1(1)-(0)L1(1)
     # There is no path between M0 and L1, so the function correctly returns None.
 
-    # Convert assemblies to igraph objects
-    conv_res = convert_assembly_to_rough_graph(bond_removed_assem)
-
     # Minimum ring size can be determined from the shortest path between
     # the metal binding site and the entering binding site in the initial assembly.
-    shortest_path_vertices = conv_res.graph.get_shortest_paths(
-        conv_res.core_mapping[metal_bs.component_id],
-        conv_res.core_mapping[entering_bs.component_id],
+    distances = get_component_distances(
+        assembly, metal_bs.component_id,
+        excluded_neighbor_id=leaving_bs.component_id,
     )
+    return distance_to_ring_size(distances.get(entering_bs.component_id))
+
 
-    length = len(shortest_path_vertices[0])
+def distance_to_ring_size(distance: int | None) -> int | None:
+    """Convert the distance between the two components to be bonded
+    into the size of the ring formed by the new bond.
 
-    if length == 0:
+    Returns None if the distance is None, i.e., the components are not
+    connected and no ring is formed.
+    """
+    if distance is None:
         return None
+    # Number of components on the shortest path
+    length = distance + 1
     assert length % 2 == 0
     return length // 2
@@ -1,5 +1,6 @@
 from nasap_net.models import Reaction
-from nasap_net.rough_graph import convert_assembly_to_rough_graph
+from .assembly_cache import get_component_distances
+from .ring_formation_size import distance_to_ring_size
 
 
 def get_min_forming_ring_size_including_temporary(
@@ -40,19 +41,9 @@ def get_min_forming_ring_size_including_temporary(
     if reaction.is_inter():
         return None
 
-    # Convert assemblies to igraph objects
-    conv_res = convert_assembly_to_rough_graph(reaction.init_assem)
-
     # Minimum ring size can be determined from the shortest path between
     # the metal binding site and the entering binding site in the initial assembly.
-    shortest_path_vertices = conv_res.graph.get_shortest_paths(
-        conv_res.core_mapping[reaction.metal_bs.component_id],
-        conv_res.core_mapping[reaction.entering_bs.component_id],
-    )
-
-    length = len(shortest_path_vertices[0])
-
-    if length == 0:
-        return None
-    assert length % 2 == 0
-    return length // 2
+    distances = get_component_distances(
+        reaction.init_assem, reaction.metal_bs.component_id)
+    return distance_to_ring_size(
+        distances.get(reaction.entering_bs.component_id))
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from nasap_net.models import Assembly, Bond, Component
+from nasap_net.reaction_classification import ConnectionCountMatrix, \
+    get_connection_count_matrix, get_connection_count_of_kind, \
+    get_connection_counts_of_kind
+
+
+@pytest.fixture
+def M() -> Component:
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L() -> Component:
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X() -> Component:
+    return Component(kind='X', sites=[0])
+
+@pytest.fixture
+def M2L2X(M, L, X) -> Assembly:
+    # X0(0)-(0)M0(1)-(0)L0(1)-(0)M1(1)-(0)L1(1)
+    return Assembly(
+        components={'X0': X, 'M0': M, 'L0': L, 'M1': M, 'L1': L},
+        bonds=[
+            Bond('X0', 0, 'M0', 0),
+            Bond('M0', 1, 'L0', 0),
+            Bond('L0', 1, 'M1', 0),
+            Bond('M1', 1, 'L1', 0),
+        ],
+    )
+
+
+def test_from_assembly(M2L2X):
+    matrix = ConnectionCountMatrix.from_assembly(M2L2X)
+    assert matrix.component_ids == ('X0', 'M0', 'L0', 'M1', 'L1')
+    assert matrix.kinds == ('L', 'M', 'X')
+    np.testing.assert_array_equal(matrix.counts, [
+        [0, 1, 0],  # X0
+        [1, 0, 1],  # M0
+        [0, 2, 0],  # L0
+        [2, 0, 0],  # M1
+        [0, 1, 0],  # L1
+    ])
+    assert not matrix.counts.flags.writeable
+
+
+def test_count(M2L2X):
+    matrix = ConnectionCountMatrix.from_assembly(M2L2X)
+    assert matrix.count('M1', 'L') == 2
+    assert matrix.count('M1', 'X') == 0
+    assert matrix.count('M1', 'Y') == 0  # kind absent from the assembly
+    with pytest.raises(KeyError):
+        matrix.count('Z0', 'L')
+
+
+def test_take(M2L2X):
+    matrix = ConnectionCountMatrix.from_assembly(M2L2X)
+    np.testing.assert_array_equal(
+        matrix.take(['M0', 'M1', 'L0', 'X0'], ['L', 'L', 'M', 'Y']),
+        [1, 2, 2, 0])
+
+
+def test_invalid_shape():
+    with pytest.raises(ValueError):
+        ConnectionCountMatrix(['A', 'B'], ['K'], [[1, 2]])
+
+
+def test_cached(M2L2X):
+    assert get_connection_count_matrix(M2L2X) \
+        is get_connection_count_matrix(M2L2X)
+
+
+def test_batch_matches_scalar(M, L, X, M2L2X):
+    MX2 = Assembly(
+        components={'X0': X, 'M0': M, 'X1': X},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]
+    )
+    queries = [
+        (M2L2X, 'M0', 'L'),
+        (MX2, 'M0', 'X'),
+        (M2L2X, 'M1', 'L'),
+        (MX2, 'M0', 'L'),
+        (M2L2X, 'L0', 'M'),
+    ]
+    assemblies, comp_ids, kinds = zip(*queries)
+    result = get_connection_counts_of_kind(assemblies, comp_ids, kinds)
+    assert result.tolist() == [
+        get_connection_count_of_kind(*query) for query in queries]
+    assert result.tolist() == [1, 2, 2, 0, 2]
+
+
+def test_batch_length_mismatch(M2L2X):
+    with pytest.raises(ValueError):
+        get_connection_counts_of_kind([M2L2X], ['M0', 'M1'], ['L'])
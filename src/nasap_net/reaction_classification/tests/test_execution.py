@@ -0,0 +1,110 @@
+import logging
+
+import pytest
+
+from nasap_net.models import Assembly, BindingSite, Bond, Component, Reaction
+from nasap_net.reaction_classification import classify_reactions, \
+    get_min_breaking_ring_size
+
+
+def classify_by_breaking_ring_size(reaction: Reaction) -> str:
+    # Defined at the module level so that it can be pickled.
+    return f'ring_{get_min_breaking_ring_size(reaction)}'
+
+
+@pytest.fixture
+def reactions() -> list[Reaction]:
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+
+    # //-(0)M0(1)-(0)L0(1)-(0)M1(1)-(0)L1(1)-//
+    M2L2_ring = Assembly(
+        components={'M0': M, 'L0': L, 'M1': M, 'L1': L},
+        bonds=[
+            Bond('M0', 1, 'L0', 0),
+            Bond('L0', 1, 'M1', 0),
+            Bond('M1', 1, 'L1', 0),
+            Bond('L1', 1, 'M0', 0),
+        ],
+    )
+    free_X = Assembly(components={'X0': X}, bonds=[])
+    # X0(0)-(0)M0(1)-(0)L0(1)-(0)M1(1)-(0)L1(1)
+    M2L2X = Assembly(
+        components={'X0': X, 'M0': M, 'L0': L, 'M1': M, 'L1': L},
+        bonds=[
+            Bond('X0', 0, 'M0', 0),
+            Bond('M0', 1, 'L0', 0),
+            Bond('L0', 1, 'M1', 0),
+            Bond('M1', 1, 'L1', 0),
+        ],
+    )
+    ring_opening = Reaction(
+        init_assem=M2L2_ring,
+        entering_assem=free_X,
+        product_assem=M2L2X,
+        leaving_assem=None,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('L1', 1),
+        entering_bs=BindingSite('X0', 0),
+        duplicate_count=1,
+    )
+
+    MX2 = Assembly(
+        components={'X0': X, 'M0': M, 'X1': X},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]
+    )
+    free_L = Assembly(components={'L0': L}, bonds=[])
+    MLX = Assembly(
+        components={'X0': X, 'M0': M, 'L0': L},
+        bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'L0', 0)]
+    )
+    free_X1 = Assembly(components={'X1': X}, bonds=[])
+    substitution = Reaction(
+        init_assem=MX2,
+        entering_assem=free_L,
+        product_assem=MLX,
+        leaving_assem=free_X1,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('X0', 0),
+        entering_bs=BindingSite('L0', 0),
+        duplicate_count=1,
+    )
+    return [ring_opening, substitution]
+
+
+def test_serial(reactions):
+    result = classify_reactions(reactions, classify_by_breaking_ring_size)
+    assert list(result) == reactions
+    assert list(result.values()) == ['ring_2', 'ring_None']
+
+
+def test_parallel_matches_serial(reactions):
+    serial = classify_reactions(reactions, classify_by_breaking_ring_size)
+    parallel = classify_reactions(
+        reactions, classify_by_breaking_ring_size,
+        num_workers=2, chunksize=1)
+    assert list(parallel.items()) == list(serial.items())
+
+
+def test_log_level(reactions, caplog):
+    logger_name = 'nasap_net.reaction_classification.execution'
+    with caplog.at_level(logging.DEBUG, logger=logger_name):
+        classify_reactions(
+            reactions, classify_by_breaking_ring_size,
+            log_level=logging.DEBUG)
+    assert len(caplog.records) == len(reactions)
+    assert all(r.levelno == logging.DEBUG for r in caplog.records)
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger=logger_name):
+        classify_reactions(
+            reactions, classify_by_breaking_ring_size, log_level=None)
+    assert not caplog.records
+
+
+@pytest.mark.parametrize('kwargs', [{'num_workers': 0}, {'chunksize': 0}])
+def test_invalid_arguments(reactions, kwargs):
+    with pytest.raises(ValueError):
+        classify_reactions(
+            reactions, classify_by_breaking_ring_size, **kwargs)
@@ -0,0 +1,102 @@
+import pandas as pd
+import pytest
+
+from nasap_net.models import Assembly, BindingSite, Bond, Component, Reaction
+from nasap_net.reaction_classification import FEATURE_COLUMNS, \
+    ReactionToClassify, build_reaction_feature_table
+
+
+@pytest.fixture
+def M() -> Component:
+    return Component(kind='M', sites=[0, 1])
+
+@pytest.fixture
+def L() -> Component:
+    return Component(kind='L', sites=[0, 1])
+
+@pytest.fixture
+def X() -> Component:
+    return Component(kind='X', sites=[0])
+
+
+@pytest.fixture
+def reactions(M, L, X) -> list[Reaction]:
+    # //-(0)M0(1)-(0)L0(1)-(0)M1(1)-(0)L1(1)-//
+    M2L2_ring = Assembly(
+        components={'M0': M, 'L0': L, 'M1': M, 'L1': L},
+        bonds=[
+            Bond('M0', 1, 'L0', 0),
+            Bond('L0', 1, 'M1', 0),
+            Bond('M1', 1, 'L1', 0),
+            Bond('L1', 1, 'M0', 0),
+        ],
+    )
+    free_X = Assembly(components={'X0': X}, bonds=[])
+    # X0(0)-(0)M0(1)-(0)L0(1)-(0)M1(1)-(0)L1(1)
+    M2L2X = Assembly(
+        components={'X0': X, 'M0': M, 'L0': L, 'M1': M, 'L1': L},
+        bonds=[
+            Bond('X0', 0, 'M0', 0),
+            Bond('M0', 1, 'L0', 0),
+            Bond('L0', 1, 'M1', 0),
+            Bond('M1', 1, 'L1', 0),
+        ],
+    )
+    # Inter, ring-breaking
+    ring_opening = Reaction(
+        init_assem=M2L2_ring,
+        entering_assem=free_X,
+        product_assem=M2L2X,
+        leaving_assem=None,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('L1', 1),
+        entering_bs=BindingSite('X0', 0),
+    )
+    # Intra, ring-forming
+    ring_closing = Reaction(
+        init_assem=M2L2X,
+        entering_assem=None,
+        product_assem=M2L2_ring,
+        leaving_assem=free_X,
+        metal_bs=BindingSite('M0', 0),
+        leaving_bs=BindingSite('X0', 0),
+        entering_bs=BindingSite('L1', 1),
+    )
+    return [ring_opening, ring_closing]
+
+
+def test_build_reaction_feature_table(reactions):
+    table = build_reaction_feature_table(reactions)
+
+    assert tuple(table.columns) == FEATURE_COLUMNS
+    assert list(table.index) == [0, 1]
+    assert table['metal_kind'].tolist() == ['M', 'M']
+    assert table['leaving_kind'].tolist() == ['L', 'X']
+    assert table['entering_kind'].tolist() == ['X', 'L']
+    assert table['is_inter'].tolist() == [True, False]
+    assert table['forming_ring_size'].tolist() == [pd.NA, 2]
+    assert table['breaking_ring_size'].tolist() == [2, pd.NA]
+    assert table['forming_ring_size_including_temporary'].tolist() \
+        == [pd.NA, 2]
+    assert table['init_ligand_count_on_metal'].tolist() == [0, 1]
+    assert table['init_metal_count_on_ligand'].tolist() == [0, 1]
+
+
+def test_consistent_with_reaction_to_classify(reactions):
+    table = build_reaction_feature_table(reactions)
+    for i, reaction in enumerate(reactions):
+        reaction = ReactionToClassify.from_reaction(reaction)
+        expected = {
+            column: getattr(reaction, column)
+            for column in FEATURE_COLUMNS if column != 'is_inter'}
+        expected['is_inter'] = reaction.is_inter()
+        actual = {
+            column: None if pd.isna(value) else value
+            for column, value in table.loc[i].items()}
+        assert actual == expected
+
+
+def test_empty():
+    table = build_reaction_feature_table([])
+    assert tuple(table.columns) == FEATURE_COLUMNS
+    assert len(table) == 0
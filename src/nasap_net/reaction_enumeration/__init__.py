@@ -1 +1,2 @@
+from .candidates import MLECandidateTable
 from .core import enumerate_reactions
@@ -0,0 +1,110 @@
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from functools import cached_property
+
+from nasap_net.binding_site_equivalence import UniqueComb, \
+    extract_unique_binding_site_combs, get_binding_site_automorphisms
+from nasap_net.models import Assembly, BindingSite
+
+
+class MLECandidateTable:
+    """Index of the candidate sites of MLEs in an assembly.
+
+    The (metal, leaving) bond pairs are indexed by their component kinds,
+    and the free sites by their component kind, in a single pass over the
+    bonds and the sites. Both are also available grouped into symmetry
+    orbits, each represented by one member and the size of the orbit.
+    Everything is computed on first use and kept, so that a table shared by
+    the explorers of an enumeration scans each assembly, and computes its
+    automorphisms, only once.
+
+    Parameters
+    ----------
+    assembly : Assembly
+        The assembly to index.
+    """
+    def __init__(self, assembly: Assembly) -> None:
+        self.assembly = assembly
+        self._ml_pair_orbits: dict[
+            tuple[str, str], tuple[UniqueComb, ...]] = {}
+        self._free_site_orbits: dict[str, tuple[UniqueComb, ...]] = {}
+
+    def ml_pairs(
+            self, metal_kind: str, leaving_kind: str,
+    ) -> frozenset[tuple[BindingSite, BindingSite]]:
+        """Return the bonded (metal, leaving) site pairs of the given
+        component kinds.
+        """
+        return self._ml_pair_index.get(
+            (metal_kind, leaving_kind), frozenset())
+
+    def free_sites(self, kind: str) -> frozenset[BindingSite]:
+        """Return the free sites of the given component kind."""
+        return self._free_site_index.get(kind, frozenset())
+
+    def ml_pair_orbits(
+            self, metal_kind: str, leaving_kind: str,
+    ) -> tuple[UniqueComb, ...]:
+        """Return the symmetry-unique (metal, leaving) site pairs of the
+        given component kinds, with their duplication counts.
+        """
+        key = (metal_kind, leaving_kind)
+        if key not in self._ml_pair_orbits:
+            self._ml_pair_orbits[key] = self.unique_combs(
+                self.ml_pairs(metal_kind, leaving_kind))
+        return self._ml_pair_orbits[key]
+
+    def free_site_orbits(self, kind: str) -> tuple[UniqueComb, ...]:
+        """Return the symmetry-unique free sites of the given component
+        kind, with their duplication counts.
+        """
+        if kind not in self._free_site_orbits:
+            self._free_site_orbits[kind] = self.unique_combs(
+                (site,) for site in self.free_sites(kind))
+        return self._free_site_orbits[kind]
+
+    def unique_combs(
+            self, combs: Iterable[tuple[BindingSite, ...]],
+    ) -> tuple[UniqueComb, ...]:
+        """Return the symmetry-unique binding site combinations, with
+        their duplication counts (see `extract_unique_binding_site_combs`).
+
+        They are sorted by their representative combinations, so that the
+        order does not depend on the hash seed.
+        """
+        return tuple(sorted(
+            extract_unique_binding_site_combs(
+                combs, self.assembly, automorphisms=self.automorphisms),
+            key=lambda orbit: orbit.site_comb))
+
+    @cached_property
+    def automorphisms(
+            self) -> tuple[Mapping[BindingSite, BindingSite], ...]:
+        """The binding site mappings of the self-isomorphisms of the
+        assembly."""
+        return get_binding_site_automorphisms(self.assembly)
+
+    @cached_property
+    def _ml_pair_index(
+            self,
+    ) -> Mapping[tuple[str, str], frozenset[tuple[BindingSite, BindingSite]]]:
+        kinds = self.assembly.component_id_to_kind
+        index: defaultdict[
+            tuple[str, str], set[tuple[BindingSite, BindingSite]]
+        ] = defaultdict(set)
+        for bond in self.assembly.bonds:
+            site1, site2 = bond.sites
+            kind1 = kinds[site1.component_id]
+            kind2 = kinds[site2.component_id]
+            # Either end of a bond can be the metal.
+            index[kind1, kind2].add((site1, site2))
+            index[kind2, kind1].add((site2, site1))
+        return {key: frozenset(pairs) for key, pairs in index.items()}
+
+    @cached_property
+    def _free_site_index(self) -> Mapping[str, frozenset[BindingSite]]:
+        kinds = self.assembly.component_id_to_kind
+        index: defaultdict[str, set[BindingSite]] = defaultdict(set)
+        for site in self.assembly.find_sites(has_bond=False):
+            index[kinds[site.component_id]].add(site)
+        return {kind: frozenset(sites) for kind, sites in index.items()}
@@ -1,14 +1,22 @@
 import logging
-from collections.abc import Iterable
-from itertools import chain, product
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice, product
 from typing import Iterator, TypeVar
 
+from nasap_net.assembly_equivalence import AssemblyFinder
 from nasap_net.helpers import validate_unique_ids
-from nasap_net.models import Assembly, MLEKind, Reaction
+from nasap_net.models import Assembly, AssemblyInternTable, MLEKind, \
+    Reaction
+from nasap_net.progress import DEFAULT_PROGRESS_INTERVAL, \
+    ProgressCallback, ProgressReporter
 from nasap_net.reaction_classification import \
     get_min_forming_ring_size_including_temporary
 from nasap_net.types import ID
-from .explorer import InterReactionExplorer, IntraReactionExplorer
+from .candidates import MLECandidateTable
+from .explorer import InterReactionExplorer, IntraReactionExplorer, \
+    ReactionExplorer
 from .reaction_resolver import ReactionOutOfScopeError, ReactionResolver
 
 logger = logging.getLogger(__name__)
@@ -21,6 +29,11 @@ def enumerate_reactions(
         mle_kinds: Iterable[MLEKind],
         *,
         min_temp_ring_size: int | None = None,
+        assembly_finder: AssemblyFinder | None = None,
+        num_workers: int | None = None,
+        chunksize: int = 16,
+        progress_callback: ProgressCallback | None = None,
+        progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
         ) -> Iterator[Reaction]:
     """Enumerate possible reactions among given assemblies.
 
@@ -34,35 +47,152 @@ def enumerate_reactions(
         Minimum size of temporary rings to consider during intra-molecular
         reactions. Reactions forming temporary rings smaller than this size
         will be ignored. If None, no filtering is applied. Default is None.
+    assembly_finder : AssemblyFinder | None, optional
+        The finder used to resolve the products and leaving assemblies
+        against `assemblies`, e.g., an `IndexedAssemblyFinder` backed by
+        a prebuilt index of the same assemblies. If None, an
+        `EquivalentAssemblyFinder` is built from `assemblies`.
+        Default is None.
+    num_workers : int | None, optional
+        The number of worker processes. If None or 1, the reactions are
+        enumerated in the current process. Otherwise, the explorations are
+        dispatched to a process pool in chunks of `chunksize`, and the
+        reactions are yielded in the same order as in the serial mode;
+        `assembly_finder`, if given, must be picklable. Default is None.
+    chunksize : int, optional
+        The number of explorations sent to a worker at once in parallel
+        mode. Default is 16.
+    progress_callback : ProgressCallback | None, optional
+        Called with a `Progress` of the task ``'enumerate_reactions'`` at
+        most once per `progress_interval` seconds, and when the enumeration
+        finishes. The units are the explored (assembly, MLE kind) and
+        (initial assembly, entering assembly, MLE kind) combinations; the
+        counts are ``'reactions_found'``, ``'out_of_scope'`` and
+        ``'filtered_by_ring_size'``. Default is None.
+    progress_interval : float, optional
+        The minimum interval between progress reports in seconds.
+        Default is 1.0.
 
     Yields
     ------
     Reaction
         The enumerated and resolved reactions.
+
+    Raises
+    ------
+    ValueError
+        If `num_workers` or `chunksize` is less than 1.
     """
+    if num_workers is not None and num_workers < 1:
+        raise ValueError("num_workers must be a positive integer")
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
     logger.debug('Starting reaction enumeration.')
     assemblies = list(assemblies)
+    mle_kinds = list(mle_kinds)
 
     validate_unique_ids(assemblies)
 
-    reaction_iters: list[Iterator[Reaction]] = []
-    for mle_kind in mle_kinds:
-        # Intra-molecular reactions
-        for assem in assemblies:
-            intra_explorer = IntraReactionExplorer(assem, mle_kind)
-            reaction_iters.append(intra_explorer.explore())
+    tasks = _list_tasks(len(assemblies), len(mle_kinds))
 
+    reporter = None
+    if progress_callback is not None:
+        reporter = ProgressReporter(
+            progress_callback, 'enumerate_reactions',
+            total=len(tasks), interval=progress_interval)
+    counts = {
+        'reactions_found': 0, 'out_of_scope': 0, 'filtered_by_ring_size': 0}
+
+    if num_workers is None or num_workers == 1:
+        resolver = _create_resolver(assemblies, assembly_finder)
+        candidate_tables = _create_candidate_tables(assemblies)
+        results: Iterable[tuple[int, Iterable[Reaction]]] = (
+            (1, _explore(
+                _create_explorer(
+                    task, assemblies, mle_kinds, candidate_tables),
+                resolver, min_temp_ring_size, counts))
+            for task in tasks)
+    else:
+        results = _explore_in_parallel(
+            tasks, assemblies, mle_kinds,
+            min_temp_ring_size=min_temp_ring_size,
+            assembly_finder=assembly_finder,
+            num_workers=num_workers, chunksize=chunksize, counts=counts)
+
+    for num_tasks, reactions in results:
+        for resolved in reactions:
+            logger.debug(
+                'Reaction Found (%d): %s', counts['reactions_found'],
+                resolved)
+            counts['reactions_found'] += 1
+            yield resolved
+        if reporter is not None:
+            reporter.counts.update(counts)
+            reporter.advance(num_tasks)
+    if reporter is not None:
+        reporter.counts.update(counts)
+        reporter.finish()
+    logger.debug('Reaction enumeration completed.')
+
+
+# (init_assem index, entering_assem index or None, mle_kind index)
+_Task = tuple[int, int | None, int]
+
+
+def _list_tasks(num_assemblies: int, num_mle_kinds: int) -> list[_Task]:
+    tasks: list[_Task] = []
+    for k in range(num_mle_kinds):
+        # Intra-molecular reactions
+        tasks.extend((i, None, k) for i in range(num_assemblies))
         # Inter-molecular reactions
-        for init_assem, entering_assem in product(assemblies, repeat=2):
-            inter_explorer = InterReactionExplorer(
-                init_assem, entering_assem, mle_kind)
-            reaction_iters.append(inter_explorer.explore())
+        tasks.extend(
+            (i, j, k) for i, j
+            in product(range(num_assemblies), repeat=2))
+    return tasks
+
+
+def _create_explorer(
+        task: _Task,
+        assemblies: Sequence[Assembly],
+        mle_kinds: Sequence[MLEKind],
+        candidate_tables: Sequence[MLECandidateTable],
+) -> ReactionExplorer:
+    init_index, entering_index, mle_kind_index = task
+    if entering_index is None:
+        return IntraReactionExplorer(
+            assemblies[init_index], mle_kinds[mle_kind_index],
+            candidates=candidate_tables[init_index])
+    return InterReactionExplorer(
+        assemblies[init_index], assemblies[entering_index],
+        mle_kinds[mle_kind_index],
+        init_candidates=candidate_tables[init_index],
+        entering_candidates=candidate_tables[entering_index])
+
 
-    resolver = ReactionResolver(assemblies)
+def _create_candidate_tables(
+        assemblies: Sequence[Assembly]) -> list[MLECandidateTable]:
+    # One table per assembly, shared by all the explorers of the
+    # enumeration, so that each assembly is indexed only once.
+    return [MLECandidateTable(assembly) for assembly in assemblies]
 
-    counter = 0
 
-    for reaction in chain.from_iterable(reaction_iters):
+def _create_resolver(
+        assemblies: Iterable[Assembly],
+        assembly_finder: AssemblyFinder | None,
+) -> ReactionResolver:
+    if assembly_finder is None:
+        return ReactionResolver(assemblies)
+    return ReactionResolver(finder=assembly_finder)
+
+
+def _explore(
+        explorer: ReactionExplorer,
+        resolver: ReactionResolver,
+        min_temp_ring_size: int | None,
+        counts: dict[str, int],
+) -> Iterator[Reaction]:
+    for reaction in explorer.explore():
         # Filter by minimum temporary ring size if specified
         # TODO: Optimize by integrating into intra explorer
         if min_temp_ring_size is not None and reaction.is_intra():
@@ -71,13 +201,105 @@ def enumerate_reactions(
             )
             if (actual_ring_size is not None
                     and actual_ring_size < min_temp_ring_size):
+                counts['filtered_by_ring_size'] += 1
                 continue
 
         try:
-            resolved = resolver.resolve(reaction)
-            logger.debug('Reaction Found (%d): %s', counter, resolved)
-            counter += 1
-            yield resolved
+            yield resolver.resolve(reaction)
         except ReactionOutOfScopeError:
+            counts['out_of_scope'] += 1
             continue
-    logger.debug('Reaction enumeration completed.')
+
+
+def _explore_in_parallel(
+        tasks: Sequence[_Task],
+        assemblies: Sequence[Assembly],
+        mle_kinds: Sequence[MLEKind],
+        *,
+        min_temp_ring_size: int | None,
+        assembly_finder: AssemblyFinder | None,
+        num_workers: int,
+        chunksize: int,
+        counts: dict[str, int],
+) -> Iterator[tuple[int, list[Reaction]]]:
+    # Reactions from the workers refer to copies of the assemblies;
+    # they are replaced with the original instances.
+    intern_table = AssemblyInternTable()
+    for assembly in assemblies:
+        intern_table.intern(assembly)
+
+    chunks = (
+        tasks[i:i + chunksize] for i in range(0, len(tasks), chunksize))
+    # Only a few chunks per worker are in flight at a time, so that the
+    # results do not pile up when the consumer is slower than the workers.
+    max_in_flight = 2 * num_workers
+    in_flight: deque[tuple[int, Future]] = deque()
+    with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(
+                assemblies, mle_kinds, min_temp_ring_size, assembly_finder),
+    ) as executor:
+        for chunk in islice(chunks, max_in_flight):
+            in_flight.append(
+                (len(chunk), executor.submit(_explore_chunk, chunk)))
+        while in_flight:
+            # Yielded in submission order, for reproducibility.
+            num_tasks, future = in_flight.popleft()
+            reactions, chunk_counts = future.result()
+            for chunk in islice(chunks, 1):
+                in_flight.append(
+                    (len(chunk), executor.submit(_explore_chunk, chunk)))
+            for key, value in chunk_counts.items():
+                counts[key] += value
+            yield num_tasks, [
+                _intern_assemblies(reaction, intern_table)
+                for reaction in reactions]
+
+
+_worker_state: tuple[
+    Sequence[Assembly], Sequence[MLEKind], int | None, ReactionResolver,
+    Sequence[MLECandidateTable],
+] | None = None
+
+
+def _init_worker(
+        assemblies: Sequence[Assembly],
+        mle_kinds: Sequence[MLEKind],
+        min_temp_ring_size: int | None,
+        assembly_finder: AssemblyFinder | None,
+) -> None:
+    global _worker_state
+    _worker_state = (
+        assemblies, mle_kinds, min_temp_ring_size,
+        _create_resolver(assemblies, assembly_finder),
+        _create_candidate_tables(assemblies))
+
+
+def _explore_chunk(
+        chunk: Sequence[_Task]) -> tuple[list[Reaction], dict[str, int]]:
+    assert _worker_state is not None
+    (assemblies, mle_kinds, min_temp_ring_size, resolver,
+     candidate_tables) = _worker_state
+    counts = {'out_of_scope': 0, 'filtered_by_ring_size': 0}
+    reactions = []
+    for task in chunk:
+        reactions.extend(_explore(
+            _create_explorer(task, assemblies, mle_kinds, candidate_tables),
+            resolver, min_temp_ring_size, counts))
+    return reactions, counts
+
+
+def _intern_assemblies(
+        reaction: Reaction, intern_table: AssemblyInternTable) -> Reaction:
+    return reaction.copy_with(
+        init_assem=intern_table.intern(reaction.init_assem),
+        entering_assem=(
+            None if reaction.entering_assem is None
+            else intern_table.intern(reaction.entering_assem)),
+        product_assem=intern_table.intern(reaction.product_assem),
+        leaving_assem=(
+            None if reaction.leaving_assem is None
+            else intern_table.intern(reaction.leaving_assem)),
+        id_=reaction.id_or_none,
+    )
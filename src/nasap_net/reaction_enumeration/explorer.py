@@ -1,29 +1,24 @@
 import itertools
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from nasap_net.binding_site_equivalence import \
-    extract_unique_binding_site_combs
 from nasap_net.models import Assembly, BindingSite, MLE, MLEKind, \
     Reaction
 from nasap_net.reaction_performance import perform_inter_reaction, \
     perform_intra_reaction, reindex_components_for_inter_reaction
+from .candidates import MLECandidateTable
 
 
 class ReactionExplorer(ABC):
     def explore(self) -> Iterator[Reaction]:
-        mles = self._iter_mles()
-        unique_mles = self._get_unique_mles(mles)
-        for mle in unique_mles:
+        for mle in self._iter_unique_mles():
             yield self._perform_reaction(mle)
 
     @abstractmethod
-    def _iter_mles(self) -> Iterator[MLE]:
-        pass
-
-    @abstractmethod
-    def _get_unique_mles(self, mles: Iterable[MLE]) -> Iterator[MLE]:
+    def _iter_unique_mles(self) -> Iterator[MLE]:
+        """Yield one MLE per class of symmetry-equivalent MLEs, with the
+        size of the class as its duplication."""
         pass
 
     @abstractmethod
@@ -44,6 +39,9 @@ class IntraReactionExplorer(ReactionExplorer):
             - `mle_kind.metal`: The component kind of the metal binding site.
             - `mle_kind.leaving`: The component kind of the leaving binding site.
             - `mle_kind.entering`: The component kind of the entering binding site.
+    candidates : MLECandidateTable | None, optional
+        The candidate table of `assembly`, shared between the explorers of
+        an enumeration. If None, a new table is created.
 
     Methods
     -------
@@ -53,6 +51,18 @@ class IntraReactionExplorer(ReactionExplorer):
     """
     assembly: Assembly
     mle_kind: MLEKind
+    candidates: MLECandidateTable | None = field(
+        default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.candidates is None:
+            object.__setattr__(
+                self, 'candidates', MLECandidateTable(self.assembly))
+
+    def _iter_unique_mles(self) -> Iterator[MLE]:
+        # The parallel-bond filter depends on the combination of the sites,
+        # so the MLEs are grouped as trios.
+        return self._get_unique_mles(self._iter_mles())
 
     def _iter_mles(self) -> Iterator[MLE]:
         """Get all possible MLEs for intra-molecular reactions in an assembly.
@@ -67,12 +77,10 @@ class IntraReactionExplorer(ReactionExplorer):
           - The component kind of the leaving binding site is `mle_kind.leaving`.
           - The entering binding site is free and has the component kind `mle_kind.entering`.
         """
-        ml_pairs = _enum_ml_pair(
-            self.assembly,
-            metal_kind=self.mle_kind.metal, leaving_kind=self.mle_kind.leaving)
-
-        entering_sites = self.assembly.find_sites(
-            has_bond=False, component_kind=self.mle_kind.entering)
+        assert self.candidates is not None
+        ml_pairs = self.candidates.ml_pairs(
+            self.mle_kind.metal, self.mle_kind.leaving)
+        entering_sites = self.candidates.free_sites(self.mle_kind.entering)
 
         for (metal, leaving), entering in itertools.product(
                 ml_pairs, entering_sites):
@@ -84,9 +92,9 @@ class IntraReactionExplorer(ReactionExplorer):
             yield MLE(metal, leaving, entering)
 
     def _get_unique_mles(self, mles: Iterable[MLE]) -> Iterator[MLE]:
-        unique_mle_trios = extract_unique_binding_site_combs(
-            [(mle.metal, mle.leaving, mle.entering) for mle in mles],
-             self.assembly)
+        assert self.candidates is not None
+        unique_mle_trios = self.candidates.unique_combs(
+            (mle.metal, mle.leaving, mle.entering) for mle in mles)
         for unique_mle in unique_mle_trios:
             metal, leaving, entering = unique_mle.site_comb
             yield MLE(
@@ -126,6 +134,13 @@ class InterReactionExplorer(ReactionExplorer):
             - `mle_kind.metal`: The component kind of the metal binding site.
             - `mle_kind.leaving`: The component kind of the leaving binding site.
             - `mle_kind.entering`: The component kind of the entering binding site.
+    init_candidates : MLECandidateTable | None, optional
+        The candidate table of `init_assembly`, shared between the explorers
+        of an enumeration. If None, a new table is created.
+    entering_candidates : MLECandidateTable | None, optional
+        The candidate table of `entering_assembly`. If None, a new table is
+        created (or `init_candidates` is used if both assemblies are the
+        same object).
 
     Methods
     -------
@@ -136,40 +151,51 @@ class InterReactionExplorer(ReactionExplorer):
     init_assembly: Assembly
     entering_assembly: Assembly
     mle_kind: MLEKind
-
-    def _iter_mles(self) -> Iterator[MLE]:
-        """Get all possible MLEs for inter-molecular reactions between two assemblies.
-
-        This function generates all MLEs (combinations of metal binding sites,
-        leaving binding sites, and entering binding sites) for inter-molecular
-        reactions between an initial assembly and an entering assembly
-        based on the specified component kinds.
-
-        Returned MLEs meet the following conditions:
+    init_candidates: MLECandidateTable | None = field(
+        default=None, compare=False, repr=False)
+    entering_candidates: MLECandidateTable | None = field(
+        default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.init_candidates is None:
+            object.__setattr__(
+                self, 'init_candidates',
+                MLECandidateTable(self.init_assembly))
+        if self.entering_candidates is None:
+            object.__setattr__(
+                self, 'entering_candidates',
+                self.init_candidates
+                if self.entering_assembly is self.init_assembly
+                else MLECandidateTable(self.entering_assembly))
+
+    def _iter_unique_mles(self) -> Iterator[MLE]:
+        """Get the unique MLEs for inter-molecular reactions between two
+        assemblies.
+
+        The MLEs are the combinations of a (metal, leaving) pair of the
+        initial assembly and an entering site of the entering assembly,
+        which meet the following conditions:
           - The metal binding site and leaving binding site are connected to each other.
           - The component kind of the metal binding site is `mle_kind.metal`.
           - The component kind of the leaving binding site is `mle_kind.leaving`.
           - The entering binding site is free and has the component kind `mle_kind.entering`.
-        """
-        ml_pair = _enum_ml_pair(
-            self.init_assembly,
-            metal_kind=self.mle_kind.metal, leaving_kind=self.mle_kind.leaving)
 
-        entering_sites = self.entering_assembly.find_sites(
-            has_bond=False, component_kind=self.mle_kind.entering)
-
-        for (metal, leaving), entering in itertools.product(
-                ml_pair, entering_sites):
-            yield MLE(metal, leaving, entering)
-
-    def _get_unique_mles(self, mles: Iterable[MLE]) -> Iterator[MLE]:
-        mles1, mles2 = itertools.tee(mles)
-        unique_ml_pairs = extract_unique_binding_site_combs(
-            [(mle.metal, mle.leaving) for mle in mles1], self.init_assembly)
-        unique_entering_sites = extract_unique_binding_site_combs(
-            [(mle.entering,) for mle in mles2], self.entering_assembly)
+        Since the two factors belong to different assemblies, the classes of
+        equivalent MLEs are the products of the symmetry orbits of the
+        factors. Only one MLE per pair of orbits is built; the Cartesian
+        product of all the candidate sites is never materialized.
+        """
+        assert self.init_candidates is not None
+        assert self.entering_candidates is not None
+        metal_kind, leaving_kind, entering_kind = (
+            self.mle_kind.metal, self.mle_kind.leaving, self.mle_kind.entering)
+        # Avoid computing the orbits of one factor if the other is empty.
+        if (not self.init_candidates.ml_pairs(metal_kind, leaving_kind)
+                or not self.entering_candidates.free_sites(entering_kind)):
+            return
         for unique_ml, unique_e in itertools.product(
-                unique_ml_pairs, unique_entering_sites):
+                self.init_candidates.ml_pair_orbits(metal_kind, leaving_kind),
+                self.entering_candidates.free_site_orbits(entering_kind)):
             metal, leaving = unique_ml.site_comb
             (entering,) = unique_e.site_comb
             yield MLE(
@@ -206,21 +232,6 @@ class InterReactionExplorer(ReactionExplorer):
         )
 
 
-def _enum_ml_pair(
-        assem: Assembly, metal_kind: str, leaving_kind: str
-        ) -> set[tuple[BindingSite, BindingSite]]:
-    ml_pair: set[tuple[BindingSite, BindingSite]] = set()
-    for bond in assem.bonds:
-        site1, site2 = bond.sites
-        kind1 = assem.get_component_kind_of_site(site1)
-        kind2 = assem.get_component_kind_of_site(site2)
-        if (kind1, kind2) == (metal_kind, leaving_kind):
-            ml_pair.add((site1, site2))
-        elif (kind1, kind2) == (leaving_kind, metal_kind):
-            ml_pair.add((site2, site1))
-    return ml_pair
-
-
 def forms_parallel_bond(
         assembly: Assembly,
         entering: BindingSite,
@@ -1,8 +1,8 @@
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 
-from nasap_net.assembly_equivalence import AssemblyNotFoundError, \
-    EquivalentAssemblyFinder
+from nasap_net.assembly_equivalence import AssemblyFinder, \
+    AssemblyNotFoundError, EquivalentAssemblyFinder
 from nasap_net.exceptions import NasapNetError
 from nasap_net.models import Assembly
 from nasap_net.models.reaction import Reaction
@@ -19,23 +19,36 @@ class ReactionResolver:
 
     Parameters
     ----------
-    assembly_space : Iterable[Assembly]
+    assembly_space : Iterable[Assembly] | None, optional
         The assembly space to resolve reactions against.
+    finder : AssemblyFinder | None, optional
+        The finder to search the assembly space with, e.g., an
+        `IndexedAssemblyFinder` backed by a persistent index.
+        Exactly one of `assembly_space` and `finder` must be given.
 
     Methods
     -------
     resolve(reaction: Reaction) -> Reaction
         Resolve a reaction to the assembly space.
     """
-    assembly_space: frozenset[Assembly]
-    finder: EquivalentAssemblyFinder = field(init=False)
-
-    def __init__(self, assembly_space: Iterable[Assembly]) -> None:
-        object.__setattr__(
-            self, 'assembly_space', frozenset(assembly_space))
-        object.__setattr__(
-            self, 'finder',
-            EquivalentAssemblyFinder(self.assembly_space))
+    assembly_space: frozenset[Assembly] | None
+    finder: AssemblyFinder = field(init=False)
+
+    def __init__(
+            self,
+            assembly_space: Iterable[Assembly] | None = None,
+            *,
+            finder: AssemblyFinder | None = None,
+    ) -> None:
+        if (assembly_space is None) == (finder is None):
+            raise TypeError(
+                "Exactly one of assembly_space and finder must be given")
+        if finder is None:
+            assert assembly_space is not None
+            assembly_space = frozenset(assembly_space)
+            finder = EquivalentAssemblyFinder(assembly_space)
+        object.__setattr__(self, 'assembly_space', assembly_space)
+        object.__setattr__(self, 'finder', finder)
 
     def resolve(self, reaction: Reaction) -> Reaction:
         """Resolve a reaction to the assembly space.
@@ -0,0 +1,98 @@
+import pytest
+
+from nasap_net.binding_site_equivalence import UniqueComb
+from nasap_net.models import Assembly, AuxEdge, BindingSite, Bond, Component, \
+    MLEKind
+from nasap_net.profiling import profiling
+from nasap_net.reaction_enumeration import MLECandidateTable
+from nasap_net.reaction_enumeration.explorer import InterReactionExplorer
+
+
+@pytest.fixture
+def M() -> Component:
+    return Component(
+        kind='M', sites=[0, 1, 2, 3],
+        aux_edges=[AuxEdge(0, 1), AuxEdge(1, 2), AuxEdge(2, 3), AuxEdge(3, 0)])
+
+
+@pytest.fixture
+def L() -> Component:
+    return Component(kind='L', sites=[0, 1])
+
+
+@pytest.fixture
+def X() -> Component:
+    return Component(kind='X', sites=[0])
+
+
+@pytest.fixture
+def MLX2(M, L, X) -> Assembly:
+    return Assembly(
+        components={'M0': M, 'L0': L, 'X0': X, 'X1': X},
+        bonds=[
+            Bond('M0', 0, 'L0', 0), Bond('M0', 1, 'X0', 0),
+            Bond('M0', 3, 'X1', 0)])
+
+
+def test_ml_pairs(MLX2):
+    table = MLECandidateTable(MLX2)
+    assert table.ml_pairs('M', 'X') == {
+        (BindingSite('M0', 1), BindingSite('X0', 0)),
+        (BindingSite('M0', 3), BindingSite('X1', 0)),
+    }
+    assert table.ml_pairs('M', 'L') == {
+        (BindingSite('M0', 0), BindingSite('L0', 0))}
+    assert table.ml_pairs('L', 'M') == {
+        (BindingSite('L0', 0), BindingSite('M0', 0))}
+    assert table.ml_pairs('M', 'M') == frozenset()
+
+
+def test_ml_pairs_same_kind(M):
+    M2 = Assembly(
+        components={'M0': M, 'M1': M}, bonds=[Bond('M0', 0, 'M1', 0)])
+    assert MLECandidateTable(M2).ml_pairs('M', 'M') == {
+        (BindingSite('M0', 0), BindingSite('M1', 0)),
+        (BindingSite('M1', 0), BindingSite('M0', 0)),
+    }
+
+
+def test_free_sites(MLX2):
+    table = MLECandidateTable(MLX2)
+    assert table.free_sites('M') == {BindingSite('M0', 2)}
+    assert table.free_sites('L') == {BindingSite('L0', 1)}
+    assert table.free_sites('X') == frozenset()
+
+
+def test_orbits(MLX2):
+    table = MLECandidateTable(MLX2)
+    # M0-X0 and M0-X1 are equivalent by the mirror through M0-L0.
+    assert table.ml_pair_orbits('M', 'X') == (
+        UniqueComb(
+            site_comb=(BindingSite('M0', 1), BindingSite('X0', 0)),
+            duplication=2),
+    )
+    assert table.free_site_orbits('M') == (
+        UniqueComb(site_comb=(BindingSite('M0', 2),), duplication=1),)
+    assert table.free_site_orbits('X') == ()
+    # Cached
+    assert table.ml_pair_orbits('M', 'X') is table.ml_pair_orbits('M', 'X')
+
+
+def test_shared_by_explorers(MLX2):
+    table = MLECandidateTable(MLX2)
+    explorer = InterReactionExplorer(
+        MLX2, MLX2, MLEKind('M', 'X', 'L'), init_candidates=table)
+    assert explorer.entering_candidates is table
+    assert explorer == InterReactionExplorer(
+        MLX2, MLX2, MLEKind('M', 'X', 'L'))
+
+
+def test_automorphisms_computed_once(MLX2):
+    table = MLECandidateTable(MLX2)
+    with profiling() as profile:
+        table.ml_pair_orbits('M', 'X')
+        table.ml_pair_orbits('M', 'L')
+        table.free_site_orbits('M')
+        table.unique_combs([(BindingSite('M0', 1), BindingSite('X0', 0))])
+    assert profile.call_counts['get_all_isomorphisms'] == 1
+    assert len(table.automorphisms) == 2
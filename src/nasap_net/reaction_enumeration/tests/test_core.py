@@ -1,7 +1,15 @@
+from collections import defaultdict
+from concurrent.futures import Future
+
+import pytest
+
+from nasap_net.assembly_equivalence import AssemblyHashIndex, \
+    IndexedAssemblyFinder, build_assembly_hash_index
 from nasap_net.models import Assembly, BindingSite, Bond, Component, MLEKind, \
     Reaction
+from nasap_net.profiling import profiling
 from nasap_net.reaction_equivalence import compute_reaction_list_diff
-from nasap_net.reaction_enumeration import enumerate_reactions
+from nasap_net.reaction_enumeration import core, enumerate_reactions
 
 
 def test():
@@ -166,3 +174,183 @@ def test_temp_ring_size_limitation():
     diff = compute_reaction_list_diff(limit_2_actual, limit_2_expected)
     assert diff.first_only == set()
     assert diff.second_only == set()
+
+
+def test_assembly_finder(tmp_path):
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assemblies = [
+        # MX2: X0(0)-(0)M0(1)-(0)X1
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='free_L', components={'L0': L}, bonds=[]),
+        Assembly(id_='free_X', components={'X0': X}, bonds=[]),
+        # MLX: (0)L0(1)-(0)M0(1)-(0)X0
+        Assembly(
+            id_='MLX',
+            components={'L0': L, 'M0': M, 'X0': X},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'X0', 0)]),
+    ]
+    build_assembly_hash_index(assemblies, tmp_path / 'index.sqlite')
+    finder = IndexedAssemblyFinder(
+        AssemblyHashIndex(tmp_path / 'index.sqlite'), assemblies)
+
+    mle_kinds = [MLEKind('M', 'X', 'L')]
+    expected = list(enumerate_reactions(assemblies, mle_kinds))
+    actual = list(enumerate_reactions(
+        assemblies, mle_kinds, assembly_finder=finder))
+    assert actual == expected
+
+
+def test_progress_callback():
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assemblies = [
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='free_L', components={'L0': L}, bonds=[]),
+        Assembly(id_='free_X', components={'X0': X}, bonds=[]),
+    ]
+    progresses = []
+    reactions = list(enumerate_reactions(
+        assemblies, [MLEKind('M', 'X', 'L')],
+        progress_callback=progresses.append, progress_interval=0))
+
+    # 3 intra + 3 * 3 inter explorations
+    assert [p.done for p in progresses] == list(range(1, 13)) + [12]
+    last = progresses[-1]
+    assert last.task == 'enumerate_reactions'
+    assert last.finished and last.total == 12 and last.eta == 0
+    # MX2 + free_L -> MLX + free_X, where MLX is out of scope.
+    assert reactions == []
+    assert last.counts == {
+        'reactions_found': 0, 'out_of_scope': 1, 'filtered_by_ring_size': 0}
+
+
+def test_num_workers():
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assemblies = [
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='free_L', components={'L0': L}, bonds=[]),
+        Assembly(id_='free_X', components={'X0': X}, bonds=[]),
+        Assembly(
+            id_='MLX',
+            components={'L0': L, 'M0': M, 'X0': X},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'X0', 0)]),
+        Assembly(
+            id_='ML2',
+            components={'L0': L, 'M0': M, 'L1': L},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'L1', 0)]),
+    ]
+    mle_kinds = [MLEKind('M', 'X', 'L'), MLEKind('M', 'L', 'X')]
+    expected = list(enumerate_reactions(assemblies, mle_kinds))
+
+    progresses = []
+    actual = list(enumerate_reactions(
+        assemblies, mle_kinds, num_workers=2, chunksize=7,
+        progress_callback=progresses.append, progress_interval=0))
+    assert actual == expected
+    # The assemblies are the original instances, not copies.
+    assert all(
+        reaction.product_assem in assemblies
+        and any(reaction.product_assem is a for a in assemblies)
+        for reaction in actual)
+    assert progresses[-1].done == progresses[-1].total == 2 * (5 + 5 * 5)
+    assert progresses[-1].counts['reactions_found'] == len(expected)
+
+
+def test_num_workers_bounded_in_flight(monkeypatch):
+    submitted = []
+
+    class SerialExecutor:
+        def __init__(self, max_workers, initializer, initargs):
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def submit(self, fn, *args):
+            submitted.append(args)
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    monkeypatch.setattr(core, 'ProcessPoolExecutor', SerialExecutor)
+    monkeypatch.setattr(core, '_worker_state', None)
+
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assemblies = [
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='free_L', components={'L0': L}, bonds=[]),
+        Assembly(id_='free_X', components={'X0': X}, bonds=[]),
+    ]
+    mle_kinds = [MLEKind('M', 'X', 'L')]
+    tasks = core._list_tasks(len(assemblies), len(mle_kinds))
+    results = core._explore_in_parallel(
+        tasks, assemblies, mle_kinds,
+        min_temp_ring_size=None, assembly_finder=None,
+        num_workers=2, chunksize=1, counts=defaultdict(int))
+
+    # 2 chunks per worker are submitted up front, and one more each time
+    # the oldest result is taken.
+    num_tasks, _ = next(results)
+    assert num_tasks == 1
+    assert len(submitted) == 2 * 2 + 1
+    next(results)
+    assert len(submitted) == 2 * 2 + 2
+    assert sum(num_tasks for num_tasks, _ in results) == len(tasks) - 2
+    assert [args[0][0] for args in submitted] == tasks
+
+
+def test_invalid_num_workers():
+    with pytest.raises(ValueError):
+        list(enumerate_reactions([], [], num_workers=0))
+    with pytest.raises(ValueError):
+        list(enumerate_reactions([], [], chunksize=0))
+
+
+def test_automorphisms_computed_once_per_assembly():
+    M = Component(kind='M', sites=[0, 1])
+    L = Component(kind='L', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    assemblies = [
+        Assembly(
+            id_='MX2',
+            components={'X0': X, 'M0': M, 'X1': X},
+            bonds=[Bond('X0', 0, 'M0', 0), Bond('M0', 1, 'X1', 0)]),
+        Assembly(id_='free_L', components={'L0': L}, bonds=[]),
+        Assembly(id_='free_X', components={'X0': X}, bonds=[]),
+        Assembly(
+            id_='MLX',
+            components={'L0': L, 'M0': M, 'X0': X},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'X0', 0)]),
+        Assembly(
+            id_='ML2',
+            components={'L0': L, 'M0': M, 'L1': L},
+            bonds=[Bond('L0', 1, 'M0', 0), Bond('M0', 1, 'L1', 0)]),
+    ]
+    mle_kinds = [
+        MLEKind('M', 'X', 'L'), MLEKind('M', 'L', 'X'),
+        MLEKind('M', 'X', 'X'), MLEKind('M', 'L', 'L')]
+    with profiling() as profile:
+        list(enumerate_reactions(assemblies, mle_kinds))
+    assert profile.call_counts['get_all_isomorphisms'] == len(assemblies)
@@ -56,32 +56,42 @@ def test_explore(MX2, free_L, M, L, X):
     }
 
 
-def test__iter_mles(MX2, free_L):
+def test__iter_unique_mles(MX2, free_L):
     explorer = InterReactionExplorer(MX2, free_L, MLEKind('M', 'X', 'L'))
-    mles = set(explorer._iter_mles())
-    assert mles == {
-        MLE(BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 0)),
-        MLE(BindingSite('M0', 1), BindingSite('X1', 0), BindingSite('L0', 0)),
-        MLE(BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 1)),
-        MLE(BindingSite('M0', 1), BindingSite('X1', 0), BindingSite('L0', 1)),
-    }
+    # The 4 MLEs, (M0-0, X0) or (M0-1, X1) with L0-0 or L0-1,
+    # are all equivalent.
+    assert list(explorer._iter_unique_mles()) == [
+        MLE(
+            BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 0),
+            duplication=4),
+    ]
 
 
-def test__get_unique_mles(MX2, free_L):
-    explorer = InterReactionExplorer(MX2, free_L, MLEKind('M', 'X', 'L'))
-    mles = {
-        MLE(BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 0)),
-        MLE(BindingSite('M0', 1), BindingSite('X1', 0), BindingSite('L0', 0)),
-        MLE(BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 1)),
-        MLE(BindingSite('M0', 1), BindingSite('X1', 0), BindingSite('L0', 1)),
+def test__iter_unique_mles_multiple_orbits(M, L, X):
+    # X0(0)-(0)M0(1)-(0)L0(1)
+    MLX = Assembly(
+        components={'M0': M, 'X0': X, 'L0': L},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'L0', 0)])
+    free_L = Assembly(components={'L0': L}, bonds=[])
+    explorer = InterReactionExplorer(MLX, MLX, MLEKind('M', 'X', 'L'))
+    assert set(explorer._iter_unique_mles()) == {
+        MLE(
+            BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 1),
+            duplication=1),
     }
-    assert set(explorer._get_unique_mles(mles)) == {
+    explorer = InterReactionExplorer(MLX, free_L, MLEKind('M', 'L', 'L'))
+    assert set(explorer._iter_unique_mles()) == {
         MLE(
-            BindingSite('M0', 0), BindingSite('X0', 0), BindingSite('L0', 0),
-            duplication=4),
+            BindingSite('M0', 1), BindingSite('L0', 0), BindingSite('L0', 0),
+            duplication=2),
     }
 
 
+def test__iter_unique_mles_no_candidates(MX2, free_L):
+    explorer = InterReactionExplorer(MX2, free_L, MLEKind('M', 'L', 'X'))
+    assert list(explorer._iter_unique_mles()) == []
+
+
 def test__perform_reaction(MX2, free_L, M, L, X):
     # NOTE: Component IDs in the assemblies are renamed to avoid ID conflicts.
     renamed_MLX = Assembly(
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+
 import pytest
 
 from nasap_net.models import Assembly, AuxEdge, BindingSite, Bond, Component, \
@@ -191,6 +195,48 @@ def test__get_unique_mles(M2L2X5):
     }
 
 
+def test_explore_order_stable_across_processes():
+    # Not affected by the hash randomization of Python
+    code = (
+        'from nasap_net.models import Assembly, Bond, Component, MLEKind\n'
+        'from nasap_net.reaction_enumeration.explorer import \\\n'
+        '    IntraReactionExplorer\n'
+        'M = Component(kind="M", sites=[0, 1, 2])\n'
+        'L = Component(kind="L", sites=[0, 1])\n'
+        'X = Component(kind="X", sites=[0])\n'
+        'assembly = Assembly(\n'
+        '    components={\n'
+        '        "M0": M, "M1": M, "M2": M,\n'
+        '        "L0": L, "L1": L, "L2": L, "L3": L,\n'
+        '        "X0": X, "X1": X, "X2": X},\n'
+        '    bonds=[\n'
+        '        Bond("M0", 0, "X0", 0), Bond("M0", 1, "L0", 0),\n'
+        '        Bond("M0", 2, "X2", 0), Bond("L0", 1, "M1", 0),\n'
+        '        Bond("M1", 1, "L1", 0), Bond("M1", 2, "L2", 0),\n'
+        '        Bond("L2", 1, "M2", 0), Bond("M2", 1, "L3", 0),\n'
+        '        Bond("M2", 2, "X1", 0)])\n'
+        'explorer = IntraReactionExplorer(assembly, MLEKind("M", "X", "L"))\n'
+        'for reaction in explorer.explore():\n'
+        '    print(reaction.metal_bs, reaction.leaving_bs,\n'
+        '          reaction.entering_bs, reaction.duplicate_count)\n'
+    )
+    outputs = [
+        subprocess.run(
+            [sys.executable, '-c', code], check=True, capture_output=True,
+            text=True, env=os.environ | {
+                'PYTHONHASHSEED': seed,
+                'PYTHONPATH': os.pathsep.join(sys.path)},
+        ).stdout
+        for seed in ['1', '2']
+    ]
+    assert outputs[0] == outputs[1]
+    assert outputs[0].splitlines() == [
+        "BindingSite('M0', 0) BindingSite('X0', 0) BindingSite('L1', 1) 2",
+        "BindingSite('M0', 0) BindingSite('X0', 0) BindingSite('L3', 1) 2",
+        "BindingSite('M2', 2) BindingSite('X1', 0) BindingSite('L1', 1) 1",
+    ]
+
+
 def test__perform_reaction(M2L2X5, trans_ring, free_X1):
     explorer = IntraReactionExplorer(M2L2X5, MLEKind('M', 'X', 'L'))
     mle_with_dup = MLE(
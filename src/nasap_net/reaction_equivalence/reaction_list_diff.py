@@ -3,7 +3,8 @@ from collections.abc import Hashable
 from dataclasses import dataclass
 from typing import Iterable
 
-from nasap_net.assembly_equivalence.signature import get_assembly_signature
+from nasap_net.assembly_equivalence.signature import \
+    get_refined_assembly_signature
 from nasap_net.models import Reaction
 from .core import reactions_equivalent
 
@@ -93,9 +94,9 @@ def get_reaction_signature(reaction: Reaction) -> Hashable:
         The signature of the reaction.
     """
     return (
-        get_assembly_signature(reaction.init_assem),
+        get_refined_assembly_signature(reaction.init_assem),
         (
-            get_assembly_signature(reaction.entering_assem_strict)
+            get_refined_assembly_signature(reaction.entering_assem_strict)
             if reaction.is_inter() else None
         )
     )
@@ -1,9 +1,11 @@
 from nasap_net.models import Assembly, MLE
+from nasap_net.profiling import profiled
 from .separation import separate_if_possible
 from nasap_net.helpers.assembly_union import ComponentIDCollisionError, \
     union_assemblies
 
 
+@profiled('perform_inter_reaction')
 def perform_inter_reaction(
         init_assem: Assembly,
         entering_assem: Assembly,
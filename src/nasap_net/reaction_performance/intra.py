@@ -1,7 +1,9 @@
 from nasap_net.models import Assembly, MLE
+from nasap_net.profiling import profiled
 from .separation import separate_if_possible
 
 
+@profiled('perform_intra_reaction')
 def perform_intra_reaction(
         assembly: Assembly,
         mle: MLE
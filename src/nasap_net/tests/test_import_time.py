@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ['igraph', 'pandas', 'yaml', 'numpy']
+
+# Generous; `import nasap_net` takes a few tens of milliseconds when the
+# heavy dependencies are not imported, and more than 0.3 s when they are.
+MAX_IMPORT_TIME = 0.5
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+    )
+
+
+def _cumulative_import_time(stderr: str, module: str) -> float:
+    # Lines are formatted as "import time: self [us] | cumulative | name".
+    for line in stderr.splitlines():
+        _, _, fields = line.partition('import time:')
+        parts = [part.strip() for part in fields.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1e6
+    raise AssertionError(f'{module} not found in the import time report')
+
+
+@pytest.mark.parametrize('statement', [
+    'import nasap_net',
+    'from nasap_net.models import Assembly, Bond, Component',
+])
+def test_heavy_modules_not_imported(statement):
+    result = _run(
+        f'{statement}; import sys; '
+        f'print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))')
+    assert result.stdout.strip() == ''
+
+
+def test_import_time():
+    result = _run('import nasap_net')
+    assert _cumulative_import_time(result.stderr, 'nasap_net') \
+        < MAX_IMPORT_TIME
+
+
+def test_lazy_attributes():
+    import nasap_net
+    from nasap_net.reaction_enumeration import enumerate_reactions
+    assert nasap_net.enumerate_reactions is enumerate_reactions
+    assert 'load_reactions' in dir(nasap_net)
+    with pytest.raises(AttributeError):
+        nasap_net.no_such_attribute
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from nasap_net.assembly_equivalence import EquivalentAssemblyFinder
+from nasap_net.isomorphism import is_isomorphic
+from nasap_net.models import Assembly, Bond, Component
+from nasap_net.profiling import count, profiled, profiling, record
+
+
+@pytest.fixture
+def MX2():
+    M = Component(kind='M', sites=[0, 1])
+    X = Component(kind='X', sites=[0])
+    return Assembly(
+        components={'M0': M, 'X0': X, 'X1': X},
+        bonds=[Bond('M0', 0, 'X0', 0), Bond('M0', 1, 'X1', 0)])
+
+
+def test_profiling(MX2):
+    with profiling() as profile:
+        finder = EquivalentAssemblyFinder([MX2])
+        finder.find(MX2.copy_with(id_='MX2'))
+        assert not is_isomorphic(MX2, Assembly(components={}, bonds=[]))
+
+    report = profile.report()
+    assert report['calls']['EquivalentAssemblyFinder.find']['count'] == 1
+    assert report['calls']['is_isomorphic']['count'] == 1
+    assert report['calls']['convert_assembly_to_graph']['count'] == 4
+    assert report['counters'] == {
+        'vf2.isomorphic': 1, 'vf2.rejected_by_colors': 1}
+    assert report['histograms'] == {
+        'finder.signature_bucket_size': {'1': 1}}
+    assert json.loads(profile.to_json()) == report
+
+
+def test_disabled(MX2):
+    with profiling() as profile:
+        pass
+    is_isomorphic(MX2, MX2)
+    assert profile.report() == {'calls': {}, 'counters': {}, 'histograms': {}}
+
+
+def test_nested():
+    @profiled('f')
+    def f(x):
+        count('event', x)
+        record('value', x)
+        return x
+
+    with profiling() as outer:
+        f(1)
+        with profiling() as inner:
+            assert f(10) == 10
+            f(2)
+        f(1)
+
+    assert outer.call_counts == {'f': 2}
+    assert outer.counters == {'event': 2}
+    assert inner.call_counts == {'f': 2}
+    assert inner.report()['histograms'] == {'value': {'2': 1, '10': 1}}
+    assert inner.call_times['f'] >= 0
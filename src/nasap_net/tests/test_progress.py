@@ -0,0 +1,50 @@
+import pytest
+
+from nasap_net.progress import Progress, ProgressReporter
+
+
+def test_progress():
+    progress = Progress(
+        task='task', done=25, total=100, elapsed=5.0, counts={'a': 1})
+    assert progress.throughput == 5.0
+    assert progress.eta == 15.0
+    assert Progress(task='task', done=0, total=100, elapsed=5.0).eta is None
+    assert Progress(task='task', done=1, total=None, elapsed=5.0).eta is None
+    assert Progress(task='task', done=0, total=None, elapsed=0.0).eta is None
+    assert Progress(
+        task='task', done=1, total=None, elapsed=1.0, finished=True).eta == 0
+
+
+def test_reporter():
+    progresses = []
+    reporter = ProgressReporter(
+        progresses.append, 'task', total=3, interval=3600)
+    reporter.counts['found'] = 0
+    for _ in range(3):
+        reporter.advance()
+        reporter.counts['found'] += 2
+    assert progresses == []  # throttled
+    reporter.finish()
+    assert len(progresses) == 1
+    assert progresses[0].done == 3
+    assert progresses[0].counts == {'found': 6}
+    assert progresses[0].finished
+
+    # Snapshots are not affected by later updates.
+    reporter.counts['found'] = 100
+    assert progresses[0].counts == {'found': 6}
+
+
+def test_reporter_every_unit():
+    progresses = []
+    reporter = ProgressReporter(progresses.append, 'task', interval=0)
+    reporter.advance(2)
+    reporter.advance()
+    reporter.finish()
+    assert [(p.done, p.finished) for p in progresses] == [
+        (2, False), (3, False), (3, True)]
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        ProgressReporter(print, 'task', interval=-1)